@@ -0,0 +1,104 @@
+"""Time app startup with fake audio and serial backends that take a while to come up.
+
+The fake audio backend's warm_up and the fake mixer's connection each sleep
+for a set time, standing in for COM activation and the serial port scan.
+Reports when the window was built and when both backends were ready, next
+to what running the three steps one after another would cost.
+
+Needs customtkinter, pywin32 and a display, as gui.app imports them.
+
+    python benchmarks/bench_boot.py [--audio-ms N] [--serial-ms N] [--runs N]
+"""
+import argparse
+import threading
+import time
+
+from fakes import FakeAudio, use_temp_settings
+
+import customtkinter as ctk
+
+import gui.app as app_module
+from utils.config_manager import ConfigManager
+
+
+class SlowAudio(FakeAudio):
+    delay = 0.0
+
+    def warm_up(self):
+        time.sleep(self.delay)
+        self.ready = time.perf_counter()
+
+    def cleanup(self):
+        pass
+
+
+class SlowSerial:
+    delay = 0.0
+
+    def __init__(self, volume_callback, button_callback, connection_status_callback=None, idle_callback=None):
+        self.connecting = True
+        self.high_resolution = False
+        self.ready = None
+        self.callback = connection_status_callback
+        threading.Thread(target=self.connect, daemon=True).start()
+
+    def connect(self):
+        time.sleep(self.delay)
+        self.connecting = False
+        self.ready = time.perf_counter()
+        if self.callback:
+            self.callback(True)
+
+    def get_connection_status(self):
+        return not self.connecting
+
+    def cleanup(self):
+        pass
+
+
+def boot():
+    """Build the app once and return (window built, backends ready) in seconds."""
+    root = ctk.CTk()
+    root.withdraw()
+    started = time.perf_counter()
+    app = app_module.HushmixApp(root)
+    built = time.perf_counter() - started
+
+    while app.serial_controller.ready is None or not hasattr(app.audio_controller, "ready"):
+        root.update()
+        time.sleep(0.001)
+    ready = max(app.serial_controller.ready, app.audio_controller.ready) - started
+    root.destroy()
+    return built, ready
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--audio-ms", type=float, default=300)
+    parser.add_argument("--serial-ms", type=float, default=500)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    use_temp_settings({"current_profile": "Profile 1", "profiles": {"Profile 1": {
+        "schema_version": 2,
+        "channels": [{"application": f"app{i}.exe"} for i in range(7)],
+    }}})
+    SlowAudio.delay = args.audio_ms / 1000
+    SlowSerial.delay = args.serial_ms / 1000
+    app_module.AudioController = SlowAudio
+    app_module.SerialController = SlowSerial
+    app_module.HushmixApp.UPDATER_START_DELAY_MS = 10 ** 9
+
+    results = sorted(boot() for _ in range(args.runs))
+    ConfigManager.stop_settings_writer()
+
+    built, ready = results[len(results) // 2]
+    sequential = built + (args.audio_ms + args.serial_ms) / 1000
+    print(f"fake audio {args.audio_ms:.0f} ms, fake serial {args.serial_ms:.0f} ms, median of {args.runs} boots")
+    print(f"  window built: {built * 1000:7.1f} ms")
+    print(f"backends ready: {ready * 1000:7.1f} ms")
+    print(f"    sequential: {sequential * 1000:7.1f} ms (window + audio + serial)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Time button dispatch for 32 buttons on the serial thread.
+
+Each frame carries 32 button states, with every button tapped now and then
+from a seeded random source. Actions are counted instead of run, so the
+numbers are what the serial thread pays to decode a frame and hand its
+presses to the executor.
+
+    python benchmarks/bench_button_dispatch.py [--frames N]
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from fakes import make_app, use_temp_settings
+
+from controllers.button_actions import ButtonActions
+from controllers.profile_manager import ProfileManager
+
+BUTTONS = 32
+
+
+def make_buttons():
+    """A third of the buttons send media keys, a third shortcuts, the rest are unbound."""
+    buttons = []
+    for i in range(BUTTONS):
+        if i % 3 == 0:
+            buttons.append({"mute_enabled": False, "media_enabled": True})
+        elif i % 3 == 1:
+            buttons.append({"mute_enabled": False, "shortcut_enabled": True, "shortcut": "Ctrl+Shift+m"})
+        else:
+            buttons.append({"mute_enabled": False})
+    return buttons
+
+
+def make_frames(count, seed=31):
+    rng = random.Random(seed)
+    states = [0] * BUTTONS
+    frames = []
+    for _ in range(count):
+        states = [0 if state else int(rng.random() < 0.05) for state in states]
+        frames.append(list(states))
+    return frames
+
+
+def time_frames(actions, frames):
+    started = time.perf_counter()
+    for frame in frames:
+        actions.handle_button_update(frame)
+    return (time.perf_counter() - started) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=50000)
+    args = parser.parse_args()
+
+    use_temp_settings({"current_profile": "Profile 1", "profiles": {
+        "Profile 1": {"schema_version": 2, "buttons": make_buttons()},
+    }})
+    app = make_app()
+    app.button_actions = actions = ButtonActions(app)
+    app.profile_manager = ProfileManager(app)
+    app.profile_manager.activate_profile("Profile 1")
+
+    submitted = []
+    actions.executor = SimpleNamespace(submit=lambda lane, func, *args: submitted.append(lane) or True)
+
+    idle = time_frames(actions, [[0] * BUTTONS] * args.frames)
+    frames = make_frames(args.frames)
+    busy = time_frames(actions, frames)
+
+    print(f"{args.frames} frames of {BUTTONS} buttons, {len(submitted)} actions queued")
+    print(f"  idle frame: {idle * 1e6:6.2f} us")
+    print(f"  busy frame: {busy * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
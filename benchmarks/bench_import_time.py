@@ -0,0 +1,61 @@
+"""Report what importing the app costs, using Python's -X importtime.
+
+Imports the module in a fresh interpreter from src, then prints the total
+import time, the slowest modules by cumulative time (leaving out what the
+interpreter loads at startup) and whether any of the
+packages that should only load on first use were imported.
+
+    python benchmarks/bench_import_time.py [--module gui.app] [--top N] [--runs N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+DEFERRED = ("requests", "pefile", "pyautogui")
+
+
+def import_times(statement):
+    """Return {module: (self_us, cumulative_us)} for one cold run of the statement."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=SRC, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(result.stderr.strip().splitlines()[-1])
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="gui.app")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    startup = import_times("pass")
+    runs = [import_times(f"import {args.module}") for _ in range(args.runs)]
+    totals = sorted(run[args.module][1] for run in runs)
+    times = runs[len(runs) // 2]
+    print(f"import {args.module}: median {totals[len(totals) // 2] / 1000:.1f} ms over {args.runs} runs")
+
+    print(f"\n{'cumulative ms':>14} {'self ms':>8}  module")
+    imported = {name: value for name, value in times.items() if name not in startup}
+    slowest = sorted(imported.items(), key=lambda item: item[1][1], reverse=True)[:args.top]
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:8.1f}  {name}")
+
+    loaded = [name for name in DEFERRED if name in imported]
+    print(f"\ndeferred packages imported: {', '.join(loaded) if loaded else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Time hardware profile switches on the serial thread's path.
+
+Builds five seven-channel profiles with buttons, curves and a shortcut,
+then cycles through them with ProfileManager.switch_from_button and reports
+the distribution of ``last_switch_duration``.
+
+    python benchmarks/bench_profile_switch.py [--switches N]
+"""
+import argparse
+
+from fakes import make_app, use_temp_settings
+
+from controllers.profile_manager import ProfileManager
+from controllers.volume_manager import VolumeManager
+from utils.config_manager import ConfigManager
+
+
+def make_settings():
+    profile = {
+        "schema_version": 2,
+        "channels": [{"application": f"app{i}.exe", "curve": "log" if i % 2 else "linear"} for i in range(7)],
+        "buttons": [
+            {"shortcut_enabled": True, "shortcut": "Ctrl+Shift+m", "profile_enabled": True}
+            for _ in range(5)
+        ],
+    }
+    return {"current_profile": "Profile 1", "profiles": {name: profile for name in ConfigManager.DEFAULT_PROFILES}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--switches", type=int, default=10000)
+    args = parser.parse_args()
+
+    use_temp_settings(make_settings())
+    app = make_app()
+    app.button_vars = []
+    app.volume_manager = VolumeManager(app)
+    manager = ProfileManager(app)
+    manager.activate_profile("Profile 1")
+
+    durations = []
+    for _ in range(args.switches):
+        manager.switch_from_button(ProfileManager.NEXT_PROFILE)
+        durations.append(manager.last_switch_duration)
+    ConfigManager.stop_settings_writer()
+
+    durations.sort()
+    count = len(durations)
+    print(f"{count} switches across {len(ConfigManager.DEFAULT_PROFILES)} profiles")
+    for label, fraction in (("median", 0.5), ("p99", 0.99), ("max", 1.0)):
+        print(f"{label:>6}: {durations[min(int(count * fraction), count - 1)] * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Time the slider-to-audio path on the integer and high-resolution settings.
+
+Feeds the same seeded, noisy slider frames through VolumeManager with a fake
+audio backend and reports the cost per frame and how many audio writes each
+path makes.
+
+    python benchmarks/bench_volume_path.py [--frames N]
+"""
+import argparse
+import random
+import time
+
+from fakes import make_app, use_temp_settings
+
+from controllers.profile_manager import ProfileManager
+from controllers.volume_manager import VolumeManager
+
+CHANNELS = 7
+
+
+def make_frames(count, seed=38):
+    """A slow random walk per channel with about 0.3% of ADC noise on top."""
+    rng = random.Random(seed)
+    positions = [rng.uniform(20, 80) for _ in range(CHANNELS)]
+    frames = []
+    for _ in range(count):
+        for i in range(CHANNELS):
+            positions[i] = min(max(positions[i] + rng.gauss(0, 0.05), 0), 100)
+        frames.append([min(max(p + rng.gauss(0, 0.3), 0), 100) for p in positions])
+    return frames
+
+
+def run(frames, high_resolution):
+    use_temp_settings({"current_profile": "Profile 1", "profiles": {"Profile 1": {
+        "schema_version": 2,
+        "channels": [{"application": f"app{i}.exe", "curve": "log"} for i in range(CHANNELS)],
+    }}})
+    app = make_app(high_resolution_volume=high_resolution, fade_duration_ms=0)
+    app.volume_manager = VolumeManager(app)
+    app.profile_manager = ProfileManager(app)
+    app.profile_manager.activate_profile("Profile 1")
+    app.volume_manager.configure()
+    if not high_resolution:
+        frames = [[int(round(value)) for value in frame] for frame in frames]
+
+    update = app.volume_manager.handle_volume_update
+    update(frames[0])
+    app.audio_controller.writes = 0
+    started = time.perf_counter()
+    for frame in frames[1:]:
+        update(frame)
+    elapsed = time.perf_counter() - started
+    return elapsed / (len(frames) - 1), app.audio_controller.writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000)
+    args = parser.parse_args()
+
+    frames = make_frames(args.frames)
+    print(f"{args.frames} frames x {CHANNELS} channels, log curve")
+    for label, high_resolution in (("integer", False), ("high resolution", True)):
+        per_frame, writes = run(frames, high_resolution)
+        print(
+            f"{label:>16}: {per_frame * 1e6:6.2f} us/frame, "
+            f"{per_frame * 1e6 / CHANNELS:5.2f} us/sample, {writes} audio writes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Fake audio, settings and GUI objects for timing the controllers without Windows or a display."""
+import json
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+from utils.config_manager import ConfigManager  # noqa: E402
+
+
+class FakeAudio:
+    """Counts volume writes instead of talking to the Windows mixer."""
+
+    def __init__(self):
+        self.writes = 0
+
+    def set_application_volume(self, app_name, level):
+        self.writes += 1
+
+    def set_application_volumes(self, levels):
+        self.writes += len(levels)
+
+    def get_application_volume(self, app_name):
+        return None
+
+    def get_microphone_volume(self):
+        return 0
+
+
+class FakeSettings:
+    def __init__(self, **settings):
+        self.settings_vars = dict(settings)
+
+    def get_setting(self, key, default=None):
+        return self.settings_vars.get(key, default)
+
+
+def use_temp_settings(settings=None):
+    """Point ConfigManager at a settings file in a fresh temporary directory."""
+    path = os.path.join(tempfile.mkdtemp(prefix="hushmix-bench-"), "settings.json")
+    if settings is not None:
+        with open(path, "w") as f:
+            json.dump(settings, f)
+    ConfigManager.CONFIG_FILE = path
+    ConfigManager.BACKUP_FILE = path + ".bak"
+    ConfigManager._store = None
+    return path
+
+
+def make_app(**settings):
+    """An app object with the attributes the controllers read, backed by fakes."""
+    return SimpleNamespace(
+        audio_controller=FakeAudio(),
+        settings_manager=FakeSettings(**settings),
+        gui_components=SimpleNamespace(volume_labels=[]),
+        root=SimpleNamespace(after=lambda delay, func, *args: None),
+        current_apps=[],
+        current_mute_state=[],
+        muted_state=[],
+        previous_volumes=[],
+    )
@@ -1,3 +1,9 @@
-from .audio_controller import AudioController
+__all__ = ['AudioController']
 
-__all__ = ['AudioController'] 
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the audio controller on first use, as it pulls in pycaw and pywin32."""
+    if name == 'AudioController':
+        from .audio_controller import AudioController
+        return AudioController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,77 @@
+import queue
+import threading
+import time
+from utils.diagnostics import Diagnostics
+
+
+class ActionExecutor:
+    """Runs button actions off the serial thread.
+
+    Each action type gets its own lane: a bounded queue drained by one worker
+    thread. Actions of the same type run in the order they were pressed,
+    while a slow shortcut never holds up a media key or an app launch. When a
+    lane is full, new actions for it are dropped instead of blocking the caller.
+    """
+
+    def __init__(self, max_pending=8):
+        self.max_pending = max_pending
+        self._lanes = {}
+        self._lock = threading.Lock()
+        self._running = True
+
+    def submit(self, lane, func, *args):
+        """Queue ``func(*args)`` on the given lane. Returns False if it was dropped."""
+        if not self._running:
+            return False
+
+        try:
+            self._get_lane(lane).put_nowait((func, args, time.perf_counter()))
+            return True
+        except queue.Full:
+            Diagnostics.increment(f"action_dropped.{lane}")
+            print(f"Dropped {lane} action, {self.max_pending} already pending")
+            return False
+
+    def _get_lane(self, lane):
+        with self._lock:
+            pending = self._lanes.get(lane)
+            if pending is None:
+                pending = queue.Queue(maxsize=self.max_pending)
+                self._lanes[lane] = pending
+                threading.Thread(
+                    target=self._worker_loop, args=(lane, pending), daemon=True
+                ).start()
+            return pending
+
+    def get_pending(self):
+        """Get the number of actions waiting on each lane."""
+        with self._lock:
+            return {lane: pending.qsize() for lane, pending in self._lanes.items()}
+
+    def _worker_loop(self, lane, pending):
+        while True:
+            item = pending.get()
+            if item is None:
+                return
+
+            func, args, queued_at = item
+            start = time.perf_counter()
+            Diagnostics.record_timing(f"action_queue.{lane}", start - queued_at)
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error running {lane} action: {e}")
+            end = time.perf_counter()
+            Diagnostics.record_timing(f"action_run.{lane}", end - start)
+            Diagnostics.record_timing(f"action_total.{lane}", end - queued_at)
+
+    def stop(self):
+        """Stop accepting actions and let each worker exit once its queue drains."""
+        self._running = False
+        with self._lock:
+            lanes = list(self._lanes.values())
+        for pending in lanes:
+            try:
+                pending.put_nowait(None)
+            except queue.Full:
+                pass
@@ -0,0 +1,146 @@
+import os
+import subprocess
+import threading
+import time
+
+
+class LaunchTarget:
+    """A launch path resolved once: whether it exists and how to start it."""
+
+    __slots__ = ("path", "exists", "is_executable", "process_name", "signature")
+
+    def __init__(self, path):
+        self.path = path
+        self.signature = AppLauncher.path_signature(path)
+        self.exists = self.signature is not None and os.path.isfile(path)
+        self.is_executable = path.lower().endswith(".exe")
+        self.process_name = os.path.basename(path).lower() if self.is_executable else None
+
+
+class AppLauncher:
+    """Starts applications for app-launch buttons.
+
+    Targets are checked when they are configured rather than on every press,
+    and a background poller drops cached targets whose file changed or
+    disappeared. Executables are spawned directly without a shell; other files
+    (shortcuts, documents) are opened with their associated program.
+
+    psutil and pywin32 are only imported the first time a running window has
+    to be found.
+    """
+
+    WATCH_INTERVAL = 2.0
+    PROCESS_TABLE_TTL = 2.0
+    SW_RESTORE = 9
+
+    def __init__(self):
+        self._targets = {}
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._process_table = {}
+        self._process_table_time = 0.0
+
+    @staticmethod
+    def path_signature(path):
+        """Return the (mtime, size) signature of a file, or None if it is missing."""
+        try:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def prepare(self, paths):
+        """Resolve launch targets ahead of the first press."""
+        for path in paths:
+            if path:
+                self.get_target(path)
+
+    def get_target(self, path):
+        """Get the cached target for a path, resolving it if needed."""
+        with self._lock:
+            target = self._targets.get(path)
+        if target is None:
+            target = LaunchTarget(path)
+            with self._lock:
+                self._targets[path] = target
+            self._ensure_watcher()
+        return target
+
+    def _ensure_watcher(self):
+        if self._watcher is None or not self._watcher.is_alive():
+            self._watcher = threading.Thread(target=self._watch_loop, daemon=True)
+            self._watcher.start()
+
+    def _watch_loop(self):
+        """Invalidate cached targets whose file changed on disk."""
+        while True:
+            time.sleep(self.WATCH_INTERVAL)
+            with self._lock:
+                targets = list(self._targets.items())
+            for path, target in targets:
+                if self.path_signature(path) != target.signature:
+                    with self._lock:
+                        if self._targets.get(path) is target:
+                            del self._targets[path]
+
+    def launch(self, path, focus_existing=False):
+        """Launch the target, or focus its window if requested and already running."""
+        target = self.get_target(path)
+        if not target.exists:
+            print(f"Application path not found: {path}")
+            return False
+
+        if focus_existing and target.process_name and self.focus_running(target.process_name):
+            print(f"Focused running application: {path}")
+            return True
+
+        if target.is_executable:
+            subprocess.Popen([path], cwd=os.path.dirname(path) or None)
+        else:
+            os.startfile(path)
+        print(f"Launched application: {path}")
+        return True
+
+    def get_process_table(self):
+        """Get a {process name: [pids]} snapshot, refreshed at most every PROCESS_TABLE_TTL seconds."""
+        now = time.monotonic()
+        if now - self._process_table_time > self.PROCESS_TABLE_TTL:
+            import psutil
+
+            table = {}
+            for process in psutil.process_iter(["name"]):
+                name = process.info.get("name")
+                if name:
+                    table.setdefault(name.lower(), []).append(process.pid)
+            self._process_table = table
+            self._process_table_time = now
+        return self._process_table
+
+    def focus_running(self, process_name):
+        """Bring a visible window of a running process to the front. Returns True on success."""
+        pids = set(self.get_process_table().get(process_name, ()))
+        if not pids:
+            return False
+
+        import win32.win32gui as win32gui
+        import win32.win32process as win32process
+
+        windows = []
+
+        def collect(hwnd, _):
+            if win32gui.IsWindowVisible(hwnd) and win32gui.GetWindowText(hwnd):
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                if pid in pids:
+                    windows.append(hwnd)
+            return True
+
+        try:
+            win32gui.EnumWindows(collect, None)
+            if not windows:
+                return False
+            win32gui.ShowWindow(windows[0], self.SW_RESTORE)
+            win32gui.SetForegroundWindow(windows[0])
+            return True
+        except Exception as e:
+            print(f"Error focusing application: {e}")
+            return False
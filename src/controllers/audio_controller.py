@@ -22,10 +22,21 @@ class AudioController:
     def __init__(self):
         if not hasattr(self, "_initialized"):
             self._initialized = True
-            self._init_com()
             self._sessions_cache = None
             self._last_session_refresh = 0
 
+    def warm_up(self):
+        """Initialize COM and enumerate audio sessions ahead of the first volume change.
+
+        Meant to run on a worker thread during startup; every method also
+        initializes COM on its own thread when first called.
+        """
+        try:
+            self._init_com()
+            self._get_sessions()
+        except Exception as e:
+            print(f"Error initializing audio: {e}")
+
     def _init_com(self):
         """Initialize COM for the current thread if not already initialized."""
         if not hasattr(self._thread_local, "initialized"):
@@ -53,9 +64,16 @@ class AudioController:
             return self._sessions_cache
 
     def set_application_volume(self, app_names, level):
-        self._init_com()
+        self.set_application_volumes({app_names: level})
+
+    def set_application_volumes(self, levels):
+        """Set several targets in one pass.
 
-        app_names_list = [name.strip() for name in app_names.split(",")]
+        ``levels`` maps an app names string (as typed into a slider's entry,
+        e.g. ``"chrome, spotify"``) to a 0-100 level. The default device and
+        session list are looked up once for the whole batch.
+        """
+        self._init_com()
 
         current_device = AudioUtilities.GetSpeakers()
         if current_device != self.devices:
@@ -66,72 +84,102 @@ class AudioController:
             self.volume = self.interface.QueryInterface(IAudioEndpointVolume)
 
         try:
-            for app_name in app_names_list:
-                if app_name.lower() == "current":
-                    hwnd = win32gui.GetForegroundWindow()
-                    _, process_id = win32process.GetWindowThreadProcessId(hwnd)
-
-                    if not process_id:
-                        continue
-
-                    process = psutil.Process(process_id)
-                    process_name = process.name()
-
-                    for session in self._get_sessions():
-                        if (
-                            session.Process
-                            and session.Process.name().lower() == process_name.lower()
-                        ):
-                            with self._lock:
-                                volume = session._ctl.QueryInterface(ISimpleAudioVolume)
-                                volume.SetMasterVolume(level / 100, None)
-                                volume = None
-                            break
-                elif app_name.lower() == "master":
-                    with self._lock:
-                        self.volume.SetMasterVolumeLevelScalar(level / 100, None)
-
-                elif app_name.lower() == "mic":
-                    with self._lock:
-                        mic_device = AudioUtilities.GetMicrophone()
-                        mic_volume_interface = mic_device.Activate(
-                            IAudioEndpointVolume._iid_, CLSCTX_ALL, None
-                        )
-                        mic_volume = mic_volume_interface.QueryInterface(
-                            IAudioEndpointVolume
-                        )
+            for app_names, level in levels.items():
+                for app_name in [name.strip() for name in app_names.split(",")]:
+                    if app_name.lower() == "current":
+                        hwnd = win32gui.GetForegroundWindow()
+                        _, process_id = win32process.GetWindowThreadProcessId(hwnd)
+
+                        if not process_id:
+                            continue
+
+                        process = psutil.Process(process_id)
+                        process_name = process.name()
+
+                        for session in self._get_sessions():
+                            if (
+                                session.Process
+                                and session.Process.name().lower() == process_name.lower()
+                            ):
+                                with self._lock:
+                                    volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                                    volume.SetMasterVolume(level / 100, None)
+                                    volume = None
+                                break
+                    elif app_name.lower() == "master":
+                        with self._lock:
+                            self.volume.SetMasterVolumeLevelScalar(level / 100, None)
+
+                    elif app_name.lower() == "mic":
+                        with self._lock:
+                            mic_device = AudioUtilities.GetMicrophone()
+                            mic_volume_interface = mic_device.Activate(
+                                IAudioEndpointVolume._iid_, CLSCTX_ALL, None
+                            )
+                            mic_volume = mic_volume_interface.QueryInterface(
+                                IAudioEndpointVolume
+                            )
                         
-                        if level == 0:
-                            mic_volume.SetMute(1, None)
-                        else:
-                            mic_volume.SetMute(0, None)
-                            mic_volume.SetMasterVolumeLevelScalar(level / 100, None)
+                            if level == 0:
+                                mic_volume.SetMute(1, None)
+                            else:
+                                mic_volume.SetMute(0, None)
+                                mic_volume.SetMasterVolumeLevelScalar(level / 100, None)
                         
-                        mic_volume = None
-
-                elif app_name.lower() == "system":
-                    for session in self._get_sessions():
-                        if session.ProcessId == 0:
-                            with self._lock:
-                                volume = session._ctl.QueryInterface(ISimpleAudioVolume)
-                                volume.SetMasterVolume(level / 100, None)
-                                volume = None
-                            break
-                else:
-                    for session in self._get_sessions():
-                        if (
-                            session.Process
-                            and app_name.lower() in session.Process.name().lower()
-                        ):
-                            with self._lock:
-                                volume = session._ctl.QueryInterface(ISimpleAudioVolume)
-                                volume.SetMasterVolume(level / 100, None)
-                                volume = None
-                            break
+                            mic_volume = None
+
+                    elif app_name.lower() == "system":
+                        for session in self._get_sessions():
+                            if session.ProcessId == 0:
+                                with self._lock:
+                                    volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                                    volume.SetMasterVolume(level / 100, None)
+                                    volume = None
+                                break
+                    else:
+                        for session in self._get_sessions():
+                            if (
+                                session.Process
+                                and app_name.lower() in session.Process.name().lower()
+                            ):
+                                with self._lock:
+                                    volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                                    volume.SetMasterVolume(level / 100, None)
+                                    volume = None
+                                break
 
         except Exception as e:
             print(f"Error setting volume: {e}")
 
+    def get_application_volume(self, app_names):
+        """Get the current 0-100 level of the first target in an app names string, or None."""
+        app_name = app_names.split(",")[0].strip().lower()
+        if not app_name or app_name == "current":
+            return None
+        if app_name == "mic":
+            return self.get_microphone_volume()
+
+        try:
+            self._init_com()
+            if app_name == "master":
+                with self._lock:
+                    return int(round(self.volume.GetMasterVolumeLevelScalar() * 100))
+
+            for session in self._get_sessions():
+                if app_name == "system":
+                    matches = session.ProcessId == 0
+                else:
+                    matches = session.Process and app_name in session.Process.name().lower()
+                if matches:
+                    with self._lock:
+                        volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                        level = volume.GetMasterVolume()
+                        volume = None
+                    return int(round(level * 100))
+        except Exception as e:
+            print(f"Error getting volume: {e}")
+        return None
+
     def get_microphone_volume(self):
         """Get the current volume level of the microphone."""
         try:
@@ -1,140 +1,55 @@
-import subprocess
-import os
-import pyautogui
-import time
-import customtkinter as ctk
+from controllers.action_executor import ActionExecutor
+from controllers.app_launcher import AppLauncher
+from controllers.key_sequence import PyAutoGuiInjector
+from controllers.gesture_engine import GestureEngine, DOUBLE_CLICK
 
 
 class ButtonActions:
+    BUTTON_VOLUME_OFFSET = 1
+    # Actions that only touch in-memory state and run on the serial thread.
+    INLINE_ACTIONS = frozenset(("mute", "profile", "group"))
+
     def __init__(self, app_instance):
         self.app = app_instance
+        self.executor = ActionExecutor()
+        self.launcher = AppLauncher()
+        self.key_injector = PyAutoGuiInjector()
+        self.gesture_engine = None
+        self.action_handlers = {
+            "mute": self.toggle_button_mute,
+            "app_launch": self.launch_application,
+            "shortcut": self.send_keyboard_shortcut,
+            "media": self.send_media_control,
+            "profile": self.switch_profile,
+            "group": self.run_group_action,
+        }
     
-    def launch_application(self, index):
+    def launch_application(self, index, compiled):
         """Launch the application specified for the given button index."""
         try:
-            app_path = self.app.app_launch_paths[index].get()
-            if app_path and os.path.exists(app_path):
-                subprocess.Popen([app_path], shell=True)
-                print(f"Launched application: {app_path}")
-            else:
-                print(f"Application path not found: {app_path}")
+            button = compiled.profile.button(index)
+            if button.app_launch_path:
+                self.launcher.launch(button.app_launch_path, button.app_focus_existing)
         except Exception as e:
             print(f"Error launching application: {e}")
 
-    def send_keyboard_shortcut(self, index):
+    def send_keyboard_shortcut(self, index, compiled):
         """Send keyboard shortcut for the given button index."""
         try:
-            if index >= len(self.app.keyboard_shortcuts):
-                return
-            
-            shortcut = self.app.keyboard_shortcuts[index].get()
-            if not shortcut:
+            sequence = compiled.shortcuts.get(index)
+            if sequence is None:
                 return
-            
-            time.sleep(0.05)
-
-            if shortcut.count('+') >= 2:
-                key_combinations = shortcut.split('+')
-                
-                modifier_keys = []
-                regular_keys = []
-                
-                for key in key_combinations:
-                    if key in ['Ctrl', 'Control', 'Shift', 'Alt', 'Win', 'Windows']:
-                        modifier_keys.append(key)
-                    else:
-                        regular_keys.append(key)
-                
-                if modifier_keys and regular_keys:
-                    for mod_key in modifier_keys:
-                        pyautogui.keyDown(mod_key.lower())
-                        time.sleep(0.01)
-                    
-                    for reg_key in regular_keys:
-                        pyautogui.press(reg_key.lower())
-                        time.sleep(0.01)
-                    
-                    for mod_key in reversed(modifier_keys):
-                        pyautogui.keyUp(mod_key.lower())
-                        time.sleep(0.01)
-                else:
-                    pyautogui.hotkey(*[key.lower() for key in key_combinations])
-            else:
-                keys = shortcut.split('+')
-                key_mapping = {
-                    'Ctrl': 'ctrl',
-                    'Control': 'ctrl',
-                    'Shift': 'shift',
-                    'Alt': 'alt',
-                    'Win': 'win',
-                    'Windows': 'win',
-                    'Enter': 'enter',
-                    'Return': 'enter',
-                    'Tab': 'tab',
-                    'Space': 'space',
-                    'Escape': 'esc',
-                    'Esc': 'esc',
-                    'Backspace': 'backspace',
-                    'Delete': 'delete',
-                    'Del': 'delete',
-                    'Insert': 'insert',
-                    'Home': 'home',
-                    'End': 'end',
-                    'PageUp': 'pageup',
-                    'PageDown': 'pagedown',
-                    'Up': 'up',
-                    'Down': 'down',
-                    'Left': 'left',
-                    'Right': 'right',
-                    'F1': 'f1', 'F2': 'f2', 'F3': 'f3', 'F4': 'f4',
-                    'F5': 'f5', 'F6': 'f6', 'F7': 'f7', 'F8': 'f8',
-                    'F9': 'f9', 'F10': 'f10', 'F11': 'f11', 'F12': 'f12',
-                    'a': 'a', 'b': 'b', 'c': 'c', 'd': 'd', 'e': 'e', 'f': 'f', 'g': 'g', 'h': 'h', 'i': 'i', 'j': 'j',
-                    'k': 'k', 'l': 'l', 'm': 'm', 'n': 'n', 'o': 'o', 'p': 'p', 'q': 'q', 'r': 'r', 's': 's', 't': 't',
-                    'u': 'u', 'v': 'v', 'w': 'w', 'x': 'x', 'y': 'y', 'z': 'z',
-                    '0': '0', '1': '1', '2': '2', '3': '3', '4': '4', '5': '5', '6': '6', '7': '7', '8': '8', '9': '9',
-                    '.': '.', ',': ',', ';': ';', ':': ':', '!': '!', '?': '?', '-': '-', '_': '_', '=': '=', '+': '+',
-                    '[': '[', ']': ']', '{': '{', '}': '}', '\\': '\\', '|': '|', '/': '/', '<': '<', '>': '>'
-                }
-                
-                pyautogui_keys = []
-                for key in keys:
-                    mapped_key = key_mapping.get(key, key.lower())
-                    pyautogui_keys.append(mapped_key)
-                
-                if len(pyautogui_keys) > 1:
-                    modifier_keys = [k for k in pyautogui_keys if k in ['ctrl', 'shift', 'alt', 'win']]
-                    regular_keys = [k for k in pyautogui_keys if k not in ['ctrl', 'shift', 'alt', 'win']]
-                    
-                    if modifier_keys and regular_keys:
-                        for mod_key in modifier_keys:
-                            pyautogui.keyDown(mod_key)
-                            time.sleep(0.01)
-                        
-                        for reg_key in regular_keys:
-                            pyautogui.press(reg_key)
-                            time.sleep(0.01)
-                        
-                        for mod_key in reversed(modifier_keys):
-                            pyautogui.keyUp(mod_key)
-                            time.sleep(0.01)
-                    else:
-                        pyautogui.hotkey(*pyautogui_keys)
-                else:
-                    pyautogui.press(pyautogui_keys[0])
-            
-            print(f"Sent keyboard shortcut: {shortcut}")
+
+            sequence.play(self.key_injector)
+            print(f"Sent keyboard shortcut: {sequence.text}")
             
         except Exception as e:
             print(f"Error sending keyboard shortcut: {e}")
 
-    def send_media_control(self, index):
+    def send_media_control(self, index, compiled):
         """Send media control command for the given button index."""
         try:
-            if index >= len(self.app.media_control_actions):
-                return
-            
-            action = self.app.media_control_actions[index].get()
+            action = compiled.profile.button(index).media_action
             if not action:
                 return
             
@@ -146,7 +61,7 @@ class ButtonActions:
             
             media_key = media_key_mapping.get(action)
             if media_key:
-                pyautogui.press(media_key)
+                self.key_injector.press(media_key)
                 print(f"Sent media control: {action}")
             else:
                 print(f"Unknown media control action: {action}")
@@ -156,98 +71,97 @@ class ButtonActions:
 
     def handle_button_update(self, button_states):
         """Handle button states from serial controller."""
+        profile_manager = getattr(self.app, "profile_manager", None)
+        if profile_manager is None:
+            return
+
         button_states = [int(state) for state in button_states]
         num_buttons = len(button_states)
         num_apps = len(self.app.current_apps)
-        BUTTON_VOLUME_OFFSET = 1
     
         if not hasattr(self.app, "last_button_states") or len(self.app.last_button_states) != num_buttons:
             self.app.last_button_states = [0] * num_buttons
     
-        if not hasattr(self.app, "mute") or len(self.app.mute) != num_buttons:
-            self.app.mute = [ctk.BooleanVar(value=True) for _ in range(num_buttons)]
-    
         if not hasattr(self.app, "muted_state") or len(self.app.muted_state) != num_apps:
             if hasattr(self.app, "current_mute_state") and len(self.app.current_mute_state) == num_apps:
                 self.app.muted_state = self.app.current_mute_state.copy()
             else:
                 self.app.muted_state = [False] * num_apps
+
+        if self.gesture_engine is not None:
+            self.gesture_engine.feed(button_states)
+        else:
+            for i, (current, previous) in enumerate(zip(button_states, self.app.last_button_states)):
+                if current > 0 and previous == 0:
+                    self.dispatch_press(i, current)
     
-        for i, (current, previous) in enumerate(zip(button_states, self.app.last_button_states)):
-            if current > 0 and previous == 0:
-                volume_index = i + BUTTON_VOLUME_OFFSET
-                
-                if i < len(self.app.mute) and self.app.mute[i].get() and volume_index < len(self.app.muted_state):
-                    mute_mode = "Click" 
-                    if i < len(self.app.mute_button_modes):
-                        mute_mode = self.app.mute_button_modes[i].get()
-                    
-                    should_trigger_mute = False
-                    if mute_mode == "Click" and current == 1:
-                        should_trigger_mute = True
-                    elif mute_mode == "Double Click" and current == 3:
-                        should_trigger_mute = True
-                    elif mute_mode == "Hold" and current == 2:
-                        should_trigger_mute = True
-                    
-                    if should_trigger_mute:
-                        self.app.toggle_mute(volume_index)
-                
-                if (i < len(self.app.app_launch_enabled) and 
-                    self.app.app_launch_enabled[i].get() and 
-                    i < len(self.app.app_launch_paths) and 
-                    self.app.app_launch_paths[i].get()):
-                    app_mode = "Click"
-                    if i < len(self.app.app_button_modes):
-                        app_mode = self.app.app_button_modes[i].get()
-                    
-                    should_trigger_app = False
-                    if app_mode == "Click" and current == 1:
-                        should_trigger_app = True
-                    elif app_mode == "Double Click" and current == 3:
-                        should_trigger_app = True
-                    elif app_mode == "Hold" and current == 2:
-                        should_trigger_app = True
-                    
-                    if should_trigger_app:
-                        self.launch_application(i)
-                
-                if (i < len(self.app.keyboard_shortcut_enabled) and 
-                    self.app.keyboard_shortcut_enabled[i].get() and 
-                    i < len(self.app.keyboard_shortcuts) and 
-                    self.app.keyboard_shortcuts[i].get()):
-                    shortcut_mode = "Click"
-                    if i < len(self.app.shortcut_button_modes):
-                        shortcut_mode = self.app.shortcut_button_modes[i].get()
-                    
-                    should_trigger_shortcut = False
-                    if shortcut_mode == "Click" and current == 1:
-                        should_trigger_shortcut = True
-                    elif shortcut_mode == "Double Click" and current == 3:
-                        should_trigger_shortcut = True
-                    elif shortcut_mode == "Hold" and current == 2:
-                        should_trigger_shortcut = True
-                    
-                    if should_trigger_shortcut:
-                        self.send_keyboard_shortcut(i)
-                
-                if (i < len(self.app.media_control_enabled) and 
-                    self.app.media_control_enabled[i].get() and 
-                    i < len(self.app.media_control_actions) and 
-                    self.app.media_control_actions[i].get()):
-                    media_mode = "Click"
-                    if i < len(self.app.media_control_button_modes):
-                        media_mode = self.app.media_control_button_modes[i].get()
-                    
-                    should_trigger_media = False
-                    if media_mode == "Click" and current == 1:
-                        should_trigger_media = True
-                    elif media_mode == "Double Click" and current == 3:
-                        should_trigger_media = True
-                    elif media_mode == "Hold" and current == 2:
-                        should_trigger_media = True
-                    
-                    if should_trigger_media:
-                        self.send_media_control(i)
-    
-        self.app.last_button_states = button_states 
\ No newline at end of file
+        self.app.last_button_states = button_states
+
+    def poll_gestures(self):
+        """Fire holds, repeats and delayed clicks between frames; runs on the serial thread."""
+        gesture_engine = self.gesture_engine
+        if gesture_engine is not None:
+            gesture_engine.poll()
+
+    def dispatch_press(self, index, code):
+        """Run every action bound to a press code on the given button.
+
+        Handlers get the profile that was active at the press, so an action
+        queued behind a profile switch still uses the button's old settings.
+        """
+        compiled = self.app.profile_manager.active
+        actions = compiled.dispatch.get((index, code))
+        if actions:
+            for action in actions:
+                if action in self.INLINE_ACTIONS:
+                    self.action_handlers[action](index, compiled)
+                else:
+                    self.executor.submit(action, self.action_handlers[action], index, compiled)
+
+    def handle_chord(self, indices):
+        """Report buttons pressed together when gestures are detected on the host."""
+        print(f"Button chord: {', '.join(str(index + 1) for index in indices)}")
+
+    def configure_gestures(self):
+        """Enable or disable host-side gesture detection from the current settings."""
+        settings = self.app.settings_manager
+        if not settings.get_setting("host_gestures"):
+            self.gesture_engine = None
+            return
+
+        self.gesture_engine = GestureEngine(
+            self.dispatch_press,
+            on_chord=self.handle_chord,
+            double_click_window=settings.get_setting("double_click_window_ms", 300) / 1000,
+            hold_time=settings.get_setting("hold_time_ms", 500) / 1000,
+            repeat_interval=settings.get_setting("repeat_interval_ms", 0) / 1000,
+            wants_double_click=self.has_double_click,
+        )
+
+    def has_double_click(self, index):
+        """Return True if the active profile binds a double click on the button."""
+        return (index, DOUBLE_CLICK) in self.app.profile_manager.active.dispatch
+
+    def toggle_button_mute(self, index, compiled):
+        """Toggle mute for the slider the given button sits under."""
+        volume_index = index + self.BUTTON_VOLUME_OFFSET
+        if volume_index < len(self.app.muted_state):
+            self.app.toggle_mute(volume_index)
+
+    def run_group_action(self, index, compiled):
+        """Run the mute group action configured for the given button index."""
+        action = compiled.profile.button(index).group_action
+        volume_manager = self.app.volume_manager
+        if action == "Mute All":
+            volume_manager.mute_all()
+        elif action == "Solo Channel":
+            volume_manager.solo(index + self.BUTTON_VOLUME_OFFSET)
+        elif action == "Restore Snapshot":
+            volume_manager.restore_snapshot()
+        else:
+            print(f"Unknown group action: {action}")
+
+    def switch_profile(self, index, compiled):
+        """Switch profiles as configured for the given button index."""
+        action = compiled.profile.button(index).profile_action
+        self.app.profile_manager.switch_from_button(action)
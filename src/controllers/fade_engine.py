@@ -0,0 +1,119 @@
+import threading
+import time
+
+
+class Fade:
+    """One volume ramp for a slider channel."""
+
+    __slots__ = ("app_names", "start_level", "end_level", "start_time", "duration", "on_done")
+
+    def __init__(self, app_names, start_level, end_level, start_time, duration, on_done=None):
+        self.app_names = app_names
+        self.start_level = start_level
+        self.end_level = end_level
+        self.start_time = start_time
+        self.duration = duration
+        self.on_done = on_done
+
+    def level_at(self, now):
+        """Return the interpolated level at ``now`` and whether the fade is finished."""
+        if self.duration <= 0:
+            return self.end_level, True
+        progress = (now - self.start_time) / self.duration
+        if progress >= 1:
+            return self.end_level, True
+        level = self.start_level + (self.end_level - self.start_level) * max(progress, 0.0)
+        return round(level, 1), False
+
+
+class FadeEngine:
+    """Ramps channel volumes at a fixed tick rate on its own audio thread.
+
+    All fades running in a tick are written with a single batched
+    ``set_application_volumes`` call, so overlapping fades do not multiply COM
+    calls. Starting a fade on a channel replaces any fade already running on it.
+
+    A tick holds ``_lock`` from reading the fades until their levels are
+    written. ``cancel`` takes the same lock, so once it returns no level from
+    the cancelled fade can still land on top of the caller's own write.
+    """
+
+    TICK_RATE = 60
+
+    def __init__(self, audio_controller, clock=time.monotonic):
+        self.audio_controller = audio_controller
+        self.clock = clock
+        self._fades = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def start(self, index, app_names, start_level, end_level, duration, on_done=None):
+        """Ramp a channel from ``start_level`` to ``end_level`` over ``duration`` seconds."""
+        fade = Fade(app_names, start_level, end_level, self.clock(), duration, on_done)
+        with self._lock:
+            self._fades[index] = fade
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def cancel(self, index):
+        """Stop a channel's fade where it is. Returns True if one was running.
+
+        Waits for a tick that is writing to finish first.
+        """
+        with self._lock:
+            return self._fades.pop(index, None) is not None
+
+    def cancel_all(self):
+        with self._lock:
+            self._fades.clear()
+
+    def target(self, index):
+        """Return the level a channel is fading to, or None if it is not fading."""
+        fade = self._fades.get(index)
+        return fade.end_level if fade else None
+
+    def tick(self, now=None):
+        """Advance every fade once and write the new levels in one batch.
+
+        Returns True while fades are still running.
+        """
+        if now is None:
+            now = self.clock()
+
+        levels = {}
+        finished = []
+        with self._lock:
+            for index, fade in list(self._fades.items()):
+                level, done = fade.level_at(now)
+                levels[fade.app_names] = level
+                if done:
+                    del self._fades[index]
+                    finished.append(fade)
+            running = bool(self._fades)
+
+            if levels:
+                self.audio_controller.set_application_volumes(levels)
+
+        for fade in finished:
+            if fade.on_done:
+                try:
+                    fade.on_done(fade.end_level)
+                except Exception as e:
+                    print(f"Error finishing fade: {e}")
+
+        return running
+
+    def _run(self):
+        interval = 1 / self.TICK_RATE
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            next_tick = time.monotonic()
+            while self.tick():
+                next_tick += interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
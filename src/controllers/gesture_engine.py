@@ -0,0 +1,150 @@
+import time
+from utils.profile_model import PRESS_CODES
+
+CLICK = PRESS_CODES["Click"]
+HOLD = PRESS_CODES["Hold"]
+DOUBLE_CLICK = PRESS_CODES["Double Click"]
+
+_IDLE = 0
+_DOWN = 1
+_WAIT_SECOND = 2
+_CONSUMED = 3
+
+
+class _ButtonState:
+    __slots__ = ("phase", "changed_at", "hold_fired", "next_repeat")
+
+    def __init__(self):
+        self.phase = _IDLE
+        self.changed_at = 0.0
+        self.hold_fired = False
+        self.next_repeat = None
+
+
+class GestureEngine:
+    """Turns raw button levels into click, double click and hold presses.
+
+    The engine is fed one frame of levels (0 = released, anything else =
+    pressed) at a time and reports gestures through ``on_press(index, code)``
+    using the same press codes as the firmware, so its output can go straight
+    into the button dispatch table. Buttons pressed together within
+    ``chord_window`` are reported once through ``on_chord(indices)`` instead.
+
+    All timing comes from the timestamps passed to ``feed``/``poll``, or from
+    ``clock`` when none is given, so a simulated clock makes it deterministic.
+    """
+
+    def __init__(
+        self,
+        on_press,
+        on_chord=None,
+        clock=time.monotonic,
+        double_click_window=0.3,
+        hold_time=0.5,
+        repeat_interval=0.0,
+        chord_window=0.05,
+        wants_double_click=None,
+    ):
+        self.on_press = on_press
+        self.on_chord = on_chord
+        self.clock = clock
+        self.double_click_window = double_click_window
+        self.hold_time = hold_time
+        self.repeat_interval = repeat_interval
+        self.chord_window = chord_window
+        # Buttons without a double click binding can report clicks on release
+        # instead of waiting out the double click window.
+        self.wants_double_click = wants_double_click
+        self._buttons = []
+        self._levels = []
+
+    def reset(self):
+        """Forget all button state, e.g. after a reconnect."""
+        self._buttons = []
+        self._levels = []
+
+    def feed(self, levels, now=None):
+        """Process one frame of raw button levels."""
+        if now is None:
+            now = self.clock()
+
+        if len(self._buttons) != len(levels):
+            self._buttons = [_ButtonState() for _ in levels]
+            self._levels = [False] * len(levels)
+
+        for index, level in enumerate(levels):
+            pressed = bool(level)
+            if pressed != self._levels[index]:
+                self._levels[index] = pressed
+                if pressed:
+                    self._on_down(index, now)
+                else:
+                    self._on_up(index, now)
+
+        self.poll(now)
+
+    def poll(self, now=None):
+        """Fire gestures that only depend on time passing (holds, repeats, single clicks)."""
+        if now is None:
+            now = self.clock()
+
+        for index, state in enumerate(self._buttons):
+            if state.phase == _DOWN:
+                if not state.hold_fired and now - state.changed_at >= self.hold_time:
+                    state.hold_fired = True
+                    if self.repeat_interval > 0:
+                        state.next_repeat = state.changed_at + self.hold_time + self.repeat_interval
+                    self.on_press(index, HOLD)
+                elif state.next_repeat is not None and now >= state.next_repeat:
+                    state.next_repeat += self.repeat_interval
+                    self.on_press(index, HOLD)
+            elif state.phase == _WAIT_SECOND and now - state.changed_at > self.double_click_window:
+                state.phase = _IDLE
+                self.on_press(index, CLICK)
+
+    def _on_down(self, index, now):
+        state = self._buttons[index]
+
+        if state.phase == _WAIT_SECOND and now - state.changed_at <= self.double_click_window:
+            state.phase = _CONSUMED
+            self.on_press(index, DOUBLE_CLICK)
+            return
+
+        if state.phase == _WAIT_SECOND:
+            self.on_press(index, CLICK)
+
+        if self.on_chord is not None and self.chord_window > 0:
+            partners = [
+                other
+                for other, other_state in enumerate(self._buttons)
+                if other != index
+                and other_state.phase == _DOWN
+                and not other_state.hold_fired
+                and now - other_state.changed_at <= self.chord_window
+            ]
+            if partners:
+                for other in partners:
+                    self._buttons[other].phase = _CONSUMED
+                state.phase = _CONSUMED
+                self.on_chord(tuple(sorted(partners + [index])))
+                return
+
+        state.phase = _DOWN
+        state.changed_at = now
+        state.hold_fired = False
+        state.next_repeat = None
+
+    def _on_up(self, index, now):
+        state = self._buttons[index]
+
+        if state.phase == _DOWN and not state.hold_fired:
+            if self.double_click_window > 0 and (
+                self.wants_double_click is None or self.wants_double_click(index)
+            ):
+                state.phase = _WAIT_SECOND
+                state.changed_at = now
+                return
+            self.on_press(index, CLICK)
+
+        state.phase = _IDLE
+        state.next_repeat = None
@@ -0,0 +1,156 @@
+import time
+
+# Key names as recorded in the button settings window, mapped to injector key
+# names. Anything not listed is passed through lower-cased.
+KEY_MAP = {
+    "Ctrl": "ctrl",
+    "Control": "ctrl",
+    "Shift": "shift",
+    "Alt": "alt",
+    "Win": "win",
+    "Windows": "win",
+    "Enter": "enter",
+    "Return": "enter",
+    "Tab": "tab",
+    "Space": "space",
+    "Escape": "esc",
+    "Esc": "esc",
+    "Backspace": "backspace",
+    "BackSpace": "backspace",
+    "Delete": "delete",
+    "Del": "delete",
+    "Insert": "insert",
+    "Home": "home",
+    "End": "end",
+    "PageUp": "pageup",
+    "Prior": "pageup",
+    "PageDown": "pagedown",
+    "Next": "pagedown",
+    "Up": "up",
+    "Down": "down",
+    "Left": "left",
+    "Right": "right",
+}
+
+MODIFIER_KEYS = frozenset(("ctrl", "shift", "alt", "win"))
+
+KEY_DOWN = "down"
+KEY_UP = "up"
+
+
+def parse_chord(chord):
+    """Split one chord like ``Ctrl+Shift+a`` into injector key names."""
+    if chord == "+":
+        names = ["+"]
+    elif chord.endswith("++"):
+        names = chord[:-2].split("+") + ["+"]
+    else:
+        names = [name for name in chord.split("+") if name]
+    return [KEY_MAP.get(name, name.lower()) for name in names]
+
+
+def chord_events(keys):
+    """Turn the keys of one chord into key down/up events.
+
+    Modifiers are held while the other keys are tapped in order. A chord
+    without modifiers presses all keys together and releases them in reverse.
+    """
+    modifiers = [key for key in keys if key in MODIFIER_KEYS]
+    regular = [key for key in keys if key not in MODIFIER_KEYS]
+
+    if not modifiers or not regular:
+        return [(KEY_DOWN, key) for key in keys] + [(KEY_UP, key) for key in reversed(keys)]
+
+    events = [(KEY_DOWN, key) for key in modifiers]
+    for key in regular:
+        events.append((KEY_DOWN, key))
+        events.append((KEY_UP, key))
+    events.extend((KEY_UP, key) for key in reversed(modifiers))
+    return events
+
+
+class KeySequence:
+    """A shortcut or macro compiled into immutable steps of key events.
+
+    The text form is one or more chords separated by whitespace, e.g.
+    ``Ctrl+c`` or ``Ctrl+a Ctrl+c Alt+Tab Ctrl+v``, and each chord is one
+    step. ``step_delay`` is the pause in seconds between steps; the events
+    inside a chord are always sent back to back.
+    """
+
+    __slots__ = ("text", "steps", "step_delay")
+
+    def __init__(self, text, steps, step_delay=0.0):
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "steps", tuple(tuple(step) for step in steps))
+        object.__setattr__(self, "step_delay", step_delay)
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"KeySequence is immutable, cannot set '{key}'")
+
+    def __repr__(self):
+        return f"KeySequence({self.text!r})"
+
+    @property
+    def events(self):
+        """All key events of the sequence in order."""
+        return tuple(event for step in self.steps for event in step)
+
+    @classmethod
+    def parse(cls, text, step_delay=0.0):
+        """Compile a shortcut string into a key sequence."""
+        return cls(text, [chord_events(parse_chord(chord)) for chord in text.split()], step_delay)
+
+    def play(self, injector, sleep=time.sleep):
+        """Send the key events through an injector, pausing between chords."""
+        for i, step in enumerate(self.steps):
+            if i and self.step_delay:
+                sleep(self.step_delay)
+            for kind, key in step:
+                if kind == KEY_DOWN:
+                    injector.key_down(key)
+                else:
+                    injector.key_up(key)
+
+
+class PyAutoGuiInjector:
+    """Key injector backed by pyautogui, without pyautogui's built-in pause.
+
+    pyautogui is slow to import, so it is only loaded for the first key.
+    """
+
+    def __init__(self):
+        self._pyautogui = None
+
+    @property
+    def pyautogui(self):
+        if self._pyautogui is None:
+            import pyautogui
+            self._pyautogui = pyautogui
+        return self._pyautogui
+
+    def key_down(self, key):
+        self.pyautogui.keyDown(key, _pause=False)
+
+    def key_up(self, key):
+        self.pyautogui.keyUp(key, _pause=False)
+
+    def press(self, key):
+        self.pyautogui.press(key, _pause=False)
+
+
+class RecordingInjector:
+    """Key injector that records events instead of sending them."""
+
+    def __init__(self):
+        self.events = []
+
+    def key_down(self, key):
+        self.events.append((KEY_DOWN, key))
+
+    def key_up(self, key):
+        self.events.append((KEY_UP, key))
+
+    def press(self, key):
+        self.key_down(key)
+        self.key_up(key)
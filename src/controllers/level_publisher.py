@@ -0,0 +1,77 @@
+import threading
+
+
+class LevelSubscription:
+    """One subscriber's pending changes, coalesced to the newest value per key.
+
+    Publishing never waits on the subscriber: a change that has not been
+    taken yet is simply replaced, so a slow consumer sees fewer, newer
+    updates and the pending set never grows beyond one entry per key.
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._condition = threading.Condition()
+        self.closed = False
+        self.coalesced = 0
+
+    def offer(self, key, value):
+        with self._condition:
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = value
+            self._condition.notify()
+
+    def take(self, timeout=None):
+        """Wait for changes and return them, oldest key first. Returns [] on timeout or close."""
+        with self._condition:
+            if not self._pending and not self.closed:
+                self._condition.wait(timeout)
+            changes = list(self._pending.values())
+            self._pending = {}
+            return changes
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify()
+
+
+class LevelPublisher:
+    """Pushes slider, mute and profile changes to subscribers such as stream overlays.
+
+    Repeated values are filtered out before any subscriber is touched, so the
+    serial thread can publish every frame.
+    """
+
+    def __init__(self):
+        self._subscriptions = set()
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self):
+        subscription = LevelSubscription()
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        subscription.close()
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, key, value):
+        with self._lock:
+            if self._last.get(key) == value:
+                return
+            self._last[key] = value
+            subscriptions = list(self._subscriptions)
+
+        for subscription in subscriptions:
+            subscription.offer(key, value)
+
+    def publish_level(self, index, level, muted):
+        self.publish(("channel", index), {"channel": index, "level": level, "muted": muted})
+
+    def publish_profile(self, name):
+        self.publish("profile", {"profile": name})
@@ -1,195 +1,135 @@
-import customtkinter as ctk
+import time
+import tkinter
+from controllers.key_sequence import KeySequence
 from utils.config_manager import ConfigManager
+from utils.diagnostics import Diagnostics
+from utils.volume_curves import get_table
+from utils.profile_model import (
+    Profile,
+    ButtonConfig,
+    DEFAULT_BUTTON,
+    DEFAULT_BUTTON_COUNT,
+    DEFAULT_CHANNEL_COUNT,
+    build_dispatch_table,
+    migrate_profile_data,
+)
+
+
+class ButtonVars:
+    """Tk variables bound to one button's settings in the button settings window."""
+
+    __slots__ = tuple(ButtonConfig.DEFAULTS)
+
+    def __init__(self, config=DEFAULT_BUTTON):
+        for field, default in ButtonConfig.DEFAULTS.items():
+            if isinstance(default, bool):
+                var_type = tkinter.BooleanVar
+            elif isinstance(default, int):
+                var_type = tkinter.IntVar
+            else:
+                var_type = tkinter.StringVar
+            setattr(self, field, var_type(value=getattr(config, field)))
+
+    def to_config(self):
+        """Snapshot the variables into an immutable button config."""
+        return ButtonConfig(**{field: getattr(self, field).get() for field in self.__slots__})
+
+
+class CompiledProfile:
+    """Per-profile state prepared ahead of time so a switch is one reference swap."""
+
+    __slots__ = ("profile", "slider_targets", "mute_state", "curves", "dispatch", "shortcuts")
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.slider_targets = profile.applications
+        self.curves = tuple(
+            get_table(channel.curve, channel.curve_points) for channel in profile.channels
+        )
+        self.dispatch = build_dispatch_table(profile.buttons)
+        self.shortcuts = {
+            index: KeySequence.parse(button.shortcut, button.shortcut_delay_ms / 1000)
+            for index, button in enumerate(profile.buttons)
+            if button.shortcut_enabled and button.shortcut
+        }
+        if profile.channels:
+            self.mute_state = profile.mute_state
+        else:
+            self.mute_state = (False,) * DEFAULT_CHANNEL_COUNT
+
+    def with_mute_state(self, profile):
+        """Reuse this compiled state for ``profile``, which differs only in its mute flags."""
+        compiled = CompiledProfile.__new__(CompiledProfile)
+        for slot in self.__slots__:
+            setattr(compiled, slot, getattr(self, slot))
+        compiled.profile = profile
+        if profile.channels:
+            compiled.mute_state = profile.mute_state
+        return compiled
 
 
 class ProfileManager:
+    NEXT_PROFILE = "Next Profile"
+    PREVIOUS_PROFILE = "Previous Profile"
+
     def __init__(self, app_instance):
         self.app = app_instance
-    
+        self.profiles = {}
+        self.compiled = {}
+        self.active = None
+        self.last_switch_duration = None
+        self.load_profiles()
+
+    @property
+    def active_profile(self):
+        return self.active.profile if self.active else None
+
+    def load_profiles(self):
+        """Load and compile every profile from the settings store."""
+        settings = ConfigManager.load_settings()
+        self.profiles = {}
+        self.compiled = {}
+        for name, data in settings.get("profiles", {}).items():
+            self._cache_profile(Profile.from_dict(name, data))
+        self.active = self.get_compiled(settings.get("current_profile", "Profile 1"))
+
+    def _cache_profile(self, profile):
+        compiled = CompiledProfile(profile)
+        self.profiles[profile.name] = profile
+        self.compiled[profile.name] = compiled
+
+        button_actions = getattr(self.app, "button_actions", None)
+        if button_actions is not None:
+            button_actions.launcher.prepare(
+                button.app_launch_path for button in profile.buttons if button.app_launch_enabled
+            )
+        return compiled
+
+    def get_profile(self, name):
+        """Get a cached profile, creating an empty one if it does not exist yet."""
+        return self.get_compiled(name).profile
+
+    def get_compiled(self, name):
+        """Get a profile's precompiled state, creating an empty profile if needed."""
+        compiled = self.compiled.get(name)
+        if compiled is None:
+            compiled = self._cache_profile(Profile(name))
+        return compiled
+
+    def profile_names(self):
+        """Get profile names in the order they are cycled through."""
+        names = list(ConfigManager.DEFAULT_PROFILES)
+        names.extend(name for name in self.profiles if name not in names)
+        return names
+
     def on_profile_change(self, profile):
         """Handle profile selection changes."""
         try:
             current_profile = self.app.settings_manager.settings_vars.get("current_profile", "Profile 1")
-            
-            self.save_current_profile_data(current_profile)
-
-            settings = ConfigManager.load_settings()
-            
-            new_profile_apps = (
-                settings.get("profiles", {}).get(profile, {}).get("applications", [])
-            )
-            new_profile_mute = (
-                settings.get("profiles", {}).get(profile, {}).get("mute_settings", [])
-            )
-            new_profile_mute_state = (
-                settings.get("profiles", {}).get(profile, {}).get("mute_state", [])
-            )
-            new_profile_app_launch_enabled = (
-                settings.get("profiles", {}).get(profile, {}).get("app_launch_enabled", [])
-            )
-            new_profile_app_launch_paths = (
-                settings.get("profiles", {}).get(profile, {}).get("app_launch_paths", [])
-            )
-            new_profile_keyboard_shortcut_enabled = (
-                settings.get("profiles", {}).get(profile, {}).get("keyboard_shortcut_enabled", [])
-            )
-            new_profile_keyboard_shortcuts = (
-                settings.get("profiles", {}).get(profile, {}).get("keyboard_shortcuts", [])
-            )
-            new_profile_mute_button_modes = (
-                settings.get("profiles", {}).get(profile, {}).get("mute_button_modes", [])
-            )
-            new_profile_app_button_modes = (
-                settings.get("profiles", {}).get(profile, {}).get("app_button_modes", [])
-            )
-            new_profile_shortcut_button_modes = (
-                settings.get("profiles", {}).get(profile, {}).get("shortcut_button_modes", [])
-            )
-            new_profile_media_control_enabled = (
-                settings.get("profiles", {}).get(profile, {}).get("media_control_enabled", [])
-            )
-            new_profile_media_control_actions = (
-                settings.get("profiles", {}).get(profile, {}).get("media_control_actions", [])
-            )
-            new_profile_media_control_button_modes = (
-                settings.get("profiles", {}).get(profile, {}).get("media_control_button_modes", [])
-            )
-            
-            self.app.current_apps = new_profile_apps
-            self.app.settings_manager.settings_vars["applications"] = new_profile_apps
-            self.app.settings_manager.settings_vars["current_profile"] = profile
-
-            self.app.mute = []
-            if new_profile_mute:
-                for mute_value in new_profile_mute:
-                    var = ctk.BooleanVar(value=mute_value)
-                    self.app.mute.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.BooleanVar(value=True)
-                    self.app.mute.append(var)
-
-            if new_profile_mute_state:
-                self.app.current_mute_state = new_profile_mute_state.copy()
-            else:
-                self.app.current_mute_state = [False] * 7
-            self.app.muted_state = self.app.current_mute_state.copy()
-            
-            self.app.app_launch_enabled = []
-            if new_profile_app_launch_enabled:
-                for enabled_value in new_profile_app_launch_enabled:
-                    var = ctk.BooleanVar(value=enabled_value)
-                    self.app.app_launch_enabled.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.BooleanVar(value=False)
-                    self.app.app_launch_enabled.append(var)
-
-            self.app.app_launch_paths = []
-            if new_profile_app_launch_paths:
-                for path_value in new_profile_app_launch_paths:
-                    var = ctk.StringVar(value=path_value)
-                    self.app.app_launch_paths.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="")
-                    self.app.app_launch_paths.append(var)
-            
-            self.app.keyboard_shortcut_enabled = []
-            if new_profile_keyboard_shortcut_enabled:
-                for enabled_value in new_profile_keyboard_shortcut_enabled:
-                    var = ctk.BooleanVar(value=enabled_value)
-                    self.app.keyboard_shortcut_enabled.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.BooleanVar(value=False)
-                    self.app.keyboard_shortcut_enabled.append(var)
-
-            self.app.keyboard_shortcuts = []
-            if new_profile_keyboard_shortcuts:
-                for shortcut_value in new_profile_keyboard_shortcuts:
-                    var = ctk.StringVar(value=shortcut_value)
-                    self.app.keyboard_shortcuts.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="")
-                    self.app.keyboard_shortcuts.append(var)
-            
-            self.app.mute_button_modes = []
-            if new_profile_mute_button_modes:
-                for mode_value in new_profile_mute_button_modes:
-                    var = ctk.StringVar(value=mode_value)
-                    self.app.mute_button_modes.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="Click")
-                    self.app.mute_button_modes.append(var)
-
-            self.app.app_button_modes = []
-            if new_profile_app_button_modes:
-                for mode_value in new_profile_app_button_modes:
-                    var = ctk.StringVar(value=mode_value)
-                    self.app.app_button_modes.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="Click")
-                    self.app.app_button_modes.append(var)
-
-            self.app.shortcut_button_modes = []
-            if new_profile_shortcut_button_modes:
-                for mode_value in new_profile_shortcut_button_modes:
-                    var = ctk.StringVar(value=mode_value)
-                    self.app.shortcut_button_modes.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="Click")
-                    self.app.shortcut_button_modes.append(var)
-            
-            self.app.media_control_enabled = []
-            if new_profile_media_control_enabled:
-                for enabled_value in new_profile_media_control_enabled:
-                    var = ctk.BooleanVar(value=enabled_value)
-                    self.app.media_control_enabled.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.BooleanVar(value=False)
-                    self.app.media_control_enabled.append(var)
-
-            self.app.media_control_actions = []
-            if new_profile_media_control_actions:
-                for action_value in new_profile_media_control_actions:
-                    var = ctk.StringVar(value=action_value)
-                    self.app.media_control_actions.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="Play/Pause")
-                    self.app.media_control_actions.append(var)
-
-            self.app.media_control_button_modes = []
-            if new_profile_media_control_button_modes:
-                for mode_value in new_profile_media_control_button_modes:
-                    var = ctk.StringVar(value=mode_value)
-                    self.app.media_control_button_modes.append(var)
-            else:
-                for _ in range(5):
-                    var = ctk.StringVar(value="Click")
-                    self.app.media_control_button_modes.append(var)
-            
-            self.app.settings_manager.settings_vars["mute_settings"] = [mute_state.get() for mute_state in self.app.mute]
-            self.app.settings_manager.settings_vars["mute_state"] = self.app.current_mute_state
-            self.app.settings_manager.settings_vars["app_launch_enabled"] = [enabled.get() for enabled in self.app.app_launch_enabled]
-            self.app.settings_manager.settings_vars["app_launch_paths"] = [path.get() for path in self.app.app_launch_paths]
-            self.app.settings_manager.settings_vars["keyboard_shortcut_enabled"] = [enabled.get() for enabled in self.app.keyboard_shortcut_enabled]
-            self.app.settings_manager.settings_vars["keyboard_shortcuts"] = [shortcut.get() for shortcut in self.app.keyboard_shortcuts]
-            self.app.settings_manager.settings_vars["mute_button_modes"] = [mode.get() for mode in self.app.mute_button_modes]
-            self.app.settings_manager.settings_vars["app_button_modes"] = [mode.get() for mode in self.app.app_button_modes]
-            self.app.settings_manager.settings_vars["shortcut_button_modes"] = [mode.get() for mode in self.app.shortcut_button_modes]
-            self.app.settings_manager.settings_vars["media_control_enabled"] = [enabled.get() for enabled in self.app.media_control_enabled]
-            self.app.settings_manager.settings_vars["media_control_actions"] = [action.get() for action in self.app.media_control_actions]
-            self.app.settings_manager.settings_vars["media_control_button_modes"] = [mode.get() for mode in self.app.media_control_button_modes]
-
-            self.app.settings_manager.save_to_config()
+            self.store_profile(self.capture_current_profile(current_profile))
 
+            self.activate_profile(profile)
+            self.apply_profile(self.active_profile)
             self.app.gui_components.refresh_gui()
 
         except Exception as e:
@@ -197,140 +137,155 @@ class ProfileManager:
             import traceback
             traceback.print_exc()
 
+    def switch_from_button(self, action):
+        """Switch profiles from a hardware button without waiting on the GUI.
+
+        ``action`` is NEXT_PROFILE, PREVIOUS_PROFILE or a profile name. The new
+        profile is active for the next serial frame; the GUI catches up on the
+        Tk thread afterwards.
+        """
+        names = self.profile_names()
+        current = self.active_profile.name
+        if action in (self.NEXT_PROFILE, self.PREVIOUS_PROFILE):
+            step = 1 if action == self.NEXT_PROFILE else -1
+            position = names.index(current) if current in names else 0
+            target = names[(position + step) % len(names)]
+        else:
+            target = action
+
+        if target == current:
+            return
+
+        self.activate_profile(target)
+        self.app.root.after(0, self._sync_gui)
+
+    def activate_profile(self, name):
+        """Swap in a precompiled profile as the active one.
+
+        Only plain Python state is touched, so this is safe to call from the
+        serial thread. Nothing is printed or read from disk; the switch time
+        goes to Diagnostics and the settings writer saves the new profile name.
+        """
+        start = time.perf_counter()
+
+        compiled = self.get_compiled(name)
+        self.active = compiled
+        self.app.settings_manager.settings_vars["current_profile"] = name
+        self.app.current_apps = list(compiled.slider_targets)
+        self.app.current_mute_state = list(compiled.mute_state)
+        self.app.muted_state = self.app.current_mute_state.copy()
+        self.app.previous_volumes = [None] * len(self.app.current_apps)
+        volume_manager = getattr(self.app, "volume_manager", None)
+        if volume_manager is not None:
+            volume_manager.begin_profile_fade()
+            volume_manager.publisher.publish_profile(name)
+        ConfigManager.set_current_profile(name)
+
+        self.last_switch_duration = time.perf_counter() - start
+        Diagnostics.record_timing("profile_switch", self.last_switch_duration)
+
+    def _sync_gui(self):
+        """Bring the GUI in line with the active profile after a hardware switch."""
+        try:
+            self.apply_profile(self.active_profile)
+            if self.app.gui_components.profile_listbox:
+                self.app.gui_components.profile_listbox.set(self.active_profile.name)
+            self.app.gui_components.refresh_gui()
+        except Exception as e:
+            print(f"Error syncing GUI after profile switch: {e}")
+
+    def apply_profile(self, profile):
+        """Load a cached profile into the app's runtime state and Tk variables."""
+        compiled = self.get_compiled(profile.name)
+        self.app.settings_manager.settings_vars["current_profile"] = profile.name
+        self.app.current_apps = list(compiled.slider_targets)
+
+        button_count = max(len(profile.buttons), DEFAULT_BUTTON_COUNT)
+        self.app.button_vars = [ButtonVars(profile.button(i)) for i in range(button_count)]
+
+        self.app.current_mute_state = list(compiled.mute_state)
+        self.app.muted_state = self.app.current_mute_state.copy()
+
+    def ensure_button_vars(self, count):
+        """Make sure Tk variables exist for at least ``count`` buttons."""
+        while len(self.app.button_vars) < count:
+            self.app.button_vars.append(ButtonVars())
+
+    def capture_current_profile(self, profile_name):
+        """Build an immutable profile from the app's current runtime state."""
+        entries = getattr(getattr(self.app, "gui_components", None), "entries", None)
+        applications = [entry.get() for entry in entries] if entries else list(self.app.current_apps)
+        mute_state = self.app.current_mute_state
+        base = self.get_profile(profile_name)
+
+        channels = [
+            base.channel(i).replace(
+                application=application,
+                muted=bool(mute_state[i]) if i < len(mute_state) else False,
+            )
+            for i, application in enumerate(applications)
+        ]
+        buttons = [button_vars.to_config() for button_vars in self.app.button_vars]
+        return Profile(profile_name, channels, buttons)
+
+    def set_channel_curve(self, index, curve, points=""):
+        """Change the volume curve of one channel in the active profile."""
+        try:
+            profile = self.capture_current_profile(self.active_profile.name)
+            if index >= len(profile.channels):
+                return
+            channels = list(profile.channels)
+            channels[index] = channels[index].replace(curve=curve, curve_points=points)
+            self.store_profile(profile.replace(channels=channels))
+            if index < len(self.app.previous_volumes):
+                self.app.previous_volumes[index] = None
+        except Exception as e:
+            print(f"Error setting volume curve: {e}")
+
+    def save_mute_state(self):
+        """Persist the runtime mute state of the active profile via the background writer.
+
+        Only the ``muted`` flags change, so the compiled state is reused and
+        just those flags are edited in the settings store; nothing is
+        recompiled on the serial thread.
+        """
+        try:
+            profile = self.active_profile
+            mute_state = self.app.current_mute_state
+            channels = [
+                profile.channel(i).replace(muted=bool(mute_state[i])) if i < len(mute_state) else profile.channel(i)
+                for i in range(max(len(profile.channels), len(mute_state)))
+            ]
+            profile = profile.replace(channels=channels)
+            self.profiles[profile.name] = profile
+            self.active = self.compiled[profile.name] = self.active.with_mute_state(profile)
+
+            with ConfigManager.get_store().edit() as settings:
+                profiles = settings.setdefault("profiles", {})
+                data = migrate_profile_data(profiles.get(profile.name))
+                stored = data["channels"]
+                for i, channel in enumerate(profile.channels):
+                    if i < len(stored):
+                        stored[i]["muted"] = channel.muted
+                    else:
+                        stored.append(channel.to_dict())
+                profiles[profile.name] = data
+        except Exception as e:
+            print(f"Error saving mute state: {e}")
+
+    def store_profile(self, profile):
+        """Cache and compile a profile and hand it to the settings store for a background write."""
+        compiled = self._cache_profile(profile)
+        if self.active is not None and self.active.profile.name == profile.name:
+            self.active = compiled
+
+        with ConfigManager.get_store().edit() as settings:
+            settings.setdefault("profiles", {})[profile.name] = profile.to_dict()
+
     def save_current_profile_data(self, profile_name):
         """Save current profile-specific data to the specified profile."""
         try:
-            if self.app.mute == []:
-                self.app.mute = [
-                    ctk.BooleanVar(value=True),
-                    ctk.BooleanVar(value=True),
-                    ctk.BooleanVar(value=True),
-                    ctk.BooleanVar(value=True),
-                    ctk.BooleanVar(value=True),
-                ]
-            if self.app.current_mute_state == []:
-                self.app.current_mute_state = [
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                    False,
-                ]
-            if self.app.app_launch_paths == []:
-                self.app.app_launch_paths = [
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                ]
-            if self.app.keyboard_shortcut_enabled == []:
-                self.app.keyboard_shortcut_enabled = [
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                ]
-            if self.app.keyboard_shortcuts == []:
-                self.app.keyboard_shortcuts = [
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                    ctk.StringVar(value=""),
-                ]
-            if self.app.mute_button_modes == []:
-                self.app.mute_button_modes = [
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                ]
-            if self.app.app_button_modes == []:
-                self.app.app_button_modes = [
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                ]
-            if self.app.shortcut_button_modes == []:
-                self.app.shortcut_button_modes = [
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                ]
-            
-            if self.app.media_control_enabled == []:
-                self.app.media_control_enabled = [
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                    ctk.BooleanVar(value=False),
-                ]
-            
-            if self.app.media_control_actions == []:
-                self.app.media_control_actions = [
-                    ctk.StringVar(value="Play/Pause"),
-                    ctk.StringVar(value="Play/Pause"),
-                    ctk.StringVar(value="Play/Pause"),
-                    ctk.StringVar(value="Play/Pause"),
-                    ctk.StringVar(value="Play/Pause"),
-                ]
-            
-            if self.app.media_control_button_modes == []:
-                self.app.media_control_button_modes = [
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                    ctk.StringVar(value="Click"),
-                ]
-
-            current_apps = [entry.get() for entry in self.app.gui_components.entries] if hasattr(self.app, 'gui_components') else []
-            current_mute_settings = [mute_state.get() for mute_state in self.app.mute]
-            current_mute_state = self.app.current_mute_state
-            current_app_launch_enabled = [enabled.get() for enabled in self.app.app_launch_enabled]
-            current_app_launch_paths = [path.get() for path in self.app.app_launch_paths]
-            current_keyboard_shortcut_enabled = [enabled.get() for enabled in self.app.keyboard_shortcut_enabled]
-            current_keyboard_shortcuts = [shortcut.get() for shortcut in self.app.keyboard_shortcuts]
-            current_mute_button_modes = [mode.get() for mode in self.app.mute_button_modes]
-            current_app_button_modes = [mode.get() for mode in self.app.app_button_modes]
-            current_shortcut_button_modes = [mode.get() for mode in self.app.shortcut_button_modes]
-            current_media_control_enabled = [enabled.get() for enabled in self.app.media_control_enabled]
-            current_media_control_actions = [action.get() for action in self.app.media_control_actions]
-            current_media_control_button_modes = [mode.get() for mode in self.app.media_control_button_modes]
-
-            settings = ConfigManager.load_settings()
-            
-            if "profiles" not in settings:
-                settings["profiles"] = {}
-            if profile_name not in settings["profiles"]:
-                settings["profiles"][profile_name] = {}
-            
-            settings["profiles"][profile_name]["applications"] = current_apps
-            settings["profiles"][profile_name]["mute_settings"] = current_mute_settings
-            settings["profiles"][profile_name]["mute_state"] = current_mute_state
-            settings["profiles"][profile_name]["app_launch_enabled"] = current_app_launch_enabled
-            settings["profiles"][profile_name]["app_launch_paths"] = current_app_launch_paths
-            settings["profiles"][profile_name]["keyboard_shortcut_enabled"] = current_keyboard_shortcut_enabled
-            settings["profiles"][profile_name]["keyboard_shortcuts"] = current_keyboard_shortcuts
-            settings["profiles"][profile_name]["mute_button_modes"] = current_mute_button_modes
-            settings["profiles"][profile_name]["app_button_modes"] = current_app_button_modes
-            settings["profiles"][profile_name]["shortcut_button_modes"] = current_shortcut_button_modes
-            settings["profiles"][profile_name]["media_control_enabled"] = current_media_control_enabled
-            settings["profiles"][profile_name]["media_control_actions"] = current_media_control_actions
-            settings["profiles"][profile_name]["media_control_button_modes"] = current_media_control_button_modes
-
-            ConfigManager.save_all_settings(settings)
-
+            self.store_profile(self.capture_current_profile(profile_name))
         except Exception as e:
             print(f"Error in save_current_profile_data: {e}")
             import traceback
@@ -339,13 +294,11 @@ class ProfileManager:
     def save_applications(self, event=None):
         """Save applications when a key is released in the entry fields."""
         try:
-            if hasattr(self.app, 'gui_components') and hasattr(self.app.gui_components, 'entries'):
-                self.app.settings_manager.settings_vars["applications"] = [entry.get() for entry in self.app.gui_components.entries]
-            
             current_profile = self.app.settings_manager.settings_vars.get("current_profile", "Profile 1")
             self.save_current_profile_data(current_profile)
+            self.app.current_apps = list(self.active.slider_targets)
 
         except Exception as e:
             print(f"Error in save_applications: {e}")
             import traceback
-            traceback.print_exc() 
\ No newline at end of file
+            traceback.print_exc()
@@ -0,0 +1,191 @@
+import threading
+import time
+from utils.diagnostics import Diagnostics
+
+
+class RemoteControl:
+    """Runs commands that arrive on the instance channel.
+
+    Commands come from a second launch of Hushmix or from scripts, e.g.
+    ``{"command": "set_volume", "channel": 0, "level": 40}``. Several commands
+    can be sent as one JSON array and are answered with an array of replies.
+    They run on the channel's client thread; anything that touches widgets is
+    handed to the Tk thread, and mute and level changes go through
+    VolumeManager methods that hold its lock against the serial thread.
+
+    Volume changes are not written by the client thread. They are merged into
+    a pending batch, newest level per channel, which one writer thread applies
+    with a single ``VolumeManager.set_channel_levels`` call. A script flooding
+    the channel therefore costs one audio write per batch, not one per request.
+    """
+
+    SUBSCRIBE_INTERVAL_MS = 16
+    KEEPALIVE_SECONDS = 1.0
+
+    def __init__(self, app_instance):
+        self.app = app_instance
+        self.commands = {
+            "show": self.show,
+            "switch_profile": self.switch_profile,
+            "list_profiles": self.list_profiles,
+            "set_volume": self.set_volume,
+            "set_volumes": self.set_volumes,
+            "mute": self.mute,
+            "get_levels": self.get_levels,
+            "subscribe": self.subscribe,
+            "diagnostics": self.diagnostics,
+        }
+        self._pending_levels = {}
+        self._levels_lock = threading.Lock()
+        self._levels_ready = threading.Event()
+        self._writer = None
+
+    def handle_command(self, message):
+        """Run one command message, or a list of them, and return the reply."""
+        if isinstance(message, list):
+            replies = []
+            for item in message:
+                if isinstance(item, dict) and item.get("command") == "subscribe":
+                    replies.append({"ok": False, "error": "subscribe cannot be batched"})
+                else:
+                    replies.append(self.handle_command(item))
+            return replies
+
+        if not isinstance(message, dict):
+            return {"ok": False, "error": "Command must be a JSON object"}
+
+        command = self.commands.get(message.get("command"))
+        if command is None:
+            return {"ok": False, "error": f"Unknown command: {message.get('command')}"}
+
+        Diagnostics.increment(f"remote_command.{message['command']}")
+        try:
+            return command(message) or {"ok": True}
+        except (KeyError, TypeError, ValueError) as e:
+            return {"ok": False, "error": f"Bad {message['command']} command: {e}"}
+
+    def get_channel(self, channel):
+        channel = int(channel)
+        if not 0 <= channel < len(self.app.current_apps):
+            raise ValueError(f"Channel {channel} out of range")
+        return channel
+
+    def show(self, message):
+        self.app.root.after(0, self.app.window_manager.restore_window)
+
+    def switch_profile(self, message):
+        name = message.get("profile")
+        if name not in self.app.profile_manager.profile_names():
+            return {"ok": False, "error": f"Unknown profile: {name}"}
+        self.app.profile_manager.switch_from_button(name)
+
+    def list_profiles(self, message):
+        return {
+            "ok": True,
+            "profiles": self.app.profile_manager.profile_names(),
+            "active": self.app.profile_manager.active_profile.name,
+        }
+
+    def set_volume(self, message):
+        self.queue_levels({self.get_channel(message["channel"]): float(message["level"])})
+
+    def set_volumes(self, message):
+        """Set several channels at once from ``{"levels": {"0": 40, "2": 80}}``."""
+        self.queue_levels({
+            self.get_channel(channel): float(level)
+            for channel, level in message["levels"].items()
+        })
+
+    def mute(self, message):
+        """Mute or unmute a channel, or toggle it when ``muted`` is left out."""
+        self.app.volume_manager.set_mute(self.get_channel(message["channel"]), message.get("muted"))
+
+    def get_levels(self, message=None):
+        """Report the active profile and each channel's target, level and mute state."""
+        apps = list(self.app.current_apps)
+        levels = list(self.app.previous_volumes)
+        muted = list(self.app.muted_state)
+        return {
+            "ok": True,
+            "profile": self.app.profile_manager.active_profile.name,
+            "channels": [
+                {
+                    "channel": i,
+                    "app": app_name,
+                    "level": levels[i] if i < len(levels) else None,
+                    "muted": muted[i] if i < len(muted) else False,
+                }
+                for i, app_name in enumerate(apps)
+            ],
+        }
+
+    def diagnostics(self, message=None):
+        """Report the recorded timings and counters, raw and as readable text.
+
+        Button action queue and run times are part of the report; the number
+        of actions still waiting on each lane is added as ``action_pending``.
+        """
+        reply = {"ok": True, "report": Diagnostics.get_report(), "text": Diagnostics.format_report()}
+        button_actions = getattr(self.app, "button_actions", None)
+        if button_actions is not None:
+            pending = button_actions.executor.get_pending()
+            reply["action_pending"] = pending
+            lines = [f"action_pending.{lane}: {count}" for lane, count in sorted(pending.items())]
+            reply["text"] = "\n".join(filter(None, [reply["text"]] + lines))
+        return reply
+
+    def subscribe(self, message):
+        """Stream a ``get_levels`` snapshot, then each batch of changes as it is published.
+
+        Changes are pushed at most once per ``interval_ms``; anything published
+        in between is coalesced to the newest value per channel. A client that
+        reads slowly only holds up its own stream. While nothing changes, a
+        keepalive line is sent every ``KEEPALIVE_SECONDS`` so a client that has
+        gone away is noticed and its thread ends.
+        """
+        interval = max(int(message.get("interval_ms", self.SUBSCRIBE_INTERVAL_MS)), 0) / 1000
+        publisher = self.app.volume_manager.publisher
+        return self._level_stream(publisher, publisher.subscribe(), interval)
+
+    def _level_stream(self, publisher, subscription, interval):
+        try:
+            yield self.get_levels()
+            while True:
+                changes = subscription.take(timeout=self.KEEPALIVE_SECONDS)
+                if subscription.closed:
+                    return
+                if not changes:
+                    yield {"keepalive": True}
+                    continue
+                sent = time.perf_counter()
+                yield {"changes": changes}
+                delay = interval - (time.perf_counter() - sent)
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            publisher.unsubscribe(subscription)
+
+    def queue_levels(self, levels):
+        """Merge channel levels into the pending batch and wake the writer."""
+        with self._levels_lock:
+            self._pending_levels.update(levels)
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_levels, daemon=True)
+                self._writer.start()
+        self._levels_ready.set()
+
+    def _write_levels(self):
+        while True:
+            self._levels_ready.wait()
+            self._levels_ready.clear()
+
+            with self._levels_lock:
+                levels = self._pending_levels
+                self._pending_levels = {}
+            if not levels:
+                continue
+
+            try:
+                self.app.volume_manager.set_channel_levels(levels)
+            except Exception as e:
+                print(f"Error applying remote volume levels: {e}")
@@ -61,21 +61,28 @@ class MedianFilter:
 
 
 class SerialController:
-    def __init__(self, volume_callback, button_callback, connection_status_callback=None):
-        """Initialize serial controller."""
+    def __init__(self, volume_callback, button_callback, connection_status_callback=None, idle_callback=None):
+        """Initialize serial controller.
+
+        ``idle_callback`` runs on the serial thread whenever a poll finds no
+        new frame, so time-based work such as hold detection keeps going
+        while the mixer is quiet.
+        """
         self.volume_callback = volume_callback
         self.button_callback = button_callback
         self.connection_status_callback = connection_status_callback
+        self.idle_callback = idle_callback
         self.button_state = None
         self.running = True
         self.arduino = None
         self.data_split = None
         self.device_name = "USB-SERIAL CH340", "Dispositivo de Série USB"
         self.is_connected = False
+        self.connecting = True
+        self.high_resolution = False
 
         self.volume_filters = [FastCascadedFilter() for _ in range(7)]
 
-        self.initialize_serial()
         self.start_serial_thread()
 
     def get_com_port_by_device_name(self, device_name):
@@ -91,6 +98,7 @@ class SerialController:
     def initialize_serial(self, device_name="USB-SERIAL CH340", baud_rate=9600):
         """Initialize serial connection with the device."""
         serial_port = self.get_com_port_by_device_name(device_name)
+        self.connecting = False
         if serial_port:
             try:
                 self.arduino = serial.Serial(serial_port, baud_rate)
@@ -147,9 +155,11 @@ class SerialController:
         thread.start()
 
     def read_serial_data(self):
-        """Process serial data from the device."""
+        """Connect to the device, then process serial data from it."""
         pythoncom.CoInitialize()
 
+        self.initialize_serial()
+
         while self.running:
             time.sleep(0.01)
             try:
@@ -162,6 +172,8 @@ class SerialController:
                     if self.arduino is None:
                         time.sleep(1)
                         self.initialize_serial()
+                    elif self.idle_callback:
+                        self.idle_callback()
             except serial.SerialException as e:
                 print(f"Serial exception: {e}")
                 self.is_connected = False
@@ -187,7 +199,10 @@ class SerialController:
                 ema_smoothed = self.volume_filters[i].filter(value)
             else:
                 ema_smoothed = value
-            smoothed_volumes.append(int(round(ema_smoothed)))
+            if self.high_resolution:
+                smoothed_volumes.append(ema_smoothed)
+            else:
+                smoothed_volumes.append(int(round(ema_smoothed)))
         self.volume_callback(smoothed_volumes)
 
     def process_button_data(self, data):
@@ -1,83 +1,258 @@
-import customtkinter as ctk
+import threading
+from controllers.fade_engine import FadeEngine
+from controllers.level_publisher import LevelPublisher
+from utils.volume_curves import LINEAR_TABLE, lookup
 
 
 class VolumeManager:
     def __init__(self, app_instance):
         self.app = app_instance
-    
+        self.fade_engine = FadeEngine(self.app.audio_controller)
+        self.publisher = LevelPublisher()
+        self.slider_levels = []
+        self.pending_switch_fades = set()
+        self.high_resolution = False
+        self.mute_snapshot = None
+        self.remote_levels = {}
+        # Held by every path that changes levels or mute state: serial frames,
+        # button actions, and remote commands on the channel's threads.
+        self.lock = threading.RLock()
+
+    def configure(self):
+        """Apply volume settings that are read on every frame."""
+        self.high_resolution = bool(self.app.settings_manager.get_setting("high_resolution_volume"))
+        serial_controller = getattr(self.app, "serial_controller", None)
+        if serial_controller is not None:
+            serial_controller.high_resolution = self.high_resolution
+
+    def get_fade_duration(self):
+        """Get the configured fade duration in seconds."""
+        return (self.app.settings_manager.get_setting("fade_duration_ms", 0) or 0) / 1000
+
+    def fade_channel(self, index, start_level, end_level):
+        """Ramp a channel between two levels. Returns False if it cannot fade."""
+        duration = self.get_fade_duration()
+        if (duration <= 0 or start_level is None or end_level is None
+                or index >= len(self.app.current_apps)):
+            return False
+
+        app_name = self.app.current_apps[index]
+        if not app_name or app_name.lower() == "mic" or start_level == end_level:
+            return False
+
+        def on_done(level, index=index):
+            if index < len(self.app.previous_volumes):
+                self.app.previous_volumes[index] = level
+
+        self.fade_engine.start(index, app_name, start_level, end_level, duration, on_done)
+        return True
+
+    def begin_profile_fade(self):
+        """Fade each channel to its new level on the first frame after a profile switch."""
+        with self.lock:
+            self.fade_engine.cancel_all()
+            self.remote_levels.clear()
+            self.pending_switch_fades = set(range(len(self.app.current_apps)))
+
     def toggle_mute(self, index):
         """Toggle mute/unmute and apply volume."""
-        if index >= len(self.app.muted_state):
-            print(f"Index {index} out of bounds for mute list.")
-            return
+        with self.lock:
+            if index >= len(self.app.muted_state):
+                print(f"Index {index} out of bounds for mute list.")
+                return
     
-        self.app.muted_state[index] = not self.app.muted_state[index]
+            self.app.muted_state[index] = not self.app.muted_state[index]
 
-        if index < len(self.app.current_mute_state):
-            self.app.current_mute_state[index] = self.app.muted_state[index]
-    
-        if self.app.muted_state[index]:
-            self.update_volume(index, 0)
-        else:
-            app_name = self.app.gui_components.entries[index].get() if index < len(self.app.gui_components.entries) else ""
-            if app_name and app_name.lower() == "mic":
-                mic_volume = self.app.audio_controller.get_microphone_volume()
-                if mic_volume > 0:
-                    self.update_volume(index, mic_volume)
+            if index < len(self.app.current_mute_state):
+                self.app.current_mute_state[index] = self.app.muted_state[index]
+
+            previous = self.app.previous_volumes[index] if index < len(self.app.previous_volumes) else None
+            if self.app.muted_state[index]:
+                faded = self.fade_channel(index, previous, 0)
+            else:
+                slider = self.slider_levels[index] if index < len(self.slider_levels) else None
+                faded = self.fade_channel(index, previous, slider)
+
+            if not faded:
+                if self.app.muted_state[index]:
+                    self.apply_level(index, 0)
+                else:
+                    app_name = self.app.current_apps[index] if index < len(self.app.current_apps) else ""
+                    if app_name and app_name.lower() == "mic":
+                        mic_volume = self.app.audio_controller.get_microphone_volume()
+                        self.apply_level(index, mic_volume if mic_volume > 0 else 50)
+                    elif index < len(self.slider_levels) and self.slider_levels[index] is not None:
+                        self.apply_level(index, self.slider_levels[index])
+                    else:
+                        self.apply_level(index, 50)
+            self.app.profile_manager.save_mute_state()
+
+    def set_mute(self, index, muted=None):
+        """Mute or unmute one channel, or toggle it when ``muted`` is None."""
+        with self.lock:
+            if index < len(self.app.muted_state) and (muted is None or bool(muted) != self.app.muted_state[index]):
+                self.toggle_mute(index)
+
+    def set_mute_states(self, mute_states):
+        """Mute or unmute several channels with one batched audio write.
+
+        The previous mute state is kept as a snapshot for ``restore_snapshot``
+        and the new state is persisted through the deferred settings writer.
+        """
+        with self.lock:
+            self.mute_snapshot = list(self.app.muted_state)
+            levels = {}
+
+            for index, muted in enumerate(mute_states):
+                if index >= len(self.app.muted_state) or bool(muted) == self.app.muted_state[index]:
+                    continue
+
+                self.app.muted_state[index] = bool(muted)
+                if index < len(self.app.current_mute_state):
+                    self.app.current_mute_state[index] = bool(muted)
+                self.fade_engine.cancel(index)
+
+                app_name = self.app.current_apps[index] if index < len(self.app.current_apps) else ""
+                if not app_name:
+                    continue
+
+                if muted:
+                    level = 0
+                elif index < len(self.slider_levels) and self.slider_levels[index] is not None:
+                    level = self.slider_levels[index]
                 else:
-                    self.update_volume(index, 50)
-            elif index < len(self.app.previous_volumes) and self.app.previous_volumes[index] is not None:
-                self.update_volume(index, self.app.previous_volumes[index])
+                    level = 50
+                levels[app_name] = level
+                if index < len(self.app.previous_volumes):
+                    self.app.previous_volumes[index] = level
+
+            if levels:
+                self.app.audio_controller.set_application_volumes(levels)
+            self.app.profile_manager.save_mute_state()
+
+    def mute_all(self):
+        """Mute every channel, or unmute them all if they are already muted."""
+        with self.lock:
+            mute = not all(self.app.muted_state)
+            self.set_mute_states([mute] * len(self.app.muted_state))
+
+    def solo(self, index):
+        """Mute every channel except one. Soloing the same channel again restores the snapshot."""
+        with self.lock:
+            solo_state = [i != index for i in range(len(self.app.muted_state))]
+            if self.app.muted_state == solo_state and self.mute_snapshot is not None:
+                self.restore_snapshot()
             else:
-                self.update_volume(index, 50)
-        self.app.save_settings()
+                self.set_mute_states(solo_state)
+
+    def restore_snapshot(self):
+        """Return to the mute state from before the last group action."""
+        with self.lock:
+            if self.mute_snapshot is None:
+                return
+            snapshot = self.mute_snapshot
+            self.set_mute_states(snapshot)
+            self.mute_snapshot = None
+
+    def set_channel_levels(self, levels):
+        """Set channel levels from outside the mixer with one batched audio write.
+
+        ``levels`` maps channel indexes to 0-100 levels. Each level holds until
+        that channel's slider is moved; muted channels stay muted.
+        """
+        with self.lock:
+            writes = {}
+            for index, level in levels.items():
+                if index >= len(self.app.current_apps):
+                    continue
+                if index < len(self.app.muted_state) and self.app.muted_state[index]:
+                    continue
+
+                level = min(max(level, 0), 100)
+                level = round(level, 1) if self.high_resolution else round(level / 2) * 2
+
+                self.fade_engine.cancel(index)
+                self.remote_levels[index] = self.slider_levels[index] if index < len(self.slider_levels) else None
+                if index < len(self.app.previous_volumes):
+                    self.app.previous_volumes[index] = level
+                self.show_level(index, level)
+
+                app_name = self.app.current_apps[index]
+                if app_name:
+                    writes[app_name] = level
+
+            if writes:
+                self.app.audio_controller.set_application_volumes(writes)
 
     def handle_volume_update(self, volumes):
         """Handle volume updates from serial controller."""
-        if self.app.current_apps == []:
-            self.app.current_apps = ["" for i in range(len(volumes))]
-            self.app.root.after(20, self.app.gui_components.refresh_gui)
-            return
+        with self.lock:
+            if getattr(self.app, "profile_manager", None) is None:
+                return
 
-        if not hasattr(self.app, "muted_state") or len(self.app.muted_state) != len(volumes):
-            if hasattr(self.app, "current_mute_state") and len(self.app.current_mute_state) == len(volumes):
-                self.app.muted_state = self.app.current_mute_state.copy()
-            else:
-                self.app.muted_state = [False] * len(volumes)
+            if self.app.current_apps == []:
+                self.app.current_apps = ["" for i in range(len(volumes))]
+                self.app.root.after(20, self.app.gui_components.refresh_gui)
+                return
+
+            if not hasattr(self.app, "muted_state") or len(self.app.muted_state) != len(volumes):
+                if hasattr(self.app, "current_mute_state") and len(self.app.current_mute_state) == len(volumes):
+                    self.app.muted_state = self.app.current_mute_state.copy()
+                else:
+                    self.app.muted_state = [False] * len(volumes)
 
-        for i, volume in enumerate(volumes):
-            self.update_volume(i, int(volume))
+            for i, volume in enumerate(volumes):
+                self.update_volume(i, volume)
 
     def update_volume(self, index, volume_level):
-        """Update volume for a specific application."""
+        """Map a slider level through the channel's curve and apply it."""
         volume_level = min(max(volume_level, 0), 100)
-        volume_level = round(volume_level / 2) * 2
 
-        if self.app.settings_manager.get_setting("invert_volumes"):
-            volume_level = 100 - volume_level
+        curves = self.app.profile_manager.active.curves
+        table = curves[index] if index < len(curves) else LINEAR_TABLE
+        volume_level = lookup(table, volume_level, self.app.settings_manager.get_setting("invert_volumes"))
+        if self.high_resolution:
+            volume_level = round(volume_level, 1)
+        else:
+            volume_level = round(volume_level / 2) * 2
+
+        if index >= len(self.slider_levels):
+            self.slider_levels.extend([None] * (index + 1 - len(self.slider_levels)))
+        self.slider_levels[index] = volume_level
+
+        if index in self.remote_levels:
+            if self.remote_levels[index] == volume_level:
+                return
+            del self.remote_levels[index]
 
+        self.apply_level(index, volume_level)
+
+    def apply_level(self, index, volume_level):
+        """Show and write a level that has already been mapped through the channel's curve."""
         if index < len(self.app.muted_state) and self.app.muted_state[index]:
             volume_level = 0
 
-        if index < len(self.app.gui_components.volume_labels):
-            is_muted = (
-                index < len(self.app.muted_state) and self.app.muted_state[index]
-            )
-            displayed_volume = 0 if is_muted else volume_level
-            color = "red3" if is_muted else self.app.gui_components.volume_labels[index].default_text_color
-
-            self.app.root.after(
-                10,
-                lambda l=self.app.gui_components.volume_labels[index]: l.configure(
-                    text=f"{displayed_volume}%", text_color=color
-                ),
-            )
+        self.show_level(index, volume_level)
 
         if (
             index < len(self.app.current_apps)
             and volume_level != self.app.previous_volumes[index]
         ):
-            app_name = self.app.gui_components.entries[index].get()
+            fade_target = self.fade_engine.target(index)
+            if fade_target is not None:
+                if fade_target == volume_level:
+                    return
+                self.fade_engine.cancel(index)
+
+            if index in self.pending_switch_fades:
+                self.pending_switch_fades.discard(index)
+                app_name = self.app.current_apps[index]
+                if app_name and self.fade_channel(
+                    index, self.app.audio_controller.get_application_volume(app_name), volume_level
+                ):
+                    return
+
+            app_name = self.app.current_apps[index]
             if app_name:
                 if app_name.lower() == "mic" and not self.app.muted_state[index] and self.app.previous_volumes[index] == 0:
                     mic_volume = self.app.audio_controller.get_microphone_volume()
@@ -85,4 +260,24 @@ class VolumeManager:
                         volume_level = mic_volume
                 
                 self.app.audio_controller.set_application_volume(app_name, volume_level)
-                self.app.previous_volumes[index] = volume_level 
\ No newline at end of file
+                self.app.previous_volumes[index] = volume_level 
+
+    def show_level(self, index, volume_level):
+        """Show a channel's level on its label, in red while muted, and publish it."""
+        is_muted = (
+            index < len(self.app.muted_state) and self.app.muted_state[index]
+        )
+        self.publisher.publish_level(index, 0 if is_muted else volume_level, is_muted)
+
+        if index >= len(self.app.gui_components.volume_labels):
+            return
+
+        displayed_volume = 0 if is_muted else round(volume_level / 2) * 2
+        color = "red3" if is_muted else self.app.gui_components.volume_labels[index].default_text_color
+
+        self.app.root.after(
+            10,
+            lambda l=self.app.gui_components.volume_labels[index]: l.configure(
+                text=f"{displayed_volume}%", text_color=color
+            ),
+        )
@@ -1,5 +1,14 @@
 from .app import HushmixApp
-from .settings_window import SettingsWindow
-from .version_window import VersionWindow
 
-__all__ = ['HushmixApp', 'SettingsWindow', 'VersionWindow'] 
\ No newline at end of file
+__all__ = ['HushmixApp', 'SettingsWindow', 'VersionWindow']
+
+
+def __getattr__(name):
+    """Import secondary windows on first use."""
+    if name == 'SettingsWindow':
+        from .settings_window import SettingsWindow
+        return SettingsWindow
+    if name == 'VersionWindow':
+        from .version_window import VersionWindow
+        return VersionWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,26 +4,18 @@ import tkinter as tk
 from tkinter import filedialog
 from utils.icon_manager import IconManager
 from utils.dpi_manager import DPIManager
+from utils.config_manager import ConfigManager
 
 
 class ButtonSettingsWindow:
+    MAX_SHORTCUT_DELAY_MS = 5000
+
     def __init__(
         self,
         parent,
         index,
-        mute,
-        app_launch_enabled,
-        app_launch_paths,
-        keyboard_shortcut_enabled,
-        keyboard_shortcuts,
-        mute_button_modes,
-        app_button_modes,
-        shortcut_button_modes,
-        media_control_enabled,
-        media_control_actions,
-        media_control_button_modes,
+        button_vars,
         on_close,
-        
     ):
         self.parent = parent
         self.window = ctk.CTkToplevel(parent)
@@ -39,17 +31,7 @@ class ButtonSettingsWindow:
 
         self.on_close = on_close
         self.index = index
-        self.mute = mute
-        self.app_launch_enabled = app_launch_enabled
-        self.app_launch_paths = app_launch_paths
-        self.keyboard_shortcut_enabled = keyboard_shortcut_enabled
-        self.keyboard_shortcuts = keyboard_shortcuts
-        self.mute_button_modes = mute_button_modes
-        self.app_button_modes = app_button_modes
-        self.shortcut_button_modes = shortcut_button_modes
-        self.media_control_enabled = media_control_enabled
-        self.media_control_actions = media_control_actions
-        self.media_control_button_modes = media_control_button_modes
+        self.button_vars = button_vars
         self.dpi_manager = DPIManager()
 
         self.normal_font_size = 14
@@ -81,40 +63,6 @@ class ButtonSettingsWindow:
 
         self.dpi_manager.adjust_dpi_scaling_delayed(self.window, "button settings window")
 
-        if self.index >= len(self.mute):
-            while len(self.mute) <= self.index:
-                self.mute.append(ctk.BooleanVar(value=True))
-        if self.index >= len(self.app_launch_enabled):
-            while len(self.app_launch_enabled) <= self.index:
-                self.app_launch_enabled.append(ctk.BooleanVar(value=False))
-        if self.index >= len(self.app_launch_paths):
-            while len(self.app_launch_paths) <= self.index:
-                self.app_launch_paths.append(ctk.StringVar(value=""))
-        if self.index >= len(self.keyboard_shortcut_enabled):
-            while len(self.keyboard_shortcut_enabled) <= self.index:
-                self.keyboard_shortcut_enabled.append(ctk.BooleanVar(value=False))
-        if self.index >= len(self.keyboard_shortcuts):
-            while len(self.keyboard_shortcuts) <= self.index:
-                self.keyboard_shortcuts.append(ctk.StringVar(value=""))
-        if self.index >= len(self.mute_button_modes):
-            while len(self.mute_button_modes) <= self.index:
-                self.mute_button_modes.append(ctk.StringVar(value="Click"))
-        if self.index >= len(self.app_button_modes):
-            while len(self.app_button_modes) <= self.index:
-                self.app_button_modes.append(ctk.StringVar(value="Click"))
-        if self.index >= len(self.shortcut_button_modes):
-            while len(self.shortcut_button_modes) <= self.index:
-                self.shortcut_button_modes.append(ctk.StringVar(value="Click"))
-        if self.index >= len(self.media_control_enabled):
-            while len(self.media_control_enabled) <= self.index:
-                self.media_control_enabled.append(ctk.BooleanVar(value=False))
-        if self.index >= len(self.media_control_actions):
-            while len(self.media_control_actions) <= self.index:
-                self.media_control_actions.append(ctk.StringVar(value="Play/Pause"))
-        if self.index >= len(self.media_control_button_modes):
-            while len(self.media_control_button_modes) <= self.index:
-                self.media_control_button_modes.append(ctk.StringVar(value="Click"))
-
         self.frame.grid_columnconfigure(0, weight=1)
         self.frame.grid_columnconfigure(1, weight=0)
 
@@ -126,6 +74,10 @@ class ButtonSettingsWindow:
         
         self.create_media_control_row()
 
+        self.create_profile_switch_row()
+
+        self.create_group_action_row()
+
 
 
     def create_mute_row(self):
@@ -133,7 +85,7 @@ class ButtonSettingsWindow:
         self.mute_checkbox = ctk.CTkCheckBox(
             self.frame,
             text="Mute",
-            variable=self.mute[self.index],
+            variable=self.button_vars.mute_enabled,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             hover_color=self.accent_hover,
@@ -143,7 +95,7 @@ class ButtonSettingsWindow:
         self.mute_mode_dropdown = ctk.CTkOptionMenu(
             self.frame,
             values=["Click", "Double Click", "Hold"],
-            variable=self.mute_button_modes[self.index],
+            variable=self.button_vars.mute_mode,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             button_color=self.accent_color,
@@ -160,7 +112,7 @@ class ButtonSettingsWindow:
         self.app_launch_checkbox = ctk.CTkCheckBox(
             self.frame,
             text="Launch Application",
-            variable=self.app_launch_enabled[self.index],
+            variable=self.button_vars.app_launch_enabled,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             hover_color=self.accent_hover,
@@ -171,7 +123,7 @@ class ButtonSettingsWindow:
         self.app_mode_dropdown = ctk.CTkOptionMenu(
             self.frame,
             values=["Click", "Double Click", "Hold"],
-            variable=self.app_button_modes[self.index],
+            variable=self.button_vars.app_mode,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             button_color=self.accent_color,
@@ -205,6 +157,16 @@ class ButtonSettingsWindow:
         )
         self.browse_button.pack(pady=(0, 5), padx=15, anchor="w")
 
+        self.focus_existing_checkbox = ctk.CTkCheckBox(
+            self.file_frame,
+            text="Focus if already running",
+            variable=self.button_vars.app_focus_existing,
+            font=("Segoe UI", 12),
+            fg_color=self.accent_color,
+            hover_color=self.accent_hover,
+        )
+        self.focus_existing_checkbox.pack(pady=(0, 5), padx=15, anchor="w")
+
         self.update_app_launch_ui()
 
     def create_keyboard_shortcut_row(self):
@@ -212,7 +174,7 @@ class ButtonSettingsWindow:
         self.shortcut_checkbox = ctk.CTkCheckBox(
             self.frame,
             text="Keyboard Shortcut",
-            variable=self.keyboard_shortcut_enabled[self.index],
+            variable=self.button_vars.shortcut_enabled,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             hover_color=self.accent_hover,
@@ -223,7 +185,7 @@ class ButtonSettingsWindow:
         self.shortcut_mode_dropdown = ctk.CTkOptionMenu(
             self.frame,
             values=["Click", "Double Click", "Hold"],
-            variable=self.shortcut_button_modes[self.index],
+            variable=self.button_vars.shortcut_mode,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             button_color=self.accent_color,
@@ -255,8 +217,11 @@ class ButtonSettingsWindow:
         self.shortcut_entry.pack(pady=(0, 5), padx=15, fill="x")
         self.shortcut_entry.bind("<Button-1>", self.start_shortcut_recording)
 
+        self.shortcut_buttons_frame = ctk.CTkFrame(self.shortcut_input_frame, fg_color="transparent")
+        self.shortcut_buttons_frame.pack(pady=(0, 5), padx=15, anchor="w")
+
         self.clear_shortcut_button = ctk.CTkButton(
-            self.shortcut_input_frame,
+            self.shortcut_buttons_frame,
             text="Clear",
             font=("Segoe UI", 12),
             fg_color=self.accent_color,
@@ -265,7 +230,40 @@ class ButtonSettingsWindow:
             width=80,
             height=30
         )
-        self.clear_shortcut_button.pack(pady=(0, 5), padx=15, anchor="w")
+        self.clear_shortcut_button.pack(side="left")
+
+        self.add_step_button = ctk.CTkButton(
+            self.shortcut_buttons_frame,
+            text="Add Step",
+            font=("Segoe UI", 12),
+            fg_color=self.accent_color,
+            hover_color=self.accent_hover,
+            command=lambda: self.start_shortcut_recording(append=True),
+            width=80,
+            height=30
+        )
+        self.add_step_button.pack(side="left", padx=(10, 0))
+
+        self.shortcut_delay_label = ctk.CTkLabel(
+            self.shortcut_buttons_frame,
+            text="Step delay (ms):",
+            font=("Segoe UI", 12)
+        )
+        self.shortcut_delay_label.pack(side="left", padx=(20, 5))
+
+        self.shortcut_delay_text = tk.StringVar(value=str(self.button_vars.shortcut_delay_ms.get()))
+        self.shortcut_delay_text.trace_add("write", self.on_shortcut_delay_change)
+        self.shortcut_delay_entry = ctk.CTkEntry(
+            self.shortcut_buttons_frame,
+            textvariable=self.shortcut_delay_text,
+            font=("Segoe UI", 12),
+            width=60,
+            height=30,
+            validate="key",
+            validatecommand=(self.window.register(self.validate_shortcut_delay), "%P")
+        )
+        self.shortcut_delay_entry.pack(side="left")
+        self.shortcut_delay_entry.bind("<FocusOut>", self.on_shortcut_delay_focus_out)
 
         self.update_shortcut_ui()
 
@@ -275,26 +273,33 @@ class ButtonSettingsWindow:
         """Handle app launch checkbox toggle."""
         self.update_app_launch_ui()
 
+    def validate_shortcut_delay(self, value):
+        """Allow only whole milliseconds up to MAX_SHORTCUT_DELAY_MS; empty while typing."""
+        return value == "" or (value.isdigit() and int(value) <= self.MAX_SHORTCUT_DELAY_MS)
+
+    def on_shortcut_delay_change(self, *args):
+        """Copy the typed delay into button_vars.shortcut_delay_ms."""
+        value = self.shortcut_delay_text.get()
+        self.button_vars.shortcut_delay_ms.set(int(value) if value.isdigit() else 0)
+
+    def on_shortcut_delay_focus_out(self, event=None):
+        if not self.shortcut_delay_text.get():
+            self.shortcut_delay_text.set("0")
+
     def on_shortcut_toggle(self):
         """Handle keyboard shortcut checkbox toggle."""
         self.update_shortcut_ui()
 
     def update_app_launch_ui(self):
         """Update the UI based on the app launch checkbox state."""
-        if self.index >= len(self.app_launch_enabled):
-            while len(self.app_launch_enabled) <= self.index:
-                self.app_launch_enabled.append(ctk.BooleanVar(value=False))
-        if self.index >= len(self.app_launch_paths):
-            while len(self.app_launch_paths) <= self.index:
-                self.app_launch_paths.append(ctk.StringVar(value=""))
-        
-        is_enabled = self.app_launch_enabled[self.index].get()
+        is_enabled = self.button_vars.app_launch_enabled.get()
         
         if is_enabled:
             self.file_frame.grid(row=2, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
             self.browse_button.configure(state="normal")
+            self.focus_existing_checkbox.configure(state="normal")
             
-            current_path = self.app_launch_paths[self.index].get()
+            current_path = self.button_vars.app_launch_path.get()
             if current_path:
                 import os
                 filename = os.path.basename(current_path)
@@ -304,6 +309,7 @@ class ButtonSettingsWindow:
         else:
             self.file_frame.grid_remove()
             self.browse_button.configure(state="disabled")
+            self.focus_existing_checkbox.configure(state="disabled")
         
         self.window.update_idletasks()
         
@@ -317,21 +323,16 @@ class ButtonSettingsWindow:
 
     def update_shortcut_ui(self):
         """Update the UI based on the keyboard shortcut checkbox state."""
-        if self.index >= len(self.keyboard_shortcut_enabled):
-            while len(self.keyboard_shortcut_enabled) <= self.index:
-                self.keyboard_shortcut_enabled.append(ctk.BooleanVar(value=False))
-        if self.index >= len(self.keyboard_shortcuts):
-            while len(self.keyboard_shortcuts) <= self.index:
-                self.keyboard_shortcuts.append(ctk.StringVar(value=""))
-        
-        is_enabled = self.keyboard_shortcut_enabled[self.index].get()
+        is_enabled = self.button_vars.shortcut_enabled.get()
         
         if is_enabled:
             self.shortcut_input_frame.grid(row=4, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
             self.shortcut_entry.configure(state="normal")
             self.clear_shortcut_button.configure(state="normal")
+            self.shortcut_delay_entry.configure(state="normal")
+            self.add_step_button.configure(state="normal")
             
-            current_shortcut = self.keyboard_shortcuts[self.index].get()
+            current_shortcut = self.button_vars.shortcut.get()
             if current_shortcut:
                 self.shortcut_entry.configure(state="normal")
                 self.shortcut_entry.delete(0, "end")
@@ -345,6 +346,8 @@ class ButtonSettingsWindow:
             self.shortcut_input_frame.grid_remove()
             self.shortcut_entry.configure(state="disabled")
             self.clear_shortcut_button.configure(state="disabled")
+            self.shortcut_delay_entry.configure(state="disabled")
+            self.add_step_button.configure(state="disabled")
         
         self.window.update_idletasks()
         
@@ -361,7 +364,7 @@ class ButtonSettingsWindow:
         self.media_control_checkbox = ctk.CTkCheckBox(
             self.frame,
             text="Media Control",
-            variable=self.media_control_enabled[self.index],
+            variable=self.button_vars.media_enabled,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             hover_color=self.accent_hover,
@@ -372,7 +375,7 @@ class ButtonSettingsWindow:
         self.media_mode_dropdown = ctk.CTkOptionMenu(
             self.frame,
             values=["Click", "Double Click", "Hold"],
-            variable=self.media_control_button_modes[self.index],
+            variable=self.button_vars.media_mode,
             font=("Segoe UI", self.normal_font_size),
             fg_color=self.accent_color,
             button_color=self.accent_color,
@@ -397,7 +400,7 @@ class ButtonSettingsWindow:
         self.media_action_dropdown = ctk.CTkOptionMenu(
             self.media_action_frame,
             values=["Play/Pause", "Next Track", "Previous Track"],
-            variable=self.media_control_actions[self.index],
+            variable=self.button_vars.media_action,
             font=("Segoe UI", 12),
             fg_color=self.accent_color,
             button_color=self.accent_color,
@@ -417,11 +420,7 @@ class ButtonSettingsWindow:
 
     def update_media_control_ui(self):
         """Update the UI based on the media control checkbox state."""
-        if self.index >= len(self.media_control_enabled):
-            while len(self.media_control_enabled) <= self.index:
-                self.media_control_enabled.append(ctk.BooleanVar(value=False))
-        
-        is_enabled = self.media_control_enabled[self.index].get()
+        is_enabled = self.button_vars.media_enabled.get()
         
         if is_enabled:
             self.media_action_frame.grid(row=6, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
@@ -440,15 +439,181 @@ class ButtonSettingsWindow:
         
         self.window.geometry(f"{required_width}x{required_height}+{current_x}+{current_y}")
 
-    def start_shortcut_recording(self, event=None):
-        """Start recording keyboard shortcut."""
-        if self.index >= len(self.keyboard_shortcuts):
-            while len(self.keyboard_shortcuts) <= self.index:
-                self.keyboard_shortcuts.append(ctk.StringVar(value=""))
+    def create_profile_switch_row(self):
+        """Create the profile switch checkbox with button mode dropdown in a row."""
+        self.profile_switch_checkbox = ctk.CTkCheckBox(
+            self.frame,
+            text="Switch Profile",
+            variable=self.button_vars.profile_enabled,
+            font=("Segoe UI", self.normal_font_size),
+            fg_color=self.accent_color,
+            hover_color=self.accent_hover,
+            command=self.on_profile_switch_toggle
+        )
+        self.profile_switch_checkbox.grid(row=7, column=0, pady=10, padx=15, sticky="w")
+
+        self.profile_mode_dropdown = ctk.CTkOptionMenu(
+            self.frame,
+            values=["Click", "Double Click", "Hold"],
+            variable=self.button_vars.profile_mode,
+            font=("Segoe UI", self.normal_font_size),
+            fg_color=self.accent_color,
+            button_color=self.accent_color,
+            button_hover_color=self.accent_hover,
+            dropdown_hover_color=self.accent_hover,
+            width=150,
+            height=30,
+            corner_radius=10,
+        )
+        self.profile_mode_dropdown.grid(row=7, column=1, pady=10, padx=15, sticky="e")
+
+        self.profile_action_frame = ctk.CTkFrame(self.frame, corner_radius=10, border_width=0)
+        self.profile_action_frame.grid(row=8, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
+
+        self.profile_action_label = ctk.CTkLabel(
+            self.profile_action_frame,
+            text="Target Profile:",
+            font=("Segoe UI", 12),
+        )
+        self.profile_action_label.pack(pady=(5, 5), padx=15, anchor="w")
+
+        self.profile_action_dropdown = ctk.CTkOptionMenu(
+            self.profile_action_frame,
+            values=["Next Profile", "Previous Profile", *ConfigManager.DEFAULT_PROFILES],
+            variable=self.button_vars.profile_action,
+            font=("Segoe UI", 12),
+            fg_color=self.accent_color,
+            button_color=self.accent_color,
+            button_hover_color=self.accent_hover,
+            dropdown_hover_color=self.accent_hover,
+            width=200,
+            height=30,
+            corner_radius=10,
+        )
+        self.profile_action_dropdown.pack(pady=(0, 5), padx=15, anchor="w")
+
+        self.update_profile_switch_ui()
+
+    def on_profile_switch_toggle(self):
+        """Handle profile switch checkbox toggle."""
+        self.update_profile_switch_ui()
+
+    def update_profile_switch_ui(self):
+        """Update the UI based on the profile switch checkbox state."""
+        is_enabled = self.button_vars.profile_enabled.get()
+        
+        if is_enabled:
+            self.profile_action_frame.grid(row=8, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
+            self.profile_action_dropdown.configure(state="normal")
+        else:
+            self.profile_action_frame.grid_remove()
+            self.profile_action_dropdown.configure(state="disabled")
+        
+        self.window.update_idletasks()
+        
+        current_x = self.window.winfo_x()
+        current_y = self.window.winfo_y()
+        
+        required_width = self.window.winfo_reqwidth()
+        required_height = self.window.winfo_reqheight()
+        
+        self.window.geometry(f"{required_width}x{required_height}+{current_x}+{current_y}")
+
+    def create_group_action_row(self):
+        """Create the group action checkbox with button mode dropdown in a row."""
+        self.group_action_checkbox = ctk.CTkCheckBox(
+            self.frame,
+            text="Group Mute",
+            variable=self.button_vars.group_enabled,
+            font=("Segoe UI", self.normal_font_size),
+            fg_color=self.accent_color,
+            hover_color=self.accent_hover,
+            command=self.on_group_action_toggle
+        )
+        self.group_action_checkbox.grid(row=9, column=0, pady=10, padx=15, sticky="w")
+
+        self.group_mode_dropdown = ctk.CTkOptionMenu(
+            self.frame,
+            values=["Click", "Double Click", "Hold"],
+            variable=self.button_vars.group_mode,
+            font=("Segoe UI", self.normal_font_size),
+            fg_color=self.accent_color,
+            button_color=self.accent_color,
+            button_hover_color=self.accent_hover,
+            dropdown_hover_color=self.accent_hover,
+            width=150,
+            height=30,
+            corner_radius=10,
+        )
+        self.group_mode_dropdown.grid(row=9, column=1, pady=10, padx=15, sticky="e")
+
+        self.group_action_frame = ctk.CTkFrame(self.frame, corner_radius=10, border_width=0)
+        self.group_action_frame.grid(row=10, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
+
+        self.group_action_label = ctk.CTkLabel(
+            self.group_action_frame,
+            text="Group Action:",
+            font=("Segoe UI", 12),
+        )
+        self.group_action_label.pack(pady=(5, 5), padx=15, anchor="w")
+
+        self.group_action_dropdown = ctk.CTkOptionMenu(
+            self.group_action_frame,
+            values=["Mute All", "Solo Channel", "Restore Snapshot"],
+            variable=self.button_vars.group_action,
+            font=("Segoe UI", 12),
+            fg_color=self.accent_color,
+            button_color=self.accent_color,
+            button_hover_color=self.accent_hover,
+            dropdown_hover_color=self.accent_hover,
+            width=200,
+            height=30,
+            corner_radius=10,
+        )
+        self.group_action_dropdown.pack(pady=(0, 5), padx=15, anchor="w")
+
+        self.update_group_action_ui()
+
+    def on_group_action_toggle(self):
+        """Handle group action checkbox toggle."""
+        self.update_group_action_ui()
+
+    def update_group_action_ui(self):
+        """Update the UI based on the group action checkbox state."""
+        is_enabled = self.button_vars.group_enabled.get()
         
+        if is_enabled:
+            self.group_action_frame.grid(row=10, column=0, columnspan=2, pady=(0, 10), padx=15, sticky="ew")
+            self.group_action_dropdown.configure(state="normal")
+        else:
+            self.group_action_frame.grid_remove()
+            self.group_action_dropdown.configure(state="disabled")
+        
+        self.window.update_idletasks()
+        
+        current_x = self.window.winfo_x()
+        current_y = self.window.winfo_y()
+        
+        required_width = self.window.winfo_reqwidth()
+        required_height = self.window.winfo_reqheight()
+        
+        self.window.geometry(f"{required_width}x{required_height}+{current_x}+{current_y}")
+
+    def start_shortcut_recording(self, event=None, append=False):
+        """Start recording keyboard shortcut.
+
+        With ``append`` the recorded chord is added as a new step after the
+        existing shortcut, building up a macro.
+        """
+        self.append_step = append
+        self.previous_shortcut = self.button_vars.shortcut.get()
+        prompt = "Press keys... (Escape to cancel)"
+        if append and self.previous_shortcut:
+            prompt = f"{self.previous_shortcut} + next step... (Escape to cancel)"
+
         self.shortcut_entry.configure(state="normal")
         self.shortcut_entry.delete(0, "end")
-        self.shortcut_entry.insert(0, "Press keys... (Escape to cancel)")
+        self.shortcut_entry.insert(0, prompt)
         self.shortcut_entry.configure(state="readonly")
         
         self.window.focus_force()
@@ -472,7 +637,7 @@ class ButtonSettingsWindow:
             self.recorded_keys = []
             self.shortcut_entry.configure(state="normal")
             self.shortcut_entry.delete(0, "end")
-            self.shortcut_entry.insert(0, "")
+            self.shortcut_entry.insert(0, self.previous_shortcut if self.append_step else "")
             self.shortcut_entry.configure(state="readonly")
             self.stop_shortcut_recording()
             return
@@ -621,8 +786,11 @@ class ButtonSettingsWindow:
             else:
                 self.final_shortcut = ""
             
+            if self.final_shortcut and self.append_step and self.previous_shortcut:
+                self.final_shortcut = f"{self.previous_shortcut} {self.final_shortcut}"
+
             if self.final_shortcut:
-                self.keyboard_shortcuts[self.index].set(self.final_shortcut)
+                self.button_vars.shortcut.set(self.final_shortcut)
                 self.shortcut_entry.configure(state="normal")
                 self.shortcut_entry.delete(0, "end")
                 self.shortcut_entry.insert(0, self.final_shortcut)
@@ -641,11 +809,7 @@ class ButtonSettingsWindow:
 
     def clear_shortcut(self):
         """Clear the current keyboard shortcut."""
-        if self.index >= len(self.keyboard_shortcuts):
-            while len(self.keyboard_shortcuts) <= self.index:
-                self.keyboard_shortcuts.append(ctk.StringVar(value=""))
-        
-        self.keyboard_shortcuts[self.index].set("")
+        self.button_vars.shortcut.set("")
         self.shortcut_entry.configure(state="normal")
         self.shortcut_entry.delete(0, "end")
         self.shortcut_entry.configure(state="readonly")
@@ -658,10 +822,6 @@ class ButtonSettingsWindow:
 
     def browse_file(self):
         """Open file dialog to select an application."""
-        if self.index >= len(self.app_launch_paths):
-            while len(self.app_launch_paths) <= self.index:
-                self.app_launch_paths.append(ctk.StringVar(value=""))
-        
         file_path = filedialog.askopenfilename(
             title="Select Application",
             filetypes=[
@@ -671,7 +831,7 @@ class ButtonSettingsWindow:
         )
         
         if file_path:
-            self.app_launch_paths[self.index].set(file_path)
+            self.button_vars.app_launch_path.set(file_path)
             self.update_app_launch_ui()
 
     def center_window(self, parent):
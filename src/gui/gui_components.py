@@ -1,4 +1,5 @@
 import customtkinter as ctk
+import tkinter as tk
 from utils.color_utils import get_windows_accent_color, darken_color
 
 
@@ -164,6 +165,7 @@ class GUIComponents:
             )
             volume_label.grid(row=i + 1, column=3, pady=6, padx=5, sticky="w")
             volume_label.bind("<Button-1>", lambda event: event.widget.focus_force())
+            volume_label.bind("<Button-3>", lambda event, idx=i: self.show_curve_menu(event, idx))
             volume_label.default_text_color = volume_label.cget("text_color")
 
             self.entries.append(entry)
@@ -213,6 +215,37 @@ class GUIComponents:
         
         self.app.update_connection_status()
 
+    def show_curve_menu(self, event, index):
+        """Show the volume curve menu for a slider channel."""
+        channel = self.app.profile_manager.active_profile.channel(index)
+        selected = tk.StringVar(value=channel.curve)
+
+        menu = tk.Menu(self.root, tearoff=0)
+        for label, curve in [("Linear", "linear"), ("Logarithmic", "log")]:
+            menu.add_radiobutton(
+                label=label,
+                variable=selected,
+                value=curve,
+                command=lambda c=curve: self.app.profile_manager.set_channel_curve(index, c),
+            )
+        menu.add_radiobutton(
+            label="Custom...",
+            variable=selected,
+            value="custom",
+            command=lambda: self.ask_custom_curve(index, channel.curve_points),
+        )
+        menu.tk_popup(event.x_root, event.y_root)
+
+    def ask_custom_curve(self, index, current_points):
+        """Ask for custom curve points and apply them to a slider channel."""
+        dialog = ctk.CTkInputDialog(
+            text=f"Curve points as input:output percentages\n(current: {current_points or '0:0 100:100'})",
+            title="Custom Volume Curve",
+        )
+        points = dialog.get_input()
+        if points:
+            self.app.profile_manager.set_channel_curve(index, "custom", points.strip())
+
     def update_theme_colors(self):
         """Update theme colors for all GUI components."""
         self.accent_color = get_windows_accent_color()
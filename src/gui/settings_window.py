@@ -70,6 +70,8 @@ class SettingsWindow:
             ("Enable Auto Startup", "auto_startup"),
             ("Launch in Tray", "launch_in_tray"),
             ("Dark Mode", "dark_mode"),
+            ("Detect Button Gestures on PC", "host_gestures"),
+            ("High Resolution Volume", "high_resolution_volume"),
         ]
 
         for text, setting_key in general_settings:
@@ -2,6 +2,7 @@ import customtkinter as ctk
 import threading
 import gui.app as app
 from utils.dpi_manager import DPIManager
+from utils.progress_reporter import ProgressReporter
 
 
 class UpdateProgressWindow:
@@ -111,16 +112,18 @@ class UpdateProgressWindow:
         try:
             self.update_status("Downloading update...")
             
-            def progress_callback(progress):
-                if not self.cancelled:
-                    self.window.after(0, lambda: self.update_progress(progress))
-            
             def cancellation_check():
                 return self.cancelled
             
-            download_path = self.version_manager.download_update(
-                self.update_info['download_url'], 
-                progress_callback,
+            reporter = ProgressReporter(
+                lambda func, *args: self.window.after(0, func, *args),
+                self.show_progress,
+                cancellation_check
+            )
+            
+            download_path = self.version_manager.download_best_update(
+                self.update_info,
+                reporter.report,
                 cancellation_check
             )
             
@@ -175,9 +178,13 @@ class UpdateProgressWindow:
     
     def update_progress(self, progress):
         """Update the progress bar."""
-        self.window.after(0, lambda: self.progress_bar.set(progress / 100))
-        self.window.after(0, lambda: self.progress_label.configure(text=f"{int(progress)}%"))
-    
+        self.window.after(0, self.show_progress, progress / 100, f"{int(progress)}%")
+
+    def show_progress(self, fraction, text):
+        """Set the progress bar and label together; runs on the Tk thread."""
+        self.progress_bar.set(fraction)
+        self.progress_label.configure(text=text)
+
     def show_error(self, message):
         """Show an error message."""
         self.cancel_button.configure(text="Close", command=self.close)
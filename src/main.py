@@ -1,13 +1,12 @@
+from utils.diagnostics import Diagnostics
 import customtkinter as ctk
 from gui.app import HushmixApp
 from utils.config_manager import ConfigManager
+from utils.instance_channel import InstanceChannel, send_command
 import ctypes
 from ctypes.wintypes import RECT, POINT
-import win32event
-import win32api
 import sys
 import tkinter.messagebox as messagebox
-import time
 
 
 def get_monitor_info():
@@ -86,168 +85,63 @@ def validate_window_position(x, y, window_width, window_height, monitors):
     return x, y
 
 
-_mutex_handle = None
+def get_forwarded_command(args):
+    """Build the command a second launch sends to the running instance.
 
-def check_single_instance():
-    """Check if another instance of the application is already running."""
-    global _mutex_handle
-    mutex_name = "Hushmix_SingleInstance_Mutex"
-    
-    try:
-        print(f"Attempting to create mutex: {mutex_name}")
-        
-        _mutex_handle = win32event.CreateMutex(None, False, mutex_name)
-        
-        last_error = win32api.GetLastError()
-        print(f"Last error after mutex creation: {last_error}")
-        
-        if last_error == 183:
-            print("Another instance of Hushmix is already running!")
-            return False
-        
-        print("Single instance check passed - no other instances found")
-        return True
-        
-    except Exception as e:
-        print(f"Error with mutex approach: {e}")
-    
-    try:
-        import os
-        import tempfile
-        
-        lock_file = os.path.join(tempfile.gettempdir(), "hushmix_single_instance.lock")
-        print(f"Trying file-based lock: {lock_file}")
-        
-        if os.path.exists(lock_file):
-            try:
-                with open(lock_file, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                import psutil
-                if psutil.pid_exists(pid):
-                    print(f"Another instance (PID: {pid}) is already running!")
-                    return False
-                else:
-                    os.remove(lock_file)
-                    print("Removed stale lock file")
-            except:
-                os.remove(lock_file)
-                print("Removed corrupted lock file")
-        
-        with open(lock_file, 'w') as f:
-            f.write(str(os.getpid()))
-        
-        print("File-based lock created successfully")
-        return True
-        
-    except Exception as file_error:
-        print(f"Error with file-based approach: {file_error}")
-        return True
-
-def check_single_instance_simple():
+    ``--profile NAME``, ``--set-volume CHANNEL LEVEL`` and ``--mute CHANNEL``
+    are forwarded as they are, and ``--diagnostics`` asks for the running
+    instance's diagnostics report; anything else just brings the window up.
+    """
     try:
-        import os
-        import tempfile
-        
-        lock_file = os.path.join(tempfile.gettempdir(), "hushmix_single_instance.lock")
-        
-        if os.path.exists(lock_file):
-            try:
-                with open(lock_file, 'r') as f:
-                    pid_str = f.read().strip()
-                    if pid_str.isdigit():
-                        pid = int(pid_str)
-                        
-                        import psutil
-                        if not psutil.pid_exists(pid):
-                            os.remove(lock_file)
-                            print(f"Removed stale lock file from dead process {pid}")
-                        else:
-                            if pid == os.getpid():
-                                print("Lock file belongs to this process - continuing")
-                                return True
-                            else:
-                                print(f"Process {pid} is still running - another instance detected!")
-                                return False
-                    else:
-                        os.remove(lock_file)
-                        print("Removed lock file with invalid PID")
-            except Exception as e:
-                os.remove(lock_file)
-                print(f"Removed corrupted lock file: {e}")
-        
-        try:
-            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            with os.fdopen(fd, 'w') as f:
-                f.write(str(os.getpid()))
-            return True
-        except OSError as e:
-            if e.errno == 17:  # File exists
-                try:
-                    with open(lock_file, 'r') as f:
-                        pid_str = f.read().strip()
-                        if pid_str.isdigit() and int(pid_str) == os.getpid():
-                            print("Lock file belongs to this process - continuing")
-                            return True
-                except:
-                    pass
-                print("Lock file already exists - another instance is running!")
-                return False
-            else:
-                print(f"Unexpected error: {e}")
-                return True
-        
-    except Exception as e:
-        print(f"Error in simple approach: {e}")
-        return True
+        if "--diagnostics" in args:
+            return {"command": "diagnostics"}
+        if "--profile" in args:
+            return {"command": "switch_profile", "profile": args[args.index("--profile") + 1]}
+        if "--set-volume" in args:
+            position = args.index("--set-volume")
+            return {
+                "command": "set_volume",
+                "channel": int(args[position + 1]),
+                "level": float(args[position + 2]),
+            }
+        if "--mute" in args:
+            return {"command": "mute", "channel": int(args[args.index("--mute") + 1])}
+    except (IndexError, ValueError) as e:
+        print(f"Error parsing command line: {e}")
+    return {"command": "show"}
+
+
+def print_startup_report(root, attempts=100):
+    """Print the startup profile once the mixer connection attempt has finished."""
+    if Diagnostics.has_phase("serial_connect") or attempts <= 0:
+        print(Diagnostics.format_startup_report())
+        report = Diagnostics.format_report()
+        if report:
+            print(report)
+    else:
+        root.after(100, lambda: print_startup_report(root, attempts - 1))
 
 
-def cleanup_mutex():
-    """Clean up the mutex handle and lock file when the application exits."""
-    global _mutex_handle
-    
-    if _mutex_handle:
-        try:
-            win32api.CloseHandle(_mutex_handle)
-            print("Mutex handle cleaned up")
-        except Exception as e:
-            print(f"Error cleaning up mutex: {e}")
-    
-    try:
-        import os
-        import tempfile
-        
-        lock_file = os.path.join(tempfile.gettempdir(), "hushmix_single_instance.lock")
-        if os.path.exists(lock_file):
-            try:
-                with open(lock_file, 'r') as f:
-                    pid_str = f.read().strip()
-                    if pid_str.isdigit():
-                        pid = int(pid_str)
-                        if pid == os.getpid():
-                            os.remove(lock_file)
-                            print("Lock file cleaned up")
-            except Exception as e:
-                print(f"Error reading lock file during cleanup: {e}")
-                try:
-                    os.remove(lock_file)
-                    print("Removed corrupted lock file during cleanup")
-                except:
-                    pass
-    except Exception as e:
-        print(f"Error cleaning up lock file: {e}")
-
 def main():
-    if not check_single_instance_simple():
+    Diagnostics.mark_phase("imports")
+
+    channel = InstanceChannel()
+    if not channel.acquire():
+        reply = send_command(get_forwarded_command(sys.argv[1:]))
+        if reply is not None:
+            if "text" in reply:
+                print(reply["text"])
+            sys.exit(0)
         try:
             messagebox.showerror("Hushmix", "Hushmix is already running!\n\nPlease close the existing instance before opening a new one.")
         except:
             print("ERROR: Hushmix is already running! Please close the existing instance before opening a new one.")
         sys.exit(1)
-    
-    time.sleep(0.1)
+
+    Diagnostics.mark_phase("instance_lock")
     
     settings = ConfigManager.load_settings()
+    Diagnostics.mark_phase("settings_load")
     dark_mode = settings.get("dark_mode", True)
     
     if dark_mode:
@@ -276,8 +170,12 @@ def main():
         position_y = primary_monitor['top'] + (primary_monitor['height'] - window_height) // 2
 
     root.geometry(f"+{position_x}+{position_y}")
+    Diagnostics.mark_phase("tk_init")
 
     app = HushmixApp(root)
+    app.instance_channel = channel
+    channel.serve(app.remote_control.handle_command)
+    Diagnostics.mark_phase("app_init")
     
     def show_window():
         if not app.settings_manager.get_setting("launch_in_tray"):
@@ -286,11 +184,13 @@ def main():
             root.attributes('-topmost', True)
             root.after_idle(lambda: root.attributes('-topmost', False))
             root.focus_force()
+        root.update_idletasks()
+        Diagnostics.mark_phase("first_frame")
     
     root.after_idle(lambda: root.after(10, show_window))
-    
-    import atexit
-    atexit.register(cleanup_mutex)
+
+    if "--startup-profile" in sys.argv:
+        root.after_idle(lambda: print_startup_report(root))
     
     root.mainloop()
 
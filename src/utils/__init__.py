@@ -1,6 +1,18 @@
-from .config_manager import ConfigManager
-from .icon_manager import IconManager
-from .version_manager import VersionManager
-from .enhanced_version_manager import EnhancedVersionManager
+__all__ = ['ConfigManager', 'IconManager', 'VersionManager', 'EnhancedVersionManager']
 
-__all__ = ['ConfigManager', 'IconManager', 'VersionManager', 'EnhancedVersionManager'] 
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the managers on first use, so modules like the settings store load on their own."""
+    if name == 'ConfigManager':
+        from .config_manager import ConfigManager
+        return ConfigManager
+    if name == 'IconManager':
+        from .icon_manager import IconManager
+        return IconManager
+    if name == 'VersionManager':
+        from .version_manager import VersionManager
+        return VersionManager
+    if name == 'EnhancedVersionManager':
+        from .enhanced_version_manager import EnhancedVersionManager
+        return EnhancedVersionManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,14 @@
-import winreg
+from . import registry
 
 
 def get_windows_accent_color():
     """Retrieve the Windows accent color from the registry."""
     try:
-        with winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\DWM"
-        ) as key:
-            accent_color = winreg.QueryValueEx(key, "ColorizationColor")[0]
-            blue = accent_color & 0xFF
-            green = (accent_color >> 8) & 0xFF
-            red = (accent_color >> 16) & 0xFF
-            return "#{:02x}{:02x}{:02x}".format(red, green, blue)
+        accent_color = registry.read_value(r"Software\Microsoft\Windows\DWM", "ColorizationColor")
+        blue = accent_color & 0xFF
+        green = (accent_color >> 8) & 0xFF
+        red = (accent_color >> 16) & 0xFF
+        return "#{:02x}{:02x}{:02x}".format(red, green, blue)
     except OSError as e:
         print(f"Error accessing registry: {e}")
     return "#2196F3"
@@ -1,12 +1,18 @@
+import copy
 import json
 import os
-import winreg
 import time
-import requests
+from . import registry
+from .settings_store import SettingsStore
+from .profile_model import SCHEMA_VERSION, migrate_profile_data
 
 
 class ConfigManager:
-    CONFIG_FILE = os.path.join(os.getenv("APPDATA"), "Hushmix", "settings.json")
+    CONFIG_FILE = os.path.join(os.getenv("APPDATA") or os.path.expanduser("~"), "Hushmix", "settings.json")
+    BACKUP_FILE = CONFIG_FILE + ".bak"
+    LOAD_ATTEMPTS = 3
+    # Seconds without changes before pending settings are written to disk.
+    FLUSH_DELAY = 1.0
     
     GLOBAL_SETTINGS = {
         "invert_volumes": False,
@@ -20,22 +26,43 @@ class ConfigManager:
         "update_check_interval": 1800,
         "skip_version": None,
         "last_update_check": None,
+        "host_gestures": False,
+        "double_click_window_ms": 300,
+        "hold_time_ms": 500,
+        "repeat_interval_ms": 0,
+        "fade_duration_ms": 150,
+        "high_resolution_volume": False,
+        "update_check_cache": None,
+        "exe_version_cache": None,
     }
     
     PROFILE_SETTINGS = {
-        "applications": [],
-        "mute_settings": [],
-        "mute_state": [],
+        "schema_version": SCHEMA_VERSION,
+        "channels": [],
+        "buttons": [],
     }
     
     DEFAULT_PROFILES = ["Profile 1", "Profile 2", "Profile 3", "Profile 4", "Profile 5"]
 
+    _store = None
+    # (store, store revision, migrated settings) from the last load_settings call.
+    _loaded = None
+
+    @staticmethod
+    def get_store():
+        """Get the shared in-memory settings store."""
+        if ConfigManager._store is None:
+            ConfigManager._store = SettingsStore(
+                ConfigManager.CONFIG_FILE, flush_delay=ConfigManager.FLUSH_DELAY
+            )
+        return ConfigManager._store
+
     @staticmethod
     def get_default_settings():
         """Get complete default settings structure."""
         profiles = {}
         for profile_name in ConfigManager.DEFAULT_PROFILES:
-            profiles[profile_name] = ConfigManager.PROFILE_SETTINGS.copy()
+            profiles[profile_name] = copy.deepcopy(ConfigManager.PROFILE_SETTINGS)
         
         return {
             "current_profile": "Profile 1",
@@ -45,32 +72,24 @@ class ConfigManager:
 
     @staticmethod
     def save_settings(settings):
-        """Save settings to JSON file."""
+        """Merge settings into the in-memory store and schedule a write."""
         try:
-            os.makedirs(os.path.dirname(ConfigManager.CONFIG_FILE), exist_ok=True)
-
-            existing_settings = {}
-            if os.path.exists(ConfigManager.CONFIG_FILE):
-                with open(ConfigManager.CONFIG_FILE, "r") as file:
-                    existing_settings = json.load(file)
+            store = ConfigManager._ensure_store_loaded()
 
-            if "profiles" not in existing_settings:
-                existing_settings["profiles"] = {}
+            with store.edit() as existing_settings:
+                if "profiles" not in existing_settings:
+                    existing_settings["profiles"] = {}
 
-            current_profile = settings.get("current_profile")
-            if current_profile not in existing_settings["profiles"]:
-                existing_settings["profiles"][current_profile] = {}
+                current_profile = settings.get("current_profile")
+                if current_profile is not None and current_profile not in existing_settings["profiles"]:
+                    existing_settings["profiles"][current_profile] = {}
 
-            for key, value in settings.items():
-                if key in ConfigManager.PROFILE_SETTINGS:
-                    existing_settings["profiles"][current_profile][key] = value
-                elif key in ConfigManager.GLOBAL_SETTINGS or key == "current_profile":
-                    existing_settings[key] = value
-
-            with open(ConfigManager.CONFIG_FILE, "w") as file:
-                json.dump(existing_settings, file, indent=4)
-
-            print(f"Settings successfully saved to {ConfigManager.CONFIG_FILE}")
+                for key, value in settings.items():
+                    if key in ConfigManager.PROFILE_SETTINGS:
+                        if current_profile is not None:
+                            existing_settings["profiles"][current_profile][key] = value
+                    elif key in ConfigManager.GLOBAL_SETTINGS or key == "current_profile":
+                        existing_settings[key] = value
 
         except Exception as e:
             print(f"Error saving settings: {e}")
@@ -78,92 +97,150 @@ class ConfigManager:
             traceback.print_exc()
 
     @staticmethod
-    def load_settings():
-        """Load settings from JSON file."""
-        try:
-            time.sleep(0.1)
+    def set_current_profile(name):
+        """Record the active profile in the in-memory store for the writer thread to save.
 
-            if not os.path.exists(ConfigManager.CONFIG_FILE):
-                print("No settings file found, using defaults")
-                return ConfigManager.get_default_settings()
+        Unlike ``save_settings`` this never checks the file on disk, so it is
+        cheap enough for a profile switch on the serial thread.
+        """
+        store = ConfigManager.get_store()
+        if not store.is_loaded():
+            ConfigManager.save_settings({"current_profile": name})
+            return
+        with store.edit() as settings:
+            settings["current_profile"] = name
+            settings.setdefault("profiles", {}).setdefault(name, {})
 
-            with open(ConfigManager.CONFIG_FILE, "r") as file:
-                settings = json.load(file)
+    @staticmethod
+    def _read_settings_file():
+        """Read the raw settings document from disk.
+
+        Reads are retried a bounded number of times; if the file stays
+        unreadable the last-known-good backup is used, then the defaults.
+        """
+        if not os.path.exists(ConfigManager.CONFIG_FILE):
+            print("No settings file found, using defaults")
+            return ConfigManager.get_default_settings()
+
+        last_error = None
+        for attempt in range(ConfigManager.LOAD_ATTEMPTS):
+            if attempt:
+                time.sleep(0.01 * 2 ** attempt)
+            try:
+                with open(ConfigManager.CONFIG_FILE, "r") as file:
+                    content = file.read()
+                settings = json.loads(content)
+                ConfigManager._write_backup(content)
+                return settings
+            except (OSError, ValueError) as e:
+                last_error = e
+
+        print(f"Error reading settings file: {last_error}")
 
-            if "profiles" not in settings:
-                settings["profiles"] = {}
-            
-            for profile_name in ConfigManager.DEFAULT_PROFILES:
-                if profile_name not in settings["profiles"]:
-                    settings["profiles"][profile_name] = ConfigManager.PROFILE_SETTINGS.copy()
-
-            current_profile = settings.get("current_profile", "Profile 1")
-            if current_profile not in settings["profiles"]:
-                settings["profiles"][current_profile] = ConfigManager.PROFILE_SETTINGS.copy()
-            
-            for profile_name in settings["profiles"]:
-                for key, default_value in ConfigManager.PROFILE_SETTINGS.items():
-                    if key not in settings["profiles"][profile_name]:
-                        settings["profiles"][profile_name][key] = default_value
-
-            for key, default_value in ConfigManager.GLOBAL_SETTINGS.items():
-                if key not in settings:
-                    settings[key] = default_value
-
-            profile_settings = settings["profiles"][current_profile]
-
-            return {
-                "current_profile": current_profile,
-                "profiles": settings["profiles"],
-                **profile_settings,
-                **{k: settings[k] for k in ConfigManager.GLOBAL_SETTINGS}
-            }
+        try:
+            with open(ConfigManager.BACKUP_FILE, "r") as file:
+                settings = json.load(file)
+            print(f"Recovered settings from backup {ConfigManager.BACKUP_FILE}")
+            return settings
+        except (OSError, ValueError) as e:
+            print(f"No usable settings backup, using defaults: {e}")
+            return ConfigManager.get_default_settings()
 
+    @staticmethod
+    def _write_backup(content):
+        """Keep a copy of the last settings file that parsed successfully."""
+        try:
+            if os.path.exists(ConfigManager.BACKUP_FILE):
+                with open(ConfigManager.BACKUP_FILE, "r") as file:
+                    if file.read() == content:
+                        return
+            SettingsStore._write_atomic(ConfigManager.BACKUP_FILE, content)
         except Exception as e:
-            time.sleep(1)
-            print(f"Error loading settings: {e}")
-            return ConfigManager.load_settings()
+            print(f"Error writing settings backup: {e}")
+
+    @staticmethod
+    def _ensure_store_loaded():
+        """Load the store from disk on first use or when the file changed externally."""
+        store = ConfigManager.get_store()
+        if store.is_stale():
+            signature = store.file_signature()
+            store.set_data(ConfigManager._read_settings_file(), signature)
+        return store
+
+    @staticmethod
+    def load_settings():
+        """Load settings from the in-memory store, reading the file only when it changed.
+
+        Profiles are migrated once per store revision and the result is
+        shared: each caller gets its own top-level dict, but must not mutate
+        the profile data inside it.
+        """
+        store = ConfigManager._ensure_store_loaded()
+        revision = store.revision
+        cached = ConfigManager._loaded
+        if cached is None or cached[0] is not store or cached[1] != revision:
+            cached = (store, revision, ConfigManager._migrate_settings(store.get_data()))
+            ConfigManager._loaded = cached
+        return dict(cached[2])
+
+    @staticmethod
+    def _migrate_settings(settings):
+        """Fill in defaults and bring every profile up to the current schema."""
+        if not isinstance(settings, dict):
+            print("Settings document is not an object, using defaults")
+            settings = ConfigManager.get_default_settings()
+
+        profiles = settings.setdefault("profiles", {})
+        for profile_name in ConfigManager.DEFAULT_PROFILES:
+            profiles.setdefault(profile_name, {})
+
+        current_profile = settings.get("current_profile", "Profile 1")
+        profiles.setdefault(current_profile, {})
+
+        for profile_name, profile_data in profiles.items():
+            profiles[profile_name] = migrate_profile_data(profile_data)
+
+        for key, default_value in ConfigManager.GLOBAL_SETTINGS.items():
+            if key not in settings:
+                settings[key] = default_value
+
+        return {
+            "current_profile": current_profile,
+            "profiles": profiles,
+            **{k: settings[k] for k in ConfigManager.GLOBAL_SETTINGS}
+        }
 
     @staticmethod
     def get_all_settings():
-        """Get all settings including profiles for advanced operations."""
-        return ConfigManager.load_settings()
+        """Get an editable copy of all settings including profiles for advanced operations."""
+        return copy.deepcopy(ConfigManager.load_settings())
 
     @staticmethod
     def save_all_settings(all_settings):
-        """Save complete settings structure including all profiles."""
+        """Replace the complete settings structure including all profiles."""
         try:
-            os.makedirs(os.path.dirname(ConfigManager.CONFIG_FILE), exist_ok=True)
-            
-            with open(ConfigManager.CONFIG_FILE, "w") as file:
-                json.dump(all_settings, file, indent=4)
-                
-            print(f"All settings successfully saved to {ConfigManager.CONFIG_FILE}")
-            
+            ConfigManager.get_store().replace(all_settings)
         except Exception as e:
             print(f"Error saving all settings: {e}")
             import traceback
             traceback.print_exc()
 
+    @staticmethod
+    def stop_settings_writer():
+        """Stop the background settings writer after writing any pending changes; used at exit."""
+        if ConfigManager._store is not None:
+            ConfigManager._store.stop()
+
     @staticmethod
     def toggle_auto_startup(enable, app_name="Hushmix", executable_path=None):
         """Toggle auto-startup in Windows registry."""
         try:
-            key = winreg.HKEY_CURRENT_USER
-            subkey = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
-
             if enable:
-                with winreg.OpenKey(key, subkey, 0, winreg.KEY_WRITE) as registry_key:
-                    winreg.SetValueEx(
-                        registry_key, app_name, 0, winreg.REG_SZ, executable_path
-                    )
+                registry.set_value(registry.RUN_KEY, app_name, executable_path)
                 print(f"Auto-startup enabled for {app_name}")
             else:
                 try:
-                    with winreg.OpenKey(key, subkey, 0, winreg.KEY_READ) as registry_key:
-                        winreg.QueryValueEx(registry_key, app_name)
-                    with winreg.OpenKey(key, subkey, 0, winreg.KEY_WRITE) as registry_key:
-                        winreg.DeleteValue(registry_key, app_name)
+                    registry.delete_value(registry.RUN_KEY, app_name)
                     print(f"Auto-startup disabled for {app_name}")
                 except FileNotFoundError:
                     print(f"Auto-startup was already disabled for {app_name}")
@@ -174,11 +251,7 @@ class ConfigManager:
     def is_auto_startup_enabled(app_name="Hushmix"):
         """Check if auto-startup is enabled."""
         try:
-            key = winreg.HKEY_CURRENT_USER
-            subkey = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
-            with winreg.OpenKey(key, subkey, 0, winreg.KEY_READ) as registry_key:
-                value, _ = winreg.QueryValueEx(registry_key, app_name)
-                return bool(value)
+            return bool(registry.read_value(registry.RUN_KEY, app_name))
         except FileNotFoundError:
             return False
         except Exception as e:
@@ -0,0 +1,218 @@
+import hashlib
+import lzma
+import os
+import struct
+import sys
+
+# A patch is an LZMA stream holding a header and a list of operations that
+# rebuild the target from the source: COPY a range of the source, or INSERT
+# bytes carried in the patch. The header records the SHA-256 of both files,
+# so a patch is only applied to the exact build it was made from and the
+# result is checked before it is used.
+MAGIC = b"HMXDELTA1"
+HEADER = struct.Struct("<32s32sQ")
+COPY = 1
+INSERT = 2
+END = 0
+COPY_ARGS = struct.Struct("<QI")
+INSERT_ARGS = struct.Struct("<I")
+
+BLOCK_SIZE = 32
+MAX_OP_LENGTH = 0xFFFFFFFF
+READ_SIZE = 1024 * 1024
+
+
+class PatchError(Exception):
+    """Raised when a patch does not fit the source or produces the wrong file."""
+
+
+def _sha256_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_SIZE), b""):
+            sha256.update(block)
+    return sha256.digest()
+
+
+def _match_length(source, source_offset, target, target_offset):
+    """Count how many bytes match going forward, comparing in blocks first."""
+    length = 0
+    limit = min(len(source) - source_offset, len(target) - target_offset, MAX_OP_LENGTH)
+    step = 4096
+    while length + step <= limit and (
+        source[source_offset + length:source_offset + length + step]
+        == target[target_offset + length:target_offset + length + step]
+    ):
+        length += step
+    while length < limit and source[source_offset + length] == target[target_offset + length]:
+        length += 1
+    return length
+
+
+def diff(source, target, block_size=BLOCK_SIZE):
+    """Work out the COPY/INSERT operations that turn ``source`` into ``target``.
+
+    Every aligned block of the source is indexed, then the target is scanned
+    byte by byte for those blocks. Each hit is grown in both directions into
+    one COPY and the bytes in between become INSERTs.
+    """
+    index = {}
+    for offset in range(0, len(source) - block_size + 1, block_size):
+        index.setdefault(source[offset:offset + block_size], offset)
+
+    operations = []
+    literal_start = 0
+    position = 0
+    end = len(target)
+
+    while position + block_size <= end:
+        offset = index.get(target[position:position + block_size])
+        if offset is None:
+            position += 1
+            continue
+
+        length = _match_length(source, offset, target, position)
+        back = 0
+        while (position - back > literal_start and offset - back > 0
+               and target[position - back - 1] == source[offset - back - 1]):
+            back += 1
+        offset -= back
+        position -= back
+        length += back
+
+        if position > literal_start:
+            operations.append((INSERT, target[literal_start:position]))
+
+        previous = operations[-1] if operations else None
+        if (previous and previous[0] == COPY and previous[1] + previous[2] == offset
+                and previous[2] + length <= MAX_OP_LENGTH):
+            operations[-1] = (COPY, previous[1], previous[2] + length)
+        else:
+            operations.append((COPY, offset, length))
+
+        position += length
+        literal_start = position
+
+    if literal_start < end:
+        operations.append((INSERT, target[literal_start:]))
+    return operations
+
+
+def make_patch(source_path, target_path, patch_path, block_size=BLOCK_SIZE):
+    """Write a patch that rebuilds ``target_path`` from ``source_path``."""
+    with open(source_path, "rb") as f:
+        source = f.read()
+    with open(target_path, "rb") as f:
+        target = f.read()
+
+    header = HEADER.pack(
+        hashlib.sha256(source).digest(), hashlib.sha256(target).digest(), len(target)
+    )
+    with lzma.open(patch_path, "wb") as patch:
+        patch.write(MAGIC + header)
+        for operation in diff(source, target, block_size):
+            if operation[0] == COPY:
+                patch.write(bytes([COPY]) + COPY_ARGS.pack(operation[1], operation[2]))
+            else:
+                data = operation[1]
+                for start in range(0, len(data), MAX_OP_LENGTH):
+                    chunk = data[start:start + MAX_OP_LENGTH]
+                    patch.write(bytes([INSERT]) + INSERT_ARGS.pack(len(chunk)))
+                    patch.write(chunk)
+        patch.write(bytes([END]))
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise PatchError("Patch is truncated")
+    return data
+
+
+def apply_patch(source_path, patch_path, output_path):
+    """Rebuild the target from ``source_path`` and a patch into ``output_path``.
+
+    The source must match the build the patch was made from, and the output
+    is hashed as it is written and checked against the patch header. Returns
+    the output's SHA-256 hex digest.
+    """
+    try:
+        with lzma.open(patch_path, "rb") as patch:
+            if _read_exact(patch, len(MAGIC)) != MAGIC:
+                raise PatchError("Not a Hushmix delta patch")
+            source_hash, target_hash, target_size = HEADER.unpack(_read_exact(patch, HEADER.size))
+
+            if _sha256_file(source_path) != source_hash:
+                raise PatchError("Patch was made for a different version")
+
+            sha256 = hashlib.sha256()
+            written = 0
+            with open(source_path, "rb") as source, open(output_path, "wb") as output:
+                while True:
+                    kind = _read_exact(patch, 1)[0]
+                    if kind == END:
+                        break
+
+                    if kind == COPY:
+                        offset, length = COPY_ARGS.unpack(_read_exact(patch, COPY_ARGS.size))
+                        source.seek(offset)
+                        while length:
+                            block = source.read(min(length, READ_SIZE))
+                            if not block:
+                                raise PatchError("Patch copies past the end of the source")
+                            output.write(block)
+                            sha256.update(block)
+                            written += len(block)
+                            length -= len(block)
+                    elif kind == INSERT:
+                        (length,) = INSERT_ARGS.unpack(_read_exact(patch, INSERT_ARGS.size))
+                        while length:
+                            block = _read_exact(patch, min(length, READ_SIZE))
+                            output.write(block)
+                            sha256.update(block)
+                            written += len(block)
+                            length -= len(block)
+                    else:
+                        raise PatchError(f"Unknown patch operation {kind}")
+
+                    if written > target_size:
+                        raise PatchError("Patch writes past the size of the update")
+    except (lzma.LZMAError, EOFError, struct.error) as e:
+        raise PatchError(f"Corrupt patch: {e}")
+
+    if written != target_size or sha256.digest() != target_hash:
+        raise PatchError("Patched file does not match the expected update")
+    return sha256.hexdigest()
+
+
+def main(argv=None):
+    """Command line for release builds: ``python -m utils.delta_patch make OLD NEW OUT``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m utils.delta_patch")
+    commands = parser.add_subparsers(dest="command", required=True)
+    make = commands.add_parser("make", help="write a patch that turns OLD into NEW")
+    make.add_argument("old")
+    make.add_argument("new")
+    make.add_argument("out")
+    apply = commands.add_parser("apply", help="rebuild NEW from OLD and a patch")
+    apply.add_argument("old")
+    apply.add_argument("patch")
+    apply.add_argument("out")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "make":
+            make_patch(args.old, args.new, args.out)
+            print(f"Wrote {args.out} ({os.path.getsize(args.out)} bytes, "
+                  f"{os.path.getsize(args.new)} bytes in the full build)")
+        else:
+            print(f"Wrote {args.out} (sha256 {apply_patch(args.old, args.patch, args.out)})")
+    except (OSError, PatchError) as e:
+        print(f"Error: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import threading
+import time
+
+
+class Diagnostics:
+    """Process-wide registry of timing samples and counters for troubleshooting."""
+
+    _lock = threading.Lock()
+    _timings = {}
+    _counters = {}
+    _start = time.perf_counter()
+    _phases = []
+
+    @staticmethod
+    def record_timing(name, seconds):
+        """Record one duration sample under the given name."""
+        with Diagnostics._lock:
+            stats = Diagnostics._timings.get(name)
+            if stats is None:
+                stats = {"count": 0, "last": 0.0, "max": 0.0, "total": 0.0}
+                Diagnostics._timings[name] = stats
+            stats["count"] += 1
+            stats["last"] = seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["total"] += seconds
+
+    @staticmethod
+    def increment(name, amount=1):
+        """Increase a named counter."""
+        with Diagnostics._lock:
+            Diagnostics._counters[name] = Diagnostics._counters.get(name, 0) + amount
+
+    @staticmethod
+    def get_report():
+        """Get a snapshot of all timings (in milliseconds) and counters."""
+        with Diagnostics._lock:
+            timings = {
+                name: {
+                    "count": stats["count"],
+                    "last_ms": stats["last"] * 1000,
+                    "max_ms": stats["max"] * 1000,
+                    "avg_ms": stats["total"] / stats["count"] * 1000,
+                }
+                for name, stats in Diagnostics._timings.items()
+            }
+            return {"timings": timings, "counters": dict(Diagnostics._counters)}
+
+    @staticmethod
+    def format_report():
+        """Format the current diagnostics as human-readable lines."""
+        report = Diagnostics.get_report()
+        lines = []
+        for name, stats in sorted(report["timings"].items()):
+            lines.append(
+                f"{name}: last {stats['last_ms']:.3f} ms, avg {stats['avg_ms']:.3f} ms, "
+                f"max {stats['max_ms']:.3f} ms ({stats['count']} samples)"
+            )
+        for name, value in sorted(report["counters"].items()):
+            lines.append(f"{name}: {value}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def mark_phase(name):
+        """Record that a startup phase finished, relative to when diagnostics were loaded."""
+        with Diagnostics._lock:
+            Diagnostics._phases.append((name, time.perf_counter() - Diagnostics._start))
+
+    @staticmethod
+    def has_phase(name):
+        with Diagnostics._lock:
+            return any(phase == name for phase, _ in Diagnostics._phases)
+
+    @staticmethod
+    def format_startup_report():
+        """Format startup phases with their end time and duration."""
+        with Diagnostics._lock:
+            phases = list(Diagnostics._phases)
+
+        lines = ["Startup profile:"]
+        previous = 0.0
+        for name, elapsed in phases:
+            lines.append(f"  {name:<16} {elapsed * 1000:8.1f} ms  (+{(elapsed - previous) * 1000:.1f} ms)")
+            previous = elapsed
+        return "\n".join(lines)
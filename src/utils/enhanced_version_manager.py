@@ -1,6 +1,4 @@
 import os
-import requests
-import pefile
 import sys
 import threading
 import time
@@ -11,11 +9,12 @@ from urllib.parse import urlparse
 import subprocess
 import tempfile
 import shutil
-from gui.version_window import VersionWindow
-from gui.update_progress_window import UpdateProgressWindow
+from utils.config_manager import ConfigManager
 
 
 class EnhancedVersionManager:
+    PROGRESS_REFRESH_RATE = 30
+
     def __init__(self, parent, settings_manager):
         self.root = parent
         self.settings_manager = settings_manager
@@ -37,6 +36,7 @@ class EnhancedVersionManager:
         self.check_interval = self.settings_manager.get_setting('update_check_interval', 1800)
         self.auto_check_enabled = self.settings_manager.get_setting('auto_check_updates', True)
         self.download_path = None
+        self.download_checksum = None
         
         self.start_version_check_thread(parent)
 
@@ -64,6 +64,32 @@ class EnhancedVersionManager:
                 print(f"Executable not found at: {exe_path}")
                 return None
 
+            # Reading the version resource needs pefile, so the result is
+            # kept until the executable changes.
+            stat = os.stat(exe_path)
+            cache = self.settings_manager.get_setting('exe_version_cache') or {}
+            if (cache.get('path') == exe_path and cache.get('mtime') == stat.st_mtime
+                    and cache.get('size') == stat.st_size):
+                return cache.get('version')
+
+            version = self.read_exe_version(exe_path)
+            if version is not None:
+                self.save_update_setting('exe_version_cache', {
+                    'path': exe_path,
+                    'mtime': stat.st_mtime,
+                    'size': stat.st_size,
+                    'version': version,
+                })
+            return version
+        except Exception as e:
+            print(f"Error reading version from executable: {e}")
+            return None
+
+    def read_exe_version(self, exe_path):
+        """Read the product version from an executable's version resource."""
+        try:
+            import pefile
+
             pe = pefile.PE(exe_path)
 
             for fileinfo in pe.FileInfo:
@@ -75,7 +101,12 @@ class EnhancedVersionManager:
                                 return "v" + product_version
         except Exception as e:
             print(f"Error reading version from executable: {e}")
-            return None
+        return None
+
+    def save_update_setting(self, key, value):
+        """Update a setting used by the updater and persist it."""
+        self.settings_manager.set_setting(key, value)
+        ConfigManager.save_settings({key: value})
 
     def get_update_info(self, source='github'):
         """Get update information from the specified source."""
@@ -83,14 +114,43 @@ class EnhancedVersionManager:
         if not source_config:
             raise ValueError(f"Unknown update source: {source}")
 
+        import requests
+
+        api_url = source_config['api_url']
+        cache = self.settings_manager.get_setting('update_check_cache') or {}
+        cached = cache.get(api_url)
+
+        # A conditional request is answered with an empty 304 while the
+        # release is unchanged, and the last parsed result is reused.
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            response = requests.get(source_config['api_url'], timeout=10)
+            response = requests.get(api_url, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                return cached['update_info']
             response.raise_for_status()
             
             if source == 'github':
-                return self._parse_github_response(response.json())
+                update_info = self._parse_github_response(response.json())
             elif source == 'custom_server':
-                return self._parse_custom_response(response.json())
+                update_info = self._parse_custom_response(response.json())
+
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                cache = dict(cache)
+                cache[api_url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'update_info': update_info,
+                }
+                self.save_update_setting('update_check_cache', cache)
+            return update_info
                 
         except requests.RequestException as e:
             print(f"Error checking for updates from {source}: {e}")
@@ -103,9 +163,20 @@ class EnhancedVersionManager:
             'download_url': f"{self.update_sources['github']['download_base']}/{data['tag_name']}/Hushmix.exe",
             'release_notes': data.get('body', ''),
             'published_at': data.get('published_at', ''),
-            'size': None
+            'size': None,
+            'deltas': self._parse_github_deltas(data),
         }
 
+    def _parse_github_deltas(self, data):
+        """Find delta patch assets, named like ``Hushmix-v1.2.0-to-v1.3.0.hmxdelta``."""
+        deltas = {}
+        suffix = f"-to-{data['tag_name']}.hmxdelta"
+        for asset in data.get('assets', []):
+            name = asset.get('name', '')
+            if name.startswith('Hushmix-') and name.endswith(suffix):
+                deltas[name[len('Hushmix-'):-len(suffix)]] = asset.get('browser_download_url')
+        return deltas
+
     def _parse_custom_response(self, data):
         """Parse custom server response."""
         return {
@@ -114,7 +185,8 @@ class EnhancedVersionManager:
             'release_notes': data.get('release_notes', ''),
             'published_at': data.get('published_at', ''),
             'size': data.get('size'),
-            'checksum': data.get('checksum')
+            'checksum': data.get('checksum'),
+            'deltas': data.get('deltas', {}),
         }
 
     def check_for_updates(self, parent):
@@ -146,52 +218,102 @@ class EnhancedVersionManager:
 
     def show_update_dialog(self, parent, update_info):
         """Show update dialog with enhanced options."""
+        from gui.version_window import VersionWindow
+
         VersionWindow(update_info['version'], parent, update_info, self, self.settings_manager)
 
-    def download_update(self, download_url, progress_callback=None, cancellation_check=None):
-        """Download update with progress tracking."""
+    def get_download_path(self, download_url, suffix='.exe'):
+        """Get a stable temp path for an update, so an interrupted download can resume."""
+        url_hash = hashlib.sha1(download_url.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(tempfile.gettempdir(), f"Hushmix_update_{url_hash}{suffix}")
+
+    def download_best_update(self, update_info, progress_callback=None, cancellation_check=None):
+        """Download an update, as a delta patch against the running version when one is published.
+
+        Falls back to the full download when there is no patch for this
+        version or the patch cannot be applied.
+        """
+        deltas = update_info.get('deltas') or {}
+        delta_url = deltas.get(self.get_current_version_from_exe())
+        if delta_url and getattr(sys, "frozen", False):
+            path = self.download_delta_update(delta_url, progress_callback, cancellation_check)
+            if path or (cancellation_check and cancellation_check()):
+                return path
+            print("Delta update failed, downloading the full update")
+
+        return self.download_update(update_info['download_url'], progress_callback, cancellation_check)
+
+    def download_delta_update(self, delta_url, progress_callback=None, cancellation_check=None):
+        """Download a delta patch and rebuild the new executable from the running one."""
+        from utils.delta_patch import apply_patch, PatchError
+
+        patch_path = self.download_update(
+            delta_url, progress_callback, cancellation_check, suffix='.hmxdelta'
+        )
+        if not patch_path:
+            return None
+
+        output_path = self.get_download_path(delta_url)
         try:
-            response = requests.get(download_url, stream=True, timeout=30)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded_size = 0
-            
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.exe') as temp_file:
-                self.download_path = temp_file.name
-                
-                for chunk in response.iter_content(chunk_size=8192):
-                    if cancellation_check and cancellation_check():
-                        print("Download cancelled by user")
-                        if self.download_path and os.path.exists(self.download_path):
-                            os.unlink(self.download_path)
-                        return None
-                    
-                    if chunk:
-                        temp_file.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        if progress_callback and total_size > 0:
-                            progress = (downloaded_size / total_size) * 100
-                            progress_callback(progress)
-                            
-            return self.download_path
-            
+            self.download_checksum = apply_patch(sys.executable, patch_path, output_path)
+        except (PatchError, OSError) as e:
+            print(f"Error applying delta update: {e}")
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+            return None
+        finally:
+            if os.path.exists(patch_path):
+                os.unlink(patch_path)
+
+        self.download_path = output_path
+        return output_path
+
+    def download_update(self, download_url, progress_callback=None, cancellation_check=None, suffix='.exe'):
+        """Download update with progress tracking.
+
+        ``progress_callback(downloaded, total, rate, eta)`` is called at most
+        PROGRESS_REFRESH_RATE times a second with byte counts, bytes per second
+        and seconds left; ``total``, ``rate`` and ``eta`` may be None. A
+        cancelled or failed download keeps its partial file and resumes from
+        there next time.
+        """
+        from utils.update_downloader import UpdateDownloader, DownloadCancelled, TransferRate
+
+        transfer_rate = TransferRate()
+
+        def report_progress(downloaded, total):
+            if progress_callback:
+                rate, eta = transfer_rate.update(downloaded, total)
+                progress_callback(downloaded, total, rate, eta)
+
+        path = self.get_download_path(download_url, suffix)
+        try:
+            downloader = UpdateDownloader(progress_interval=1 / self.PROGRESS_REFRESH_RATE)
+            self.download_checksum = downloader.download(
+                download_url, path, report_progress, cancellation_check
+            )
+        except DownloadCancelled:
+            print("Download cancelled by user")
+            return None
         except Exception as e:
             print(f"Error downloading update: {e}")
-            if self.download_path and os.path.exists(self.download_path):
-                os.unlink(self.download_path)
             return None
 
+        self.download_path = path
+        return path
+
     def verify_download(self, file_path, expected_checksum=None):
         """Verify downloaded file integrity."""
         if not expected_checksum:
             return True
             
         try:
-            with open(file_path, 'rb') as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-            return file_hash == expected_checksum
+            if file_path == self.download_path and self.download_checksum:
+                file_hash = self.download_checksum
+            else:
+                from utils.update_downloader import file_sha256
+                file_hash = file_sha256(file_path)
+            return file_hash.lower() == expected_checksum.lower()
         except Exception as e:
             print(f"Error verifying download: {e}")
             return False
@@ -0,0 +1,236 @@
+import hmac
+import json
+import os
+import secrets
+import socket
+import threading
+from utils.settings_store import SettingsStore
+
+HOST = "127.0.0.1"
+# The Local\ namespace makes the mutex per Windows session, so another user
+# signed in through fast user switching or RDP gets their own instance.
+MUTEX_NAME = "Local\\Hushmix_SingleInstance_Mutex"
+MAX_LINE_SIZE = 64 * 1024
+
+
+def get_session_id():
+    """Get the Windows session id of this process, or 0 where there is none."""
+    try:
+        import ctypes
+
+        session = ctypes.c_ulong()
+        if ctypes.windll.kernel32.ProcessIdToSessionId(os.getpid(), ctypes.byref(session)):
+            return session.value
+    except (AttributeError, OSError):
+        pass
+    return 0
+
+
+def get_info_path():
+    """Get the per-user, per-session file that holds the running instance's port and token."""
+    base = os.getenv("APPDATA") or os.path.expanduser("~")
+    return os.path.join(base, "Hushmix", f"instance-{get_session_id()}.json")
+
+
+class InstanceChannel:
+    """Single-instance guard and authenticated command channel for this session.
+
+    The first instance holds a session-local mutex and listens on a random
+    localhost port. It writes the port and a random token to a file in the
+    user's profile, so only processes of the same user can reach it. A second
+    launch finds the mutex taken and forwards its command to the running
+    instance instead.
+
+    A connection has to open with ``{"token": ...}``; otherwise it is closed
+    without a reply, so every message the handler sees comes from a client
+    that knows the token. Messages after that are newline-delimited JSON,
+    passed to ``handler(message)`` and answered with one JSON line. A handler
+    may instead return a generator, whose items are streamed to the client
+    until it disconnects. The first line that is not valid JSON closes the
+    connection, so a browser request aimed at the port never reaches the
+    handler.
+    """
+
+    def __init__(self, info_path=None, mutex_name=MUTEX_NAME):
+        self.info_path = info_path or get_info_path()
+        self.mutex_name = mutex_name
+        self.handler = None
+        self.token = None
+        self.port = None
+        self._mutex = None
+        self._server = None
+        self._running = False
+
+    def acquire(self):
+        """Claim this session's instance. Returns False if another instance already holds it."""
+        if not self._acquire_mutex():
+            print("Another instance of Hushmix is already running!")
+            return False
+
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if hasattr(socket, "SO_EXCLUSIVEADDRUSE"):
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        try:
+            server.bind((HOST, 0))
+            server.listen(8)
+        except OSError as e:
+            print(f"Error opening instance channel: {e}")
+            server.close()
+            return True
+
+        self._server = server
+        self.port = server.getsockname()[1]
+        self.token = secrets.token_hex(16)
+        try:
+            SettingsStore._write_atomic(self.info_path, json.dumps({
+                "port": self.port,
+                "token": self.token,
+                "pid": os.getpid(),
+            }))
+        except OSError as e:
+            print(f"Error writing instance channel info: {e}")
+        return True
+
+    def _acquire_mutex(self):
+        """Take the session mutex. Without pywin32, ask the last recorded instance instead."""
+        try:
+            import win32api
+            import win32event
+            import winerror
+        except ImportError:
+            connection = connect(self.info_path)
+            if connection is None:
+                return True
+            connection.close()
+            return False
+
+        self._mutex = win32event.CreateMutex(None, False, self.mutex_name)
+        return win32api.GetLastError() != winerror.ERROR_ALREADY_EXISTS
+
+    def serve(self, handler):
+        """Start answering commands with ``handler(message) -> reply``."""
+        if self._server is None:
+            return
+        self.handler = handler
+        self._running = True
+        threading.Thread(target=self._accept_loop, daemon=True).start()
+
+    def _accept_loop(self):
+        while self._running:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve_client, args=(connection,), daemon=True).start()
+
+    def authenticate(self, line):
+        """Check a connection's opening line for this instance's token."""
+        try:
+            token = json.loads(line).get("token")
+        except (ValueError, AttributeError):
+            return False
+        return isinstance(token, str) and hmac.compare_digest(token, self.token)
+
+    def _serve_client(self, connection):
+        try:
+            with connection, connection.makefile("rb") as reader:
+                if not self.authenticate(reader.readline(MAX_LINE_SIZE)):
+                    return
+                connection.sendall(b'{"ok": true}\n')
+
+                while True:
+                    line = reader.readline(MAX_LINE_SIZE)
+                    if not line:
+                        return
+                    if not line.strip():
+                        continue
+                    try:
+                        message = json.loads(line)
+                    except ValueError:
+                        return
+
+                    reply = self.handle_message(message)
+                    if isinstance(reply, (dict, list)):
+                        connection.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+                        continue
+
+                    try:
+                        for item in reply:
+                            connection.sendall(json.dumps(item).encode("utf-8") + b"\n")
+                    finally:
+                        reply.close()
+                    return
+        except OSError:
+            pass
+        except Exception as e:
+            print(f"Error serving instance channel client: {e}")
+
+    def handle_message(self, message):
+        """Run one decoded message through the handler."""
+        try:
+            return self.handler(message)
+        except Exception as e:
+            print(f"Error handling command {message!r}: {e}")
+            return {"ok": False, "error": str(e)}
+
+    def close(self):
+        self._running = False
+        if self._server:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+            self._server = None
+            try:
+                with open(self.info_path, "r") as f:
+                    owner = json.load(f).get("pid")
+                if owner == os.getpid():
+                    os.remove(self.info_path)
+            except (OSError, ValueError, AttributeError):
+                pass
+        if self._mutex:
+            try:
+                import win32api
+
+                win32api.CloseHandle(self._mutex)
+            except Exception as e:
+                print(f"Error releasing instance mutex: {e}")
+            self._mutex = None
+
+
+def connect(info_path=None, timeout=2.0):
+    """Open an authenticated connection to the running instance, or return None."""
+    try:
+        with open(info_path or get_info_path(), "r") as f:
+            info = json.load(f)
+        connection = socket.create_connection((HOST, int(info["port"])), timeout=timeout)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    try:
+        connection.sendall(json.dumps({"token": info.get("token")}).encode("utf-8") + b"\n")
+        reply = connection.makefile("rb").readline(MAX_LINE_SIZE)
+        if reply and json.loads(reply).get("ok"):
+            return connection
+    except (OSError, ValueError, AttributeError):
+        pass
+    connection.close()
+    return None
+
+
+def send_command(message, info_path=None, timeout=2.0):
+    """Send one command to the running instance and return its reply, or None."""
+    connection = connect(info_path, timeout)
+    if connection is None:
+        print("Could not reach the running instance")
+        return None
+
+    try:
+        with connection:
+            connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            with connection.makefile("rb") as reader:
+                line = reader.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError) as e:
+        print(f"Error sending command to running instance: {e}")
+        return None
@@ -0,0 +1,237 @@
+SCHEMA_VERSION = 2
+
+DEFAULT_CHANNEL_COUNT = 7
+DEFAULT_BUTTON_COUNT = 5
+
+# Schema 1 stored every button setting as its own list, indexed by button.
+LEGACY_BUTTON_FIELDS = {
+    "mute_settings": "mute_enabled",
+    "mute_button_modes": "mute_mode",
+    "app_launch_enabled": "app_launch_enabled",
+    "app_launch_paths": "app_launch_path",
+    "app_button_modes": "app_mode",
+    "keyboard_shortcut_enabled": "shortcut_enabled",
+    "keyboard_shortcuts": "shortcut",
+    "shortcut_button_modes": "shortcut_mode",
+    "media_control_enabled": "media_enabled",
+    "media_control_actions": "media_action",
+    "media_control_button_modes": "media_mode",
+}
+
+
+class _FrozenConfig:
+    """Immutable record whose fields and defaults come from ``DEFAULTS``."""
+
+    __slots__ = ()
+    DEFAULTS = {}
+
+    def __init__(self, **values):
+        for field, default in self.DEFAULTS.items():
+            object.__setattr__(self, field, values.get(field, default))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, cannot set '{key}'")
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(tuple(self.to_dict().values()))
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from a dict, ignoring unknown keys."""
+        return cls(**{key: data[key] for key in cls.DEFAULTS if key in data})
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.DEFAULTS}
+
+    def replace(self, **changes):
+        """Return a copy with the given fields changed."""
+        values = self.to_dict()
+        values.update(changes)
+        return type(self)(**values)
+
+
+class ChannelConfig(_FrozenConfig):
+    """Settings for one slider channel."""
+
+    DEFAULTS = {
+        "application": "",
+        "muted": False,
+        "curve": "linear",
+        "curve_points": "",
+    }
+    __slots__ = tuple(DEFAULTS)
+
+
+class ButtonConfig(_FrozenConfig):
+    """Settings for the button under one slider channel."""
+
+    DEFAULTS = {
+        "mute_enabled": True,
+        "mute_mode": "Click",
+        "app_launch_enabled": False,
+        "app_launch_path": "",
+        "app_mode": "Click",
+        "app_focus_existing": False,
+        "shortcut_enabled": False,
+        "shortcut": "",
+        "shortcut_mode": "Click",
+        "shortcut_delay_ms": 0,
+        "media_enabled": False,
+        "media_action": "Play/Pause",
+        "media_mode": "Click",
+        "profile_enabled": False,
+        "profile_action": "Next Profile",
+        "profile_mode": "Click",
+        "group_enabled": False,
+        "group_action": "Mute All",
+        "group_mode": "Click",
+    }
+    __slots__ = tuple(DEFAULTS)
+
+
+DEFAULT_CHANNEL = ChannelConfig()
+DEFAULT_BUTTON = ButtonConfig()
+
+# Press codes reported by the firmware for each button mode.
+PRESS_CODES = {"Click": 1, "Hold": 2, "Double Click": 3}
+
+# Button actions in dispatch order: (action, enabled field, required field, mode field).
+BUTTON_ACTIONS = (
+    ("mute", "mute_enabled", None, "mute_mode"),
+    ("app_launch", "app_launch_enabled", "app_launch_path", "app_mode"),
+    ("shortcut", "shortcut_enabled", "shortcut", "shortcut_mode"),
+    ("media", "media_enabled", "media_action", "media_mode"),
+    ("profile", "profile_enabled", "profile_action", "profile_mode"),
+    ("group", "group_enabled", "group_action", "group_mode"),
+)
+
+
+def build_dispatch_table(buttons):
+    """Map (button index, press code) to the tuple of actions bound to it.
+
+    Only configured presses get an entry, so an unbound press is a single
+    failed dict lookup.
+    """
+    table = {}
+    for index, button in enumerate(buttons):
+        for action, enabled_field, required_field, mode_field in BUTTON_ACTIONS:
+            if not getattr(button, enabled_field):
+                continue
+            if required_field and not getattr(button, required_field):
+                continue
+            code = PRESS_CODES.get(getattr(button, mode_field))
+            if code is None:
+                continue
+            table.setdefault((index, code), []).append(action)
+    return {key: tuple(actions) for key, actions in table.items()}
+
+
+class Profile:
+    """Immutable snapshot of a single profile's settings.
+
+    A profile can be shared between threads and swapped in as the active
+    profile without copying.
+    """
+
+    __slots__ = ("name", "channels", "buttons")
+
+    def __init__(self, name, channels=(), buttons=()):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "channels", tuple(channels))
+        object.__setattr__(self, "buttons", tuple(buttons))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Profile is immutable, cannot set '{key}'")
+
+    def __repr__(self):
+        return f"Profile({self.name!r})"
+
+    @property
+    def applications(self):
+        return tuple(channel.application for channel in self.channels)
+
+    @property
+    def mute_state(self):
+        return tuple(channel.muted for channel in self.channels)
+
+    def channel(self, index):
+        """Get a channel's settings, or the defaults if it is not configured."""
+        if 0 <= index < len(self.channels):
+            return self.channels[index]
+        return DEFAULT_CHANNEL
+
+    def button(self, index):
+        """Get a button's settings, or the defaults if it is not configured."""
+        if 0 <= index < len(self.buttons):
+            return self.buttons[index]
+        return DEFAULT_BUTTON
+
+    def replace(self, **changes):
+        """Return a copy with the given fields changed."""
+        return Profile(
+            changes.get("name", self.name),
+            changes.get("channels", self.channels),
+            changes.get("buttons", self.buttons),
+        )
+
+    @classmethod
+    def from_dict(cls, name, data):
+        """Build a profile from its settings.json representation, migrating if needed."""
+        data = migrate_profile_data(data)
+        return cls(
+            name,
+            [ChannelConfig.from_dict(channel) for channel in data["channels"]],
+            [ButtonConfig.from_dict(button) for button in data["buttons"]],
+        )
+
+    def to_dict(self):
+        """Return the settings.json representation of the profile."""
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "channels": [channel.to_dict() for channel in self.channels],
+            "buttons": [button.to_dict() for button in self.buttons],
+        }
+
+
+def migrate_profile_data(data):
+    """Convert a profile dict from any older schema to the current one."""
+    data = dict(data or {})
+    version = data.get("schema_version", 1)
+
+    if version >= SCHEMA_VERSION:
+        data.setdefault("channels", [])
+        data.setdefault("buttons", [])
+        return data
+
+    applications = data.get("applications") or []
+    mute_state = data.get("mute_state") or []
+    channels = [
+        {
+            "application": application,
+            "muted": bool(mute_state[i]) if i < len(mute_state) else False,
+        }
+        for i, application in enumerate(applications)
+    ]
+
+    button_count = max(len(data.get(key) or []) for key in LEGACY_BUTTON_FIELDS)
+    buttons = []
+    for i in range(button_count):
+        button = {}
+        for legacy_key, field in LEGACY_BUTTON_FIELDS.items():
+            values = data.get(legacy_key) or []
+            if i < len(values):
+                button[field] = values[i]
+        buttons.append(button)
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "channels": channels,
+        "buttons": buttons,
+    }
@@ -0,0 +1,54 @@
+import threading
+
+
+def format_progress(downloaded, total, rate, eta):
+    """Describe download progress, e.g. ``45% - 18.0 of 40.0 MB - 5.2 MB/s - 4 s left``."""
+    megabyte = 1024 * 1024
+    parts = []
+    if total:
+        parts.append(f"{int(downloaded / total * 100)}%")
+        parts.append(f"{downloaded / megabyte:.1f} of {total / megabyte:.1f} MB")
+    else:
+        parts.append(f"{downloaded / megabyte:.1f} MB")
+    if rate:
+        parts.append(f"{rate / megabyte:.1f} MB/s")
+    if eta is not None:
+        parts.append(f"{int(eta + 0.5)} s left")
+    return " - ".join(parts)
+
+
+class ProgressReporter:
+    """Passes download progress from a worker thread to a progress bar on the UI thread.
+
+    ``schedule(func, *args)`` queues a call on the UI thread, such as a
+    window's ``after(0, ...)``, and ``show(fraction, text)`` updates the bar
+    there. At most one update is queued at a time: reports that arrive while
+    one is waiting only replace the values it will show, so a busy UI thread
+    never falls behind the download.
+    """
+
+    def __init__(self, schedule, show, cancelled=None):
+        self.schedule = schedule
+        self.show = show
+        self.cancelled = cancelled
+        self._lock = threading.Lock()
+        self._latest = None
+        self._pending = False
+
+    def report(self, downloaded, total, rate=None, eta=None):
+        """Progress callback for ``download_update``; safe to call from any thread."""
+        if self.cancelled and self.cancelled():
+            return
+        fraction = downloaded / total if total else 0
+        with self._lock:
+            self._latest = (fraction, format_progress(downloaded, total, rate, eta))
+            if self._pending:
+                return
+            self._pending = True
+        self.schedule(self._show_latest)
+
+    def _show_latest(self):
+        with self._lock:
+            latest = self._latest
+            self._pending = False
+        self.show(*latest)
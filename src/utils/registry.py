@@ -0,0 +1,38 @@
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+RUN_KEY = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Run"
+
+
+def _require_winreg():
+    if winreg is None:
+        raise OSError("The Windows registry is not available on this platform")
+
+
+def read_value(subkey, name):
+    """Read a value under HKEY_CURRENT_USER.
+
+    Raises FileNotFoundError when the key or value does not exist, which is
+    also what callers see on platforms without a registry.
+    """
+    if winreg is None:
+        raise FileNotFoundError(f"No registry value {name}")
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_READ) as key:
+        value, _ = winreg.QueryValueEx(key, name)
+        return value
+
+
+def set_value(subkey, name, value):
+    """Write a string value under HKEY_CURRENT_USER."""
+    _require_winreg()
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_WRITE) as key:
+        winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
+
+
+def delete_value(subkey, name):
+    """Delete a value under HKEY_CURRENT_USER; raises FileNotFoundError if it is missing."""
+    _require_winreg()
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, subkey, 0, winreg.KEY_WRITE) as key:
+        winreg.DeleteValue(key, name)
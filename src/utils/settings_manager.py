@@ -1,4 +1,4 @@
-import customtkinter as ctk
+import tkinter
 import sys
 from .config_manager import ConfigManager
 
@@ -12,11 +12,13 @@ class SettingsManager:
     def _setup_settings_vars(self):
         """Setup all settings variables with their default values."""
         self.settings_vars.update({
-            "invert_volumes": ctk.BooleanVar(value=False),
-            "auto_startup": ctk.BooleanVar(value=False),
-            "dark_mode": ctk.BooleanVar(value=True),
-            "launch_in_tray": ctk.BooleanVar(value=False),
-            "auto_check_updates": ctk.BooleanVar(value=True),
+            "invert_volumes": tkinter.BooleanVar(value=False),
+            "auto_startup": tkinter.BooleanVar(value=False),
+            "dark_mode": tkinter.BooleanVar(value=True),
+            "launch_in_tray": tkinter.BooleanVar(value=False),
+            "auto_check_updates": tkinter.BooleanVar(value=True),
+            "host_gestures": tkinter.BooleanVar(value=False),
+            "high_resolution_volume": tkinter.BooleanVar(value=False),
         })
         
         self.settings_vars.update({
@@ -26,21 +28,19 @@ class SettingsManager:
             "update_check_interval": 1800,
             "skip_version": None,
             "last_update_check": None,
-        })
-        
-        self.settings_vars.update({
-            "applications": [],
-            "mute_settings": [],
-            "mute_state": [],
-            "app_launch_enabled": [],
-            "app_launch_paths": [],
+            "double_click_window_ms": 300,
+            "hold_time_ms": 500,
+            "repeat_interval_ms": 0,
+            "fade_duration_ms": 150,
+            "update_check_cache": None,
+            "exe_version_cache": None,
         })
     
     def get_setting(self, key, default=None):
         """Get a setting value."""
         if key in self.settings_vars:
             var = self.settings_vars[key]
-            if hasattr(var, 'get'):
+            if isinstance(var, tkinter.Variable):
                 return var.get()
             return var
         return default
@@ -49,7 +49,7 @@ class SettingsManager:
         """Set a setting value."""
         if key in self.settings_vars:
             var = self.settings_vars[key]
-            if hasattr(var, 'set'):
+            if isinstance(var, tkinter.Variable):
                 var.set(value)
             else:
                 self.settings_vars[key] = value
@@ -58,15 +58,13 @@ class SettingsManager:
         """Load all settings from config file."""
         settings = ConfigManager.load_settings()
         
-        for key in ["invert_volumes", "auto_startup", "dark_mode", "launch_in_tray", "auto_check_updates", "window_x", "window_y"]:
+        for key in ["invert_volumes", "auto_startup", "dark_mode", "launch_in_tray", "auto_check_updates", "host_gestures", "high_resolution_volume", "window_x", "window_y"]:
             if key in settings:
                 self.set_setting(key, settings[key])
         
-        for key in ["update_source", "update_check_interval", "skip_version", "last_update_check"]:
-            if key in settings:
-                self.settings_vars[key] = settings[key]
-        
-        for key in ["applications", "mute_settings", "mute_state", "app_launch_enabled", "app_launch_paths"]:
+        for key in ["update_source", "update_check_interval", "skip_version", "last_update_check",
+                    "double_click_window_ms", "hold_time_ms", "repeat_interval_ms", "fade_duration_ms",
+                    "update_check_cache", "exe_version_cache"]:
             if key in settings:
                 self.settings_vars[key] = settings[key]
         
@@ -81,10 +79,12 @@ class SettingsManager:
             "current_profile": self.settings_vars.get("current_profile", "Profile 1"),
         }
         
-        for key in ["invert_volumes", "auto_startup", "dark_mode", "launch_in_tray", "auto_check_updates", "window_x", "window_y"]:
+        for key in ["invert_volumes", "auto_startup", "dark_mode", "launch_in_tray", "auto_check_updates", "host_gestures", "high_resolution_volume", "window_x", "window_y"]:
             settings[key] = self.get_setting(key)
         
-        for key in ["update_source", "update_check_interval", "skip_version", "last_update_check"]:
+        for key in ["update_source", "update_check_interval", "skip_version", "last_update_check",
+                    "double_click_window_ms", "hold_time_ms", "repeat_interval_ms", "fade_duration_ms",
+                    "update_check_cache", "exe_version_cache"]:
             settings[key] = self.settings_vars[key]
         
         ConfigManager.toggle_auto_startup(
@@ -97,15 +97,13 @@ class SettingsManager:
         """Get all settings as a dictionary."""
         all_settings = {}
         
-        for key in ["invert_volumes", "auto_startup", "dark_mode", "launch_in_tray", "auto_check_updates", "window_x", "window_y"]:
+        for key in ["invert_volumes", "auto_startup", "dark_mode", "launch_in_tray", "auto_check_updates", "host_gestures", "high_resolution_volume", "window_x", "window_y"]:
             all_settings[key] = self.get_setting(key)
 
-        for key in ["update_source", "update_check_interval", "skip_version", "last_update_check"]:
+        for key in ["update_source", "update_check_interval", "skip_version", "last_update_check",
+                    "double_click_window_ms", "hold_time_ms", "repeat_interval_ms", "fade_duration_ms",
+                    "update_check_cache", "exe_version_cache"]:
             all_settings[key] = self.settings_vars[key]
-
-        for key in ["applications", "mute_settings", "mute_state", "app_launch_enabled", "app_launch_paths"]:
-            if key in self.settings_vars:
-                all_settings[key] = self.settings_vars[key]
         
         all_settings["current_profile"] = self.settings_vars.get("current_profile", "Profile 1")
         
@@ -0,0 +1,184 @@
+import copy
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+
+class SettingsStore:
+    """In-memory settings document that persists changes in the background.
+
+    The store is the authority at runtime: readers get copies of the in-memory
+    document and writers mutate it under a lock and mark it dirty. A writer
+    thread waits until no further changes arrive for ``flush_delay`` seconds
+    and then writes the whole document with write-to-temp, fsync and an atomic
+    rename, so a crash mid-write never leaves a torn ``settings.json`` behind.
+    """
+
+    def __init__(self, path, flush_delay=0.25):
+        self.path = path
+        self.flush_delay = flush_delay
+        self._data = None
+        self._lock = threading.RLock()
+        # Held from snapshot to signature so an older snapshot never lands last.
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._signature = None
+        self._generation = 0
+        # Bumped on every change to the in-memory document, including reloads.
+        self.revision = 0
+        self._last_change = 0.0
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._writer = None
+        self._running = True
+
+        self.save_count = 0
+        self.last_save_duration = None
+        self.max_save_duration = 0.0
+
+    def is_loaded(self):
+        """Return True once a document has been placed in the store."""
+        return self._data is not None
+
+    def set_data(self, data, signature=None):
+        """Replace the in-memory document without scheduling a write.
+
+        ``signature`` is the file signature the document was read from, used by
+        ``is_stale`` to notice edits made to the file outside the app.
+        """
+        with self._lock:
+            self._data = data
+            self._signature = signature
+            self.revision += 1
+
+    def file_signature(self):
+        """Return the (mtime, size) signature of the file on disk, or None."""
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def is_stale(self):
+        """Return True if the file changed on disk since it was last read or written."""
+        with self._lock:
+            if self._data is None:
+                return True
+            if self._dirty:
+                return False
+            return self.file_signature() != self._signature
+
+    def get_data(self):
+        """Return a deep copy of the in-memory document."""
+        with self._lock:
+            return copy.deepcopy(self._data)
+
+    @contextmanager
+    def edit(self):
+        """Yield the live document for mutation and schedule a write afterwards."""
+        with self._lock:
+            if self._data is None:
+                self._data = {}
+            yield self._data
+            self._mark_dirty()
+
+    def replace(self, data):
+        """Replace the whole document and schedule a write."""
+        with self._lock:
+            self._data = copy.deepcopy(data)
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        self._dirty = True
+        self._generation += 1
+        self.revision += 1
+        self._last_change = time.monotonic()
+        self._ensure_writer()
+        self._wakeup.set()
+
+    def _ensure_writer(self):
+        if self._writer is None or not self._writer.is_alive():
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+
+    def _writer_loop(self):
+        """Coalesce bursts of changes into a single write once they go idle."""
+        while self._running:
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+            while self._running:
+                with self._lock:
+                    idle_for = time.monotonic() - self._last_change
+                remaining = self.flush_delay - idle_for
+                if remaining <= 0 or self._stopping.wait(remaining):
+                    break
+
+            self.flush()
+
+    def flush(self):
+        """Write the document to disk now if it has unsaved changes.
+
+        Flushes are serialized, so a flush that snapshots later also writes
+        later and the newest document is the one left on disk.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty or self._data is None:
+                    return False
+                generation = self._generation
+                content = json.dumps(self._data, indent=4)
+
+            start = time.perf_counter()
+            try:
+                self._write_atomic(self.path, content)
+            except Exception as e:
+                print(f"Error writing settings to {self.path}: {e}")
+                return False
+
+            duration = time.perf_counter() - start
+            with self._lock:
+                self._signature = self.file_signature()
+                if self._generation == generation:
+                    self._dirty = False
+                self.save_count += 1
+                self.last_save_duration = duration
+                self.max_save_duration = max(self.max_save_duration, duration)
+
+        print(f"Settings saved to {self.path} in {duration * 1000:.1f} ms")
+        return True
+
+    def stop(self, timeout=5.0):
+        """Stop the writer thread, wait for it, then write any pending changes."""
+        self._running = False
+        self._stopping.set()
+        self._wakeup.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout)
+        self.flush()
+
+    @staticmethod
+    def _write_atomic(path, content):
+        """Write content to a temp file next to path, fsync it and rename it over path."""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(content)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,335 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from utils.settings_store import SettingsStore
+
+
+class DownloadCancelled(Exception):
+    """Raised when a download is cancelled. The partial file is kept for resuming."""
+
+
+class DownloadError(Exception):
+    """Raised when a download cannot be completed."""
+
+
+class Segment:
+    """A byte range of the download. ``end`` is None when the size is unknown."""
+
+    __slots__ = ("start", "end", "position")
+
+    def __init__(self, start, end, position=None):
+        self.start = start
+        self.end = end
+        self.position = start if position is None else position
+
+    @property
+    def done(self):
+        return self.end is not None and self.position >= self.end
+
+
+def file_sha256(path, block_size=1024 * 1024):
+    """Hash a file in blocks without reading it into memory."""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+class TransferRate:
+    """Smoothed throughput and time remaining, worked out on the download thread."""
+
+    SMOOTHING = 0.3
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.rate = None
+        self._last = None
+
+    def update(self, downloaded, total):
+        """Record progress and return ``(bytes_per_second, seconds_left)``; either may be None."""
+        now = self.clock()
+        if self._last is not None:
+            last_time, last_downloaded = self._last
+            if now > last_time:
+                rate = (downloaded - last_downloaded) / (now - last_time)
+                if self.rate is None:
+                    self.rate = rate
+                else:
+                    self.rate += self.SMOOTHING * (rate - self.rate)
+        self._last = (now, downloaded)
+
+        eta = None
+        if total and self.rate:
+            eta = max(total - downloaded, 0) / self.rate
+        return self.rate, eta
+
+
+class UpdateDownloader:
+    """Downloads an update into ``<path>.part`` and renames it when complete.
+
+    When the server accepts byte ranges, an interrupted download resumes from
+    where it stopped (the ranges are kept in ``<path>.part.json``) and large
+    files are fetched over several connections at once. Chunk sizes grow with
+    the connection's throughput. The SHA-256 is computed as the contiguous
+    start of the file fills in, so no separate pass over the file is needed.
+    ``progress_callback(downloaded, total)`` is called at most every
+    ``progress_interval`` seconds and once at the end; ``total`` may be None.
+    """
+
+    MIN_CHUNK_SIZE = 64 * 1024
+    MAX_CHUNK_SIZE = 4 * 1024 * 1024
+    CHUNK_TARGET_SECONDS = 0.1
+    PARALLEL_MIN_SIZE = 16 * 1024 * 1024
+    MAX_CONNECTIONS = 4
+    PROGRESS_INTERVAL = 0.1
+    STATE_SAVE_INTERVAL = 1.0
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, timeout=30, connections=MAX_CONNECTIONS, progress_interval=PROGRESS_INTERVAL):
+        self.timeout = timeout
+        self.connections = max(int(connections), 1)
+        self.progress_interval = progress_interval
+        self._lock = threading.Lock()
+        self._hash_lock = threading.Lock()
+
+    def download(self, url, path, progress_callback=None, cancellation_check=None):
+        """Download ``url`` to ``path`` and return the file's SHA-256 hex digest."""
+        part_path = path + ".part"
+        state_path = path + ".part.json"
+
+        download_url, size, etag, accepts_ranges = self._probe(url)
+
+        segments = None
+        if accepts_ranges and os.path.exists(part_path):
+            segments = self._load_state(state_path, url, size, etag)
+        if segments is None:
+            segments = self._plan_segments(size, accepts_ranges)
+            with open(part_path, "wb") as f:
+                if size:
+                    f.truncate(size)
+
+        self._segments = segments
+        self._size = size
+        self._sha256 = hashlib.sha256()
+        self._hashed = 0
+        self._downloaded = sum(segment.position - segment.start for segment in segments)
+        self._progress_callback = progress_callback
+        self._last_progress = 0.0
+        self._last_state_save = time.monotonic()
+        self._state = (state_path, url, size, etag)
+        self._stop = threading.Event()
+        self._cancellation_check = cancellation_check
+
+        with open(part_path, "rb") as reader:
+            self._reader = reader
+            self._advance_hash()
+            errors = self._run_segments(download_url, part_path, etag, accepts_ranges)
+            if errors:
+                if accepts_ranges:
+                    self._save_state(force=True)
+                raise errors[0]
+            self._advance_hash()
+
+        if size is not None and self._hashed != size:
+            raise DownloadError(f"Downloaded {self._hashed} of {size} bytes")
+
+        self._report_progress(force=True)
+        os.replace(part_path, path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return self._sha256.hexdigest()
+
+    def _probe(self, url):
+        """Follow redirects and read the size, ETag and range support of the file."""
+        import requests
+
+        response = requests.head(url, allow_redirects=True, timeout=self.timeout)
+        if response.status_code >= 400:
+            return url, None, None, False
+        length = response.headers.get("content-length")
+        size = int(length) if length and length.isdigit() else None
+        etag = response.headers.get("etag")
+        accepts_ranges = size is not None and response.headers.get("accept-ranges", "").lower() == "bytes"
+        return response.url, size, etag, accepts_ranges
+
+    def _plan_segments(self, size, accepts_ranges):
+        if not size:
+            return [Segment(0, size)]
+
+        count = 1
+        if accepts_ranges and size >= self.PARALLEL_MIN_SIZE:
+            count = self.connections
+        step = -(-size // count)
+        return [Segment(start, min(start + step, size)) for start in range(0, size, step)]
+
+    def _load_state(self, state_path, url, size, etag):
+        """Load saved ranges if they belong to the same file, otherwise None."""
+        try:
+            with open(state_path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if state.get("url") != url or state.get("size") != size or state.get("etag") != etag:
+            return None
+        try:
+            return [Segment(start, end, position) for start, end, position in state["segments"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _save_state(self, force=False):
+        """Write the ranges to ``<path>.part.json`` so the download can resume.
+
+        Connections call this concurrently, so the write happens under the
+        lock and goes through a temp file and rename; a crash never leaves a
+        half-written state file behind.
+        """
+        state_path, url, size, etag = self._state
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_state_save < self.STATE_SAVE_INTERVAL:
+                return
+            self._last_state_save = now
+
+            segments = [[s.start, s.end, s.position] for s in self._segments]
+            try:
+                SettingsStore._write_atomic(state_path, json.dumps(
+                    {"url": url, "size": size, "etag": etag, "segments": segments}
+                ))
+            except OSError as e:
+                print(f"Error saving download state: {e}")
+
+    def _run_segments(self, url, part_path, etag, accepts_ranges):
+        """Fetch every unfinished segment, one connection each. Returns the errors raised."""
+        errors = []
+
+        def fetch(segment):
+            try:
+                self._fetch_segment(url, segment, part_path, etag, accepts_ranges)
+            except Exception as e:
+                errors.append(e)
+                self._stop.set()
+
+        pending = [segment for segment in self._segments if not segment.done]
+        if len(pending) == 1:
+            fetch(pending[0])
+            return errors
+
+        threads = [threading.Thread(target=fetch, args=(segment,), daemon=True) for segment in pending]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return errors
+
+    def _fetch_segment(self, url, segment, part_path, etag, accepts_ranges):
+        import requests
+
+        headers = {}
+        if accepts_ranges:
+            end = "" if segment.end is None else segment.end - 1
+            headers["Range"] = f"bytes={segment.position}-{end}"
+            if etag:
+                headers["If-Range"] = etag
+
+        with requests.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            if segment.position != segment.start or len(self._segments) > 1:
+                if response.status_code != 206:
+                    raise DownloadError("Server did not honour the range request")
+
+            chunk_size = self.MIN_CHUNK_SIZE
+            with open(part_path, "r+b") as f:
+                f.seek(segment.position)
+                while segment.end is None or segment.position < segment.end:
+                    if self._stop.is_set():
+                        raise DownloadCancelled()
+                    if self._cancellation_check and self._cancellation_check():
+                        self._stop.set()
+                        raise DownloadCancelled()
+
+                    wanted = chunk_size
+                    if segment.end is not None:
+                        wanted = min(wanted, segment.end - segment.position)
+
+                    started = time.perf_counter()
+                    chunk = response.raw.read(wanted, decode_content=True)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    f.flush()
+
+                    self._chunk_written(segment, chunk)
+                    chunk_size = self._next_chunk_size(len(chunk), time.perf_counter() - started, chunk_size)
+
+        if segment.end is not None and segment.position < segment.end:
+            raise DownloadError("Connection closed before the download finished")
+
+    def _next_chunk_size(self, length, elapsed, current):
+        """Size the next read to take about CHUNK_TARGET_SECONDS at the current rate.
+
+        Progress is reported between reads, so a read is also kept within one
+        progress interval. The size at most doubles per read: the first reads
+        come out of the socket buffer and would otherwise look far faster
+        than the connection really is.
+        """
+        target = self.CHUNK_TARGET_SECONDS
+        if self.progress_interval:
+            target = min(target, self.progress_interval)
+        size = current * 2
+        if elapsed > 0:
+            size = min(size, int(length / elapsed * target))
+        return min(max(size, self.MIN_CHUNK_SIZE), self.MAX_CHUNK_SIZE)
+
+    def _chunk_written(self, segment, chunk):
+        with self._hash_lock:
+            if self._hashed == segment.position:
+                self._sha256.update(chunk)
+                self._hashed += len(chunk)
+        with self._lock:
+            segment.position += len(chunk)
+            self._downloaded += len(chunk)
+
+        self._advance_hash()
+        self._report_progress()
+        if self._size is not None:
+            self._save_state()
+
+    def _advance_hash(self):
+        """Hash bytes that other connections wrote ahead of the hashed prefix."""
+        with self._lock:
+            filled = 0
+            for segment in self._segments:
+                filled = segment.position
+                if not segment.done:
+                    break
+
+        with self._hash_lock:
+            if filled <= self._hashed:
+                return
+            self._reader.seek(self._hashed)
+            while self._hashed < filled:
+                block = self._reader.read(min(self.HASH_BLOCK_SIZE, filled - self._hashed))
+                if not block:
+                    break
+                self._sha256.update(block)
+                self._hashed += len(block)
+
+    def _report_progress(self, force=False):
+        if not self._progress_callback:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._last_progress < self.progress_interval:
+                return
+            self._last_progress = now
+            downloaded = self._downloaded
+
+        try:
+            self._progress_callback(downloaded, self._size)
+        except Exception as e:
+            print(f"Error reporting download progress: {e}")
@@ -0,0 +1,84 @@
+import math
+from functools import lru_cache
+
+LUT_SIZE = 1024
+
+CURVES = ("linear", "log", "custom")
+
+# Attenuation at the bottom of the log curve's travel, just above silence.
+LOG_RANGE_DB = 50.0
+
+
+def parse_points(text):
+    """Parse custom curve points like ``"0:0, 50:20, 100:100"`` into sorted (x, y) pairs.
+
+    Both coordinates are percentages. Malformed points are skipped and the
+    curve is held flat beyond its first and last point.
+    """
+    points = {}
+    for item in text.replace(",", " ").split():
+        try:
+            x, y = item.split(":")
+            x = min(max(float(x), 0.0), 100.0)
+            y = min(max(float(y), 0.0), 100.0)
+        except ValueError:
+            continue
+        points[x] = y
+
+    if not points:
+        return [(0.0, 0.0), (100.0, 100.0)]
+
+    points = sorted(points.items())
+    if points[0][0] > 0:
+        points.insert(0, (0.0, points[0][1]))
+    if points[-1][0] < 100:
+        points.append((100.0, points[-1][1]))
+    return points
+
+
+def _linear(position):
+    return position * 100.0
+
+
+def _log(position):
+    if position <= 0:
+        return 0.0
+    return 100.0 * math.pow(10.0, LOG_RANGE_DB * (position - 1.0) / 20.0)
+
+
+def _custom(points):
+    def evaluate(position):
+        x = position * 100.0
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            if x <= x1:
+                if x1 == x0:
+                    return y1
+                return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+        return points[-1][1]
+    return evaluate
+
+
+@lru_cache(maxsize=64)
+def get_table(curve="linear", points=""):
+    """Get the lookup table for a curve, mapping LUT positions to 0-100 levels.
+
+    Tables are built once per distinct curve and shared between channels.
+    """
+    if curve == "log":
+        function = _log
+    elif curve == "custom":
+        function = _custom(parse_points(points))
+    else:
+        function = _linear
+    return tuple(function(i / (LUT_SIZE - 1)) for i in range(LUT_SIZE))
+
+
+LINEAR_TABLE = get_table("linear")
+
+
+def lookup(table, level, invert=False):
+    """Map a 0-100 slider level through a curve table."""
+    index = int(level * (LUT_SIZE - 1) / 100 + 0.5)
+    if invert:
+        index = LUT_SIZE - 1 - index
+    return table[index]
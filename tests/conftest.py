@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point ConfigManager at a settings file under tmp_path with a fresh store."""
+    from utils.config_manager import ConfigManager
+
+    path = str(tmp_path / "Hushmix" / "settings.json")
+    monkeypatch.setattr(ConfigManager, "CONFIG_FILE", path)
+    monkeypatch.setattr(ConfigManager, "BACKUP_FILE", path + ".bak")
+    monkeypatch.setattr(ConfigManager, "_store", None)
+    monkeypatch.setattr(ConfigManager, "_loaded", None)
+    yield path
+    if ConfigManager._store is not None:
+        ConfigManager._store.stop()
@@ -0,0 +1,84 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from utils.instance_channel import InstanceChannel
+
+
+def test_on_exit_closes_the_instance_channel(tmp_path, monkeypatch, settings_file):
+    pytest.importorskip("customtkinter")
+    pytest.importorskip("pythoncom")
+    from gui.app import HushmixApp
+
+    channel = InstanceChannel(info_path=str(tmp_path / "instance.json"))
+    assert channel.acquire()
+    assert os.path.exists(channel.info_path)
+
+    app = HushmixApp.__new__(HushmixApp)
+    app.window_manager = SimpleNamespace(save_window_position=lambda: None, cleanup=lambda: None)
+    app.instance_channel = channel
+    app.root = None
+    exits = []
+    monkeypatch.setattr(os, "_exit", exits.append)
+
+    app.on_exit()
+
+    assert exits == [0]
+    assert not os.path.exists(channel.info_path)
+
+
+class EagerSerial:
+    """Delivers a frame from the constructor, as a mixer that connects at once would."""
+
+    def __init__(self, volume_callback, button_callback, connection_status_callback=None, idle_callback=None):
+        app = volume_callback.__self__.app
+        self.apps_at_first_frame = list(app.current_apps)
+        self.high_resolution = False
+        self.connecting = False
+        volume_callback([50] * len(app.current_apps))
+        button_callback([0] * 8)
+
+    def get_connection_status(self):
+        return True
+
+    def cleanup(self):
+        pass
+
+
+class IdleAudio:
+    def warm_up(self):
+        pass
+
+    def set_application_volume(self, app_name, level):
+        pass
+
+    def set_application_volumes(self, levels):
+        pass
+
+    def cleanup(self):
+        pass
+
+
+def test_serial_starts_after_settings_are_loaded(monkeypatch, settings_file):
+    ctk = pytest.importorskip("customtkinter")
+    pytest.importorskip("pythoncom")
+    import gui.app as app_module
+
+    os.makedirs(os.path.dirname(settings_file), exist_ok=True)
+    with open(settings_file, "w") as f:
+        f.write('{"current_profile": "Profile 1", "profiles": {"Profile 1": '
+                '{"schema_version": 2, "channels": [{"application": "game.exe"}, {"application": "chat.exe"}]}}}')
+    monkeypatch.setattr(app_module, "SerialController", EagerSerial)
+    monkeypatch.setattr(app_module, "AudioController", IdleAudio)
+    monkeypatch.setattr(app_module.HushmixApp, "UPDATER_START_DELAY_MS", 600000)
+    try:
+        root = ctk.CTk()
+    except Exception as e:
+        pytest.skip(f"no display: {e}")
+    root.withdraw()
+    try:
+        app = app_module.HushmixApp(root)
+        assert app.serial_controller.apps_at_first_frame == ["game.exe", "chat.exe"]
+    finally:
+        root.destroy()
@@ -0,0 +1,146 @@
+import json
+import os
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+from controllers.button_actions import ButtonActions
+from controllers.key_sequence import KEY_DOWN, RecordingInjector
+from controllers.profile_manager import ProfileManager
+
+BUTTONS = 32
+
+
+def write_profiles(path, profiles, current="Profile 1"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"current_profile": current, "profiles": {
+            name: {"schema_version": 2, "buttons": buttons} for name, buttons in profiles.items()
+        }}, f)
+
+
+def make_button_actions():
+    app = SimpleNamespace(
+        settings_manager=SimpleNamespace(settings_vars={}, get_setting=lambda key, default=None: default),
+        root=SimpleNamespace(after=lambda delay, func, *args: None),
+        current_apps=[],
+        current_mute_state=[],
+        muted_state=[],
+        previous_volumes=[],
+    )
+    app.button_actions = ButtonActions(app)
+    app.button_actions.key_injector = RecordingInjector()
+    app.profile_manager = ProfileManager(app)
+    return app
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_queued_action_uses_the_profile_active_at_the_press(settings_file):
+    write_profiles(settings_file, {
+        "Profile 1": [{"mute_enabled": False, "shortcut_enabled": True, "shortcut": "Ctrl+a"}],
+        "Profile 2": [{"mute_enabled": False, "shortcut_enabled": True, "shortcut": "Ctrl+b"}],
+    })
+    app = make_button_actions()
+    actions = app.button_actions
+    app.profile_manager.activate_profile("Profile 1")
+
+    release = threading.Event()
+    actions.executor.submit("shortcut", release.wait, 5)
+    actions.dispatch_press(0, 1)
+    app.profile_manager.activate_profile("Profile 2")
+    release.set()
+
+    injector = actions.key_injector
+    assert wait_for(lambda: len(injector.events) == 4)
+    assert [key for kind, key in injector.events if kind == KEY_DOWN] == ["ctrl", "a"]
+    actions.executor.stop()
+
+
+def test_inline_actions_get_the_pressed_profile(settings_file):
+    write_profiles(settings_file, {
+        "Profile 1": [{"mute_enabled": False, "profile_enabled": True, "profile_action": "Profile 3"}],
+    })
+    app = make_button_actions()
+    app.profile_manager.activate_profile("Profile 1")
+
+    app.button_actions.dispatch_press(0, 1)
+
+    assert app.profile_manager.active_profile.name == "Profile 3"
+    app.button_actions.executor.stop()
+
+
+def thirty_two_buttons():
+    """Every third button sends a media key, every third a shortcut, the rest are unbound."""
+    buttons = []
+    for i in range(BUTTONS):
+        if i % 3 == 0:
+            buttons.append({"mute_enabled": False, "media_enabled": True, "media_action": "Next Track"})
+        elif i % 3 == 1:
+            buttons.append({"mute_enabled": False, "shortcut_enabled": True, "shortcut": "Ctrl+Shift+m"})
+        else:
+            buttons.append({"mute_enabled": False})
+    return buttons
+
+
+def make_frames(count, seed=31):
+    """Frames of 32 button states where each button is tapped now and then."""
+    rng = random.Random(seed)
+    states = [0] * BUTTONS
+    frames = []
+    for _ in range(count):
+        states = [0 if state else int(rng.random() < 0.05) for state in states]
+        frames.append(list(states))
+    return frames
+
+
+def test_thirty_two_button_dispatch_cost(settings_file):
+    write_profiles(settings_file, {"Profile 1": thirty_two_buttons()})
+    app = make_button_actions()
+    actions = app.button_actions
+    app.profile_manager.activate_profile("Profile 1")
+    submitted = []
+    actions.executor.submit = lambda lane, func, *args: submitted.append((lane, args[0])) or True
+
+    frames = make_frames(5000)
+    started = time.perf_counter()
+    for frame in frames:
+        actions.handle_button_update(frame)
+    per_frame = (time.perf_counter() - started) / len(frames)
+
+    previous = [0] * BUTTONS
+    expected = []
+    for frame in frames:
+        for i, (current, last) in enumerate(zip(frame, previous)):
+            if current and not last and i % 3 != 2:
+                expected.append(("media" if i % 3 == 0 else "shortcut", i))
+        previous = frame
+
+    assert submitted == expected
+    assert per_frame < 0.0005
+
+
+def test_thirty_two_buttons_run_every_action_once(settings_file):
+    write_profiles(settings_file, {"Profile 1": thirty_two_buttons()})
+    app = make_button_actions()
+    actions = app.button_actions
+    app.profile_manager.activate_profile("Profile 1")
+    injector = actions.key_injector
+
+    for i in range(BUTTONS):
+        actions.handle_button_update([int(j == i) for j in range(BUTTONS)])
+        actions.handle_button_update([0] * BUTTONS)
+        assert wait_for(lambda: not any(actions.executor.get_pending().values()))
+
+    media = len(range(0, BUTTONS, 3))
+    shortcuts = len(range(1, BUTTONS, 3))
+    presses = media * 2 + shortcuts * 6
+    assert wait_for(lambda: len(injector.events) >= presses)
+    assert len(injector.events) == presses
+    actions.executor.stop()
@@ -0,0 +1,65 @@
+import json
+import os
+
+import utils.config_manager as config_manager
+from utils.config_manager import ConfigManager
+
+
+def write_settings(path, settings):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(settings, f)
+
+
+def count_migrations(monkeypatch):
+    calls = []
+    migrate = config_manager.migrate_profile_data
+
+    def counting(profile_data):
+        calls.append(profile_data)
+        return migrate(profile_data)
+
+    monkeypatch.setattr(config_manager, "migrate_profile_data", counting)
+    return calls
+
+
+def test_profiles_are_migrated_once_per_store_revision(settings_file, monkeypatch):
+    write_settings(settings_file, {
+        "current_profile": "Profile 1",
+        "profiles": {"Profile 1": {"applications": ["a.exe"], "mute_state": [True]}},
+    })
+    calls = count_migrations(monkeypatch)
+    profiles = len(ConfigManager.DEFAULT_PROFILES)
+
+    first = ConfigManager.load_settings()
+    for _ in range(100):
+        settings = ConfigManager.load_settings()
+
+    assert len(calls) == profiles
+    assert settings["profiles"] is first["profiles"]
+    assert settings["profiles"]["Profile 1"]["channels"] == [{"application": "a.exe", "muted": True}]
+
+    settings["current_profile"] = "changed by a caller"
+    assert ConfigManager.load_settings()["current_profile"] == "Profile 1"
+
+    ConfigManager.set_current_profile("Profile 2")
+    assert ConfigManager.load_settings()["current_profile"] == "Profile 2"
+    assert len(calls) == profiles * 2
+
+
+def test_external_file_change_is_migrated_again(settings_file, monkeypatch):
+    write_settings(settings_file, {"current_profile": "Profile 1", "profiles": {}})
+    calls = count_migrations(monkeypatch)
+    ConfigManager.load_settings()
+    ConfigManager.load_settings()
+    migrated = len(calls)
+
+    write_settings(settings_file, {
+        "current_profile": "Profile 3",
+        "profiles": {"Profile 3": {"applications": ["b.exe", "c.exe"]}},
+    })
+    settings = ConfigManager.load_settings()
+
+    assert len(calls) == migrated * 2
+    assert settings["current_profile"] == "Profile 3"
+    assert [c["application"] for c in settings["profiles"]["Profile 3"]["channels"]] == ["b.exe", "c.exe"]
@@ -0,0 +1,137 @@
+import hashlib
+import lzma
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils.delta_patch import COPY, COPY_ARGS, HEADER, MAGIC, PatchError, apply_patch, make_patch
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def make_builds(tmp_path, size=256 * 1024, seed=50):
+    rng = random.Random(seed)
+    old = bytearray(rng.getrandbits(8) for _ in range(size))
+    new = bytearray(old)
+    new[1000:1000] = b"inserted" * 100
+    del new[20000:24000]
+    new[60000:60100] = bytes(rng.getrandbits(8) for _ in range(100))
+    new += b"appended tail" * 50
+
+    old_path, new_path = tmp_path / "old.exe", tmp_path / "new.exe"
+    old_path.write_bytes(bytes(old))
+    new_path.write_bytes(bytes(new))
+    return str(old_path), str(new_path)
+
+
+def test_round_trip(tmp_path):
+    old, new = make_builds(tmp_path)
+    patch, out = str(tmp_path / "update.hmxdelta"), str(tmp_path / "out.exe")
+
+    make_patch(old, new, patch)
+    digest = apply_patch(old, patch, out)
+
+    with open(new, "rb") as f:
+        expected = f.read()
+    with open(out, "rb") as f:
+        assert f.read() == expected
+    assert digest == hashlib.sha256(expected).hexdigest()
+    assert os.path.getsize(patch) < len(expected) // 10
+
+
+@pytest.mark.parametrize("old_data, new_data", [
+    (b"", b""),
+    (b"", b"new build"),
+    (b"old build", b""),
+    (b"same" * 1000, b"same" * 1000),
+])
+def test_round_trip_edge_cases(tmp_path, old_data, new_data):
+    old, new = tmp_path / "old.exe", tmp_path / "new.exe"
+    old.write_bytes(old_data)
+    new.write_bytes(new_data)
+    patch, out = str(tmp_path / "update.hmxdelta"), tmp_path / "out.exe"
+
+    make_patch(str(old), str(new), patch)
+    apply_patch(str(old), patch, str(out))
+    assert out.read_bytes() == new_data
+
+
+def test_wrong_source_is_rejected(tmp_path):
+    old, new = make_builds(tmp_path)
+    patch = str(tmp_path / "update.hmxdelta")
+    make_patch(old, new, patch)
+
+    other = tmp_path / "other.exe"
+    data = bytearray(Path(old).read_bytes())
+    data[500] ^= 0xFF
+    other.write_bytes(bytes(data))
+
+    with pytest.raises(PatchError, match="different version"):
+        apply_patch(str(other), patch, str(tmp_path / "out.exe"))
+
+
+def test_truncated_patch_is_rejected(tmp_path):
+    old, new = make_builds(tmp_path)
+    patch = tmp_path / "update.hmxdelta"
+    make_patch(old, new, str(patch))
+    patch.write_bytes(patch.read_bytes()[:-40])
+
+    with pytest.raises(PatchError):
+        apply_patch(old, str(patch), str(tmp_path / "out.exe"))
+
+
+def test_garbage_patch_is_rejected(tmp_path):
+    old, _ = make_builds(tmp_path)
+    patch = tmp_path / "update.hmxdelta"
+    patch.write_bytes(b"not a patch at all")
+
+    with pytest.raises(PatchError):
+        apply_patch(old, str(patch), str(tmp_path / "out.exe"))
+
+
+def test_tampered_operation_is_rejected(tmp_path):
+    old, new = make_builds(tmp_path)
+    patch = tmp_path / "update.hmxdelta"
+    make_patch(old, new, str(patch))
+
+    raw = bytearray(lzma.decompress(patch.read_bytes()))
+    first_op = len(MAGIC) + HEADER.size
+    assert raw[first_op] == COPY
+    offset, length = COPY_ARGS.unpack_from(raw, first_op + 1)
+    COPY_ARGS.pack_into(raw, first_op + 1, offset + 1, length)
+    patch.write_bytes(lzma.compress(bytes(raw)))
+
+    with pytest.raises(PatchError, match="does not match"):
+        apply_patch(old, str(patch), str(tmp_path / "out.exe"))
+
+
+def test_command_line_make(tmp_path):
+    old, new = make_builds(tmp_path)
+    patch, out = str(tmp_path / "update.hmxdelta"), str(tmp_path / "out.exe")
+
+    result = subprocess.run(
+        [sys.executable, "-m", "utils.delta_patch", "make", old, new, patch],
+        cwd=SRC, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Wrote" in result.stdout
+
+    apply_patch(old, patch, out)
+    assert Path(out).read_bytes() == Path(new).read_bytes()
+
+
+def test_command_line_reports_wrong_source(tmp_path):
+    old, new = make_builds(tmp_path)
+    patch = str(tmp_path / "update.hmxdelta")
+    make_patch(old, new, patch)
+
+    result = subprocess.run(
+        [sys.executable, "-m", "utils.delta_patch", "apply", new, patch, str(tmp_path / "out.exe")],
+        cwd=SRC, capture_output=True, text=True,
+    )
+    assert result.returncode == 1
+    assert "different version" in result.stdout
@@ -0,0 +1,70 @@
+import threading
+
+from controllers.fade_engine import FadeEngine
+
+
+class BlockingAudioController:
+    """Records writes; the first batched write blocks until released."""
+
+    def __init__(self):
+        self.writes = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def set_application_volumes(self, levels):
+        if not self.entered.is_set():
+            self.entered.set()
+            self.release.wait(5)
+        self.writes.append(dict(levels))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fade_levels_interpolate_and_finish():
+    audio = BlockingAudioController()
+    audio.entered.set()
+    clock = FakeClock()
+    engine = FadeEngine(audio, clock=clock)
+    engine._thread = threading.current_thread()
+    done = []
+    engine.start(0, "Spotify", 0, 100, 1.0, done.append)
+
+    clock.now = 0.5
+    assert engine.tick() is True
+    clock.now = 1.0
+    assert engine.tick() is False
+    assert audio.writes == [{"Spotify": 50.0}, {"Spotify": 100}]
+    assert done == [100]
+
+
+def test_cancelled_fade_does_not_overwrite_direct_write():
+    audio = BlockingAudioController()
+    clock = FakeClock()
+    engine = FadeEngine(audio, clock=clock)
+    engine._thread = threading.current_thread()
+    engine.start(0, "Spotify", 0, 100, 1.0)
+    clock.now = 0.5
+
+    ticker = threading.Thread(target=engine.tick)
+    ticker.start()
+    assert audio.entered.wait(5)
+
+    def move_slider():
+        engine.cancel(0)
+        audio.set_application_volumes({"Spotify": 20})
+
+    slider = threading.Thread(target=move_slider)
+    slider.start()
+    slider.join(0.1)
+    audio.release.set()
+    ticker.join(5)
+    slider.join(5)
+
+    assert audio.writes[-1] == {"Spotify": 20}
+    assert engine.target(0) is None
@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.gesture_engine import CLICK, DOUBLE_CLICK, HOLD, GestureEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now = round(self.now + seconds, 6)
+
+
+def make_engine(**options):
+    clock = FakeClock()
+    presses = []
+    chords = []
+    engine = GestureEngine(
+        lambda index, code: presses.append((index, code, round(clock.now, 3))),
+        on_chord=chords.append,
+        clock=clock,
+        **options,
+    )
+    return engine, clock, presses, chords
+
+
+def press(engine, clock, levels, seconds):
+    """Feed a frame, then let ``seconds`` pass with the engine polled every 10 ms."""
+    engine.feed(levels)
+    for _ in range(round(seconds / 0.01)):
+        clock.advance(0.01)
+        engine.poll()
+
+
+def test_click_fires_after_the_double_click_window():
+    engine, clock, presses, _ = make_engine(double_click_window=0.3)
+    press(engine, clock, [1, 0], 0.05)
+    press(engine, clock, [0, 0], 0.29)
+    assert presses == []
+    press(engine, clock, [0, 0], 0.02)
+    assert presses == [(0, CLICK, 0.36)]
+
+
+def test_click_fires_on_release_without_a_double_click_binding():
+    engine, clock, presses, _ = make_engine(wants_double_click=lambda index: False)
+    press(engine, clock, [1], 0.05)
+    press(engine, clock, [0], 0.0)
+    assert presses == [(0, CLICK, 0.05)]
+
+
+def test_double_click():
+    engine, clock, presses, _ = make_engine(double_click_window=0.3)
+    press(engine, clock, [1], 0.05)
+    press(engine, clock, [0], 0.1)
+    press(engine, clock, [1], 0.05)
+    press(engine, clock, [0], 1.0)
+    assert presses == [(0, DOUBLE_CLICK, 0.15)]
+
+
+def test_second_press_after_the_window_is_two_clicks():
+    engine, clock, presses, _ = make_engine(double_click_window=0.3)
+    press(engine, clock, [1], 0.05)
+    press(engine, clock, [0], 0.4)
+    press(engine, clock, [1], 0.05)
+    press(engine, clock, [0], 0.4)
+    assert [code for _, code, _ in presses] == [CLICK, CLICK]
+
+
+def test_hold_fires_while_held_without_new_frames():
+    engine, clock, presses, _ = make_engine(hold_time=0.5)
+    press(engine, clock, [1], 0.49)
+    assert presses == []
+    press(engine, clock, [1], 0.02)
+    assert presses == [(0, HOLD, 0.5)]
+    press(engine, clock, [0], 1.0)
+    assert presses == [(0, HOLD, 0.5)]
+
+
+def test_hold_repeats():
+    engine, clock, presses, _ = make_engine(hold_time=0.5, repeat_interval=0.2)
+    press(engine, clock, [1], 1.0)
+    press(engine, clock, [0], 0.5)
+    assert presses == [(0, HOLD, 0.5), (0, HOLD, 0.7), (0, HOLD, 0.9)]
+
+
+def test_chord_is_reported_once():
+    engine, clock, presses, chords = make_engine(chord_window=0.05)
+    press(engine, clock, [1, 0, 0], 0.03)
+    press(engine, clock, [1, 0, 1], 1.0)
+    press(engine, clock, [0, 0, 0], 1.0)
+    assert chords == [(0, 2)]
+    assert presses == []
+
+
+def test_presses_outside_the_chord_window_are_separate():
+    engine, clock, presses, chords = make_engine(chord_window=0.05, hold_time=5)
+    press(engine, clock, [1, 0], 0.1)
+    press(engine, clock, [1, 1], 0.1)
+    press(engine, clock, [0, 0], 1.0)
+    assert chords == []
+    assert sorted(code for _, code, _ in presses) == [CLICK, CLICK]
+
+
+def test_reset_forgets_pressed_buttons():
+    engine, clock, presses, _ = make_engine(hold_time=0.5)
+    press(engine, clock, [1], 0.1)
+    engine.reset()
+    press(engine, clock, [0], 1.0)
+    assert presses == []
+
+
+def test_serial_idle_branch_polls_gestures():
+    pytest.importorskip("serial")
+    pytest.importorskip("pythoncom")
+    from controllers.serial_controller import SerialController
+
+    engine, clock, presses, _ = make_engine(hold_time=0.5)
+    engine.feed([1])
+    clock.advance(0.6)
+
+    controller = SerialController.__new__(SerialController)
+    controller.running = True
+    controller.arduino = SimpleNamespace(in_waiting=0)
+    controller.initialize_serial = lambda: None
+
+    def idle():
+        engine.poll()
+        controller.running = False
+
+    controller.idle_callback = idle
+    controller.read_serial_data()
+    assert presses == [(0, HOLD, 0.6)]
@@ -0,0 +1,84 @@
+import json
+import socket
+
+import pytest
+
+from utils.instance_channel import InstanceChannel, connect, send_command
+
+
+@pytest.fixture
+def channel(tmp_path):
+    channel = InstanceChannel(info_path=str(tmp_path / "instance.json"))
+    assert channel.acquire()
+    channel.serve(lambda message: {"ok": True, "echo": message})
+    yield channel
+    channel.close()
+
+
+def open_raw(channel):
+    connection = socket.create_connection(("127.0.0.1", channel.port), timeout=2)
+    return connection, connection.makefile("rb")
+
+
+def test_command_round_trip(channel):
+    reply = send_command({"command": "show"}, info_path=channel.info_path)
+    assert reply == {"ok": True, "echo": {"command": "show"}}
+
+
+def test_info_file_holds_port_and_token(channel):
+    with open(channel.info_path) as f:
+        info = json.load(f)
+    assert info["port"] == channel.port
+    assert info["token"] == channel.token
+
+
+def test_second_instance_is_refused(channel):
+    assert not InstanceChannel(info_path=channel.info_path).acquire()
+
+
+def test_connection_without_token_is_dropped(channel):
+    connection, reader = open_raw(channel)
+    with connection:
+        connection.sendall(b'{"command": "mute", "channel": 0}\n')
+        assert reader.readline() == b""
+
+
+def test_wrong_token_is_dropped(channel):
+    connection, reader = open_raw(channel)
+    with connection:
+        connection.sendall(json.dumps({"token": "0" * 32}).encode() + b"\n")
+        assert reader.readline() == b""
+
+
+def test_browser_request_is_dropped(channel):
+    connection, reader = open_raw(channel)
+    with connection:
+        connection.sendall(
+            b"POST / HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: text/plain\r\n\r\n"
+            b'{"command": "mute", "channel": 0}\n'
+        )
+        assert reader.readline() == b""
+
+
+def test_invalid_json_after_handshake_drops_connection(tmp_path):
+    received = []
+    channel = InstanceChannel(info_path=str(tmp_path / "instance.json"))
+    assert channel.acquire()
+    channel.serve(lambda message: received.append(message) or {"ok": True})
+    try:
+        connection = connect(channel.info_path)
+        assert connection is not None
+        with connection, connection.makefile("rb") as reader:
+            connection.sendall(b'not json\n{"command": "show"}\n')
+            assert reader.readline() == b""
+        assert received == []
+    finally:
+        channel.close()
+
+
+def test_close_removes_info_file(tmp_path):
+    channel = InstanceChannel(info_path=str(tmp_path / "instance.json"))
+    assert channel.acquire()
+    channel.close()
+    assert not (tmp_path / "instance.json").exists()
+    assert send_command({"command": "show"}, info_path=channel.info_path) is None
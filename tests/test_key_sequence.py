@@ -0,0 +1,82 @@
+import pytest
+
+from controllers.key_sequence import (
+    KEY_DOWN,
+    KEY_UP,
+    KeySequence,
+    RecordingInjector,
+    chord_events,
+    parse_chord,
+)
+
+
+@pytest.mark.parametrize("chord, keys", [
+    ("Ctrl+c", ["ctrl", "c"]),
+    ("Ctrl+Shift+Escape", ["ctrl", "shift", "esc"]),
+    ("Win+d", ["win", "d"]),
+    ("F5", ["f5"]),
+    ("+", ["+"]),
+    ("Ctrl++", ["ctrl", "+"]),
+    ("Alt+PageDown", ["alt", "pagedown"]),
+])
+def test_parse_chord(chord, keys):
+    assert parse_chord(chord) == keys
+
+
+def test_modifiers_are_held_while_keys_are_tapped():
+    assert chord_events(["ctrl", "shift", "a", "b"]) == [
+        (KEY_DOWN, "ctrl"), (KEY_DOWN, "shift"),
+        (KEY_DOWN, "a"), (KEY_UP, "a"),
+        (KEY_DOWN, "b"), (KEY_UP, "b"),
+        (KEY_UP, "shift"), (KEY_UP, "ctrl"),
+    ]
+
+
+def test_chord_without_modifiers_is_pressed_together():
+    assert chord_events(["a", "b"]) == [(KEY_DOWN, "a"), (KEY_DOWN, "b"), (KEY_UP, "b"), (KEY_UP, "a")]
+    assert chord_events(["ctrl"]) == [(KEY_DOWN, "ctrl"), (KEY_UP, "ctrl")]
+
+
+def test_multi_step_macro_plays_every_chord_in_order():
+    sequence = KeySequence.parse("Ctrl+a Ctrl+c Alt+Tab Ctrl+v")
+    injector = RecordingInjector()
+    sequence.play(injector, sleep=pytest.fail)
+
+    assert len(sequence.steps) == 4
+    assert injector.events == list(sequence.events)
+    assert injector.events == (
+        chord_events(["ctrl", "a"]) + chord_events(["ctrl", "c"])
+        + chord_events(["alt", "tab"]) + chord_events(["ctrl", "v"])
+    )
+
+
+def test_step_delay_is_only_applied_between_chords():
+    sequence = KeySequence.parse("Ctrl+Shift+s Enter", step_delay=0.05)
+    injector = RecordingInjector()
+    timeline = []
+
+    def sleep(seconds):
+        timeline.append(("sleep", seconds))
+
+    injector.key_down = lambda key: timeline.append((KEY_DOWN, key))
+    injector.key_up = lambda key: timeline.append((KEY_UP, key))
+    sequence.play(injector, sleep=sleep)
+
+    assert timeline == [
+        (KEY_DOWN, "ctrl"), (KEY_DOWN, "shift"), (KEY_DOWN, "s"), (KEY_UP, "s"),
+        (KEY_UP, "shift"), (KEY_UP, "ctrl"),
+        ("sleep", 0.05),
+        (KEY_DOWN, "enter"), (KEY_UP, "enter"),
+    ]
+
+
+def test_single_chord_never_sleeps():
+    injector = RecordingInjector()
+    KeySequence.parse("Ctrl+Alt+Delete", step_delay=1.0).play(injector, sleep=pytest.fail)
+    assert len(injector.events) == 6
+
+
+def test_recording_injector_press():
+    injector = RecordingInjector()
+    injector.press("playpause")
+    assert injector.events == [(KEY_DOWN, "playpause"), (KEY_UP, "playpause")]
@@ -0,0 +1,91 @@
+import threading
+import time
+
+from controllers.level_publisher import LevelPublisher
+
+CHANNELS = 7
+FRAMES = 2000
+
+
+def consume(subscription, received, delay=0.0):
+    """Keep the newest value per channel until the subscription is closed."""
+    while True:
+        changes = subscription.take(timeout=0.1)
+        for change in changes:
+            received[change["channel"]] = change
+        received["batches"] = received.get("batches", 0) + (1 if changes else 0)
+        received["largest_batch"] = max(received.get("largest_batch", 0), len(changes))
+        if subscription.closed and not changes:
+            return
+        if delay:
+            time.sleep(delay)
+
+
+def test_fifty_subscribers_with_one_slow_consumer():
+    publisher = LevelPublisher()
+    subscriptions = [publisher.subscribe() for _ in range(50)]
+    received = [{} for _ in subscriptions]
+    consumers = [
+        threading.Thread(
+            target=consume,
+            args=(subscription, received[i], 0.25 if i == 0 else 0.0),
+            daemon=True,
+        )
+        for i, subscription in enumerate(subscriptions)
+    ]
+    for consumer in consumers:
+        consumer.start()
+
+    slowest_publish = 0.0
+    started = time.perf_counter()
+    for frame in range(FRAMES):
+        for channel in range(CHANNELS):
+            before = time.perf_counter()
+            publisher.publish_level(channel, frame % 101 + channel, False)
+            slowest_publish = max(slowest_publish, time.perf_counter() - before)
+    for channel in range(CHANNELS):
+        publisher.publish_level(channel, 500 + channel, False)
+    publishing = time.perf_counter() - started
+
+    time.sleep(0.5)
+    for subscription in subscriptions:
+        publisher.unsubscribe(subscription)
+    for consumer in consumers:
+        consumer.join(5)
+        assert not consumer.is_alive()
+
+    # The slow consumer never holds up the publisher.
+    assert publishing < 5.0
+    assert slowest_publish < 0.1
+
+    for values in received:
+        assert [values[channel]["level"] for channel in range(CHANNELS)] == [
+            500 + channel for channel in range(CHANNELS)
+        ]
+        assert values["largest_batch"] <= CHANNELS
+
+    slow = subscriptions[0]
+    assert received[0]["batches"] < 40
+    assert slow.coalesced > FRAMES * CHANNELS // 2
+    assert publisher._subscriptions == set()
+
+
+def test_repeated_values_are_not_offered():
+    publisher = LevelPublisher()
+    subscription = publisher.subscribe()
+    for _ in range(100):
+        publisher.publish_level(0, 40, False)
+    assert subscription.take(timeout=0) == [{"channel": 0, "level": 40, "muted": False}]
+    assert subscription.coalesced == 0
+    assert subscription.take(timeout=0) == []
+
+
+def test_take_returns_on_close():
+    publisher = LevelPublisher()
+    subscription = publisher.subscribe()
+    closer = threading.Timer(0.05, publisher.unsubscribe, args=(subscription,))
+    closer.start()
+    started = time.perf_counter()
+    assert subscription.take(timeout=5) == []
+    assert time.perf_counter() - started < 1
+    assert subscription.closed
@@ -0,0 +1,126 @@
+import json
+import os
+from types import SimpleNamespace
+
+from controllers.profile_manager import ProfileManager
+from controllers.volume_manager import VolumeManager
+from utils.config_manager import ConfigManager
+
+
+class CountingLauncher:
+    def __init__(self):
+        self.prepared = 0
+
+    def prepare(self, paths):
+        self.prepared += 1
+
+
+def make_app():
+    return SimpleNamespace(
+        settings_manager=SimpleNamespace(settings_vars={}),
+        button_actions=SimpleNamespace(launcher=CountingLauncher()),
+        current_apps=[],
+        current_mute_state=[],
+        muted_state=[],
+        previous_volumes=[],
+        root=SimpleNamespace(after=lambda delay, func, *args: None),
+    )
+
+
+def write_settings(path, settings):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(settings, f)
+
+
+def stored_profile(name):
+    return ConfigManager.get_store().get_data()["profiles"][name]
+
+
+def test_mute_toggle_edits_only_the_muted_flags(settings_file):
+    write_settings(settings_file, {
+        "current_profile": "Games",
+        "profiles": {"Games": {
+            "schema_version": 2,
+            "channels": [
+                {"application": "game.exe", "curve": "log", "extra": "kept"},
+                {"application": "discord.exe", "muted": True},
+            ],
+            "buttons": [{"shortcut_enabled": True, "shortcut": "ctrl+m"}],
+        }},
+    })
+    app = make_app()
+    manager = ProfileManager(app)
+    manager.activate_profile("Games")
+    compiled = manager.active
+    prepared = app.button_actions.launcher.prepared
+
+    app.current_mute_state = [True, False]
+    manager.save_mute_state()
+
+    assert app.button_actions.launcher.prepared == prepared
+    assert manager.active.dispatch is compiled.dispatch
+    assert manager.active.shortcuts is compiled.shortcuts
+    assert manager.active.mute_state == (True, False)
+    assert manager.get_profile("Games").mute_state == (True, False)
+    assert manager.compiled["Games"] is manager.active
+    assert stored_profile("Games")["channels"] == [
+        {"application": "game.exe", "curve": "log", "extra": "kept", "muted": True},
+        {"application": "discord.exe", "muted": False},
+    ]
+
+    ConfigManager.get_store().flush()
+    with open(settings_file) as f:
+        assert [channel["muted"] for channel in json.load(f)["profiles"]["Games"]["channels"]] == [True, False]
+
+
+def test_mute_toggle_migrates_a_legacy_profile(settings_file):
+    write_settings(settings_file, {
+        "current_profile": "Profile 1",
+        "profiles": {"Profile 1": {"applications": ["a.exe", "b.exe"], "mute_state": [False, False]}},
+    })
+    app = make_app()
+    manager = ProfileManager(app)
+    manager.activate_profile("Profile 1")
+
+    app.current_mute_state = [False, True]
+    manager.save_mute_state()
+
+    stored = stored_profile("Profile 1")
+    assert stored["schema_version"] == 2
+    assert stored["channels"] == [
+        {"application": "a.exe", "muted": False},
+        {"application": "b.exe", "muted": True},
+    ]
+
+
+def test_profile_switch_does_no_file_io_and_stays_under_a_millisecond(settings_file, capsys):
+    write_settings(settings_file, {
+        "current_profile": "Profile 1",
+        "profiles": {
+            name: {"schema_version": 2, "channels": [{"application": f"app{i}.exe"} for i in range(7)]}
+            for name in ConfigManager.DEFAULT_PROFILES
+        },
+    })
+    app = make_app()
+    app.audio_controller = None
+    app.volume_manager = VolumeManager(app)
+    manager = ProfileManager(app)
+    manager.activate_profile("Profile 1")
+    capsys.readouterr()
+
+    def no_disk(*args):
+        raise AssertionError("profile switch touched the settings file")
+
+    store = ConfigManager.get_store()
+    store.file_signature = no_disk
+    durations = []
+    for i in range(2000):
+        manager.switch_from_button(ProfileManager.NEXT_PROFILE)
+        durations.append(manager.last_switch_duration)
+    del store.file_signature
+
+    durations.sort()
+    assert capsys.readouterr().out.count("Switched") == 0
+    assert durations[1000] < 0.001
+    assert ConfigManager.load_settings()["current_profile"] == manager.active_profile.name
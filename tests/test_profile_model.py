@@ -0,0 +1,106 @@
+import pytest
+
+from utils.profile_model import (
+    LEGACY_BUTTON_FIELDS,
+    SCHEMA_VERSION,
+    ButtonConfig,
+    ChannelConfig,
+    Profile,
+    migrate_profile_data,
+)
+
+
+def test_legacy_parallel_lists_become_channels_and_buttons():
+    migrated = migrate_profile_data({
+        "applications": ["game.exe", "discord.exe", "mic"],
+        "mute_state": [False, True, False],
+        "mute_settings": [True, False],
+        "keyboard_shortcut_enabled": [False, True],
+        "keyboard_shortcuts": ["", "Ctrl+m"],
+        "shortcut_button_modes": ["Click", "Hold"],
+        "app_launch_paths": ["C:\\Games\\game.exe"],
+    })
+
+    assert migrated["schema_version"] == SCHEMA_VERSION
+    assert migrated["channels"] == [
+        {"application": "game.exe", "muted": False},
+        {"application": "discord.exe", "muted": True},
+        {"application": "mic", "muted": False},
+    ]
+    assert migrated["buttons"] == [
+        {"mute_enabled": True, "shortcut_enabled": False, "shortcut": "",
+         "shortcut_mode": "Click", "app_launch_path": "C:\\Games\\game.exe"},
+        {"mute_enabled": False, "shortcut_enabled": True, "shortcut": "Ctrl+m", "shortcut_mode": "Hold"},
+    ]
+
+
+def test_short_mute_list_leaves_the_rest_unmuted():
+    migrated = migrate_profile_data({"applications": ["a", "b", "c"], "mute_state": [True]})
+    assert [channel["muted"] for channel in migrated["channels"]] == [True, False, False]
+
+
+@pytest.mark.parametrize("data", [None, {}, {"applications": None, "mute_state": None}])
+def test_missing_lists_give_an_empty_profile(data):
+    assert migrate_profile_data(data) == {"schema_version": SCHEMA_VERSION, "channels": [], "buttons": []}
+
+
+def test_button_count_follows_the_longest_legacy_list():
+    migrated = migrate_profile_data({"media_control_actions": ["Play/Pause", "", "Next Track"]})
+    assert len(migrated["buttons"]) == 3
+    assert migrated["buttons"][2] == {"media_action": "Next Track"}
+    assert Profile.from_dict("p", migrated).button(1) == ButtonConfig(media_action="")
+
+
+def test_every_legacy_button_field_maps_to_a_button_setting():
+    assert set(LEGACY_BUTTON_FIELDS.values()) <= set(ButtonConfig.DEFAULTS)
+    data = {legacy: [f"value {legacy}"] for legacy in LEGACY_BUTTON_FIELDS}
+    button = migrate_profile_data(data)["buttons"][0]
+    assert button == {field: f"value {legacy}" for legacy, field in LEGACY_BUTTON_FIELDS.items()}
+
+
+def test_unknown_legacy_keys_are_dropped():
+    migrated = migrate_profile_data({"applications": ["a"], "volume_curve": "log", "theme": "dark"})
+    assert set(migrated) == {"schema_version", "channels", "buttons"}
+
+
+def test_current_schema_is_left_alone():
+    data = {"schema_version": SCHEMA_VERSION, "channels": [{"application": "a"}], "extra": 1}
+    migrated = migrate_profile_data(data)
+    assert migrated == {**data, "buttons": []}
+    assert migrated is not data
+
+
+def test_unknown_fields_are_ignored_when_loading():
+    profile = Profile.from_dict("p", {
+        "schema_version": SCHEMA_VERSION,
+        "channels": [{"application": "a", "future_field": 1}],
+        "buttons": [{"shortcut": "Ctrl+c", "future_field": 2}],
+    })
+    assert profile.channels == (ChannelConfig(application="a"),)
+    assert profile.buttons == (ButtonConfig(shortcut="Ctrl+c"),)
+
+
+def test_legacy_profile_round_trips_through_the_current_schema():
+    legacy = {
+        "applications": ["game.exe", "discord.exe"],
+        "mute_state": [True],
+        "mute_button_modes": ["Hold", "Double Click"],
+        "media_control_enabled": [False, True],
+        "media_control_actions": ["Play/Pause", "Next Track"],
+    }
+    profile = Profile.from_dict("Games", legacy)
+
+    assert profile.applications == ("game.exe", "discord.exe")
+    assert profile.mute_state == (True, False)
+    assert profile.button(0).mute_mode == "Hold"
+    assert profile.button(1).media_enabled and profile.button(1).media_action == "Next Track"
+
+    data = profile.to_dict()
+    assert data["schema_version"] == SCHEMA_VERSION
+    assert len(data["channels"][0]) == len(ChannelConfig.DEFAULTS)
+    assert len(data["buttons"][0]) == len(ButtonConfig.DEFAULTS)
+
+    again = Profile.from_dict("Games", data)
+    assert again.channels == profile.channels
+    assert again.buttons == profile.buttons
+    assert again.to_dict() == data
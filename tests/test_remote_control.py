@@ -0,0 +1,182 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.action_executor import ActionExecutor
+from controllers.level_publisher import LevelPublisher
+from controllers.remote_control import RemoteControl
+from utils.diagnostics import Diagnostics
+from utils.instance_channel import InstanceChannel, connect
+
+
+class FakeVolumeManager:
+    def __init__(self):
+        self.publisher = LevelPublisher()
+        self.levels = []
+        self.muted = []
+
+    def set_channel_levels(self, levels):
+        self.levels.append(levels)
+
+    def set_mute(self, channel, muted=None):
+        self.muted.append((channel, muted))
+
+
+def make_remote_control():
+    app = SimpleNamespace(
+        current_apps=["Master", "Spotify"],
+        previous_volumes=[50, 20],
+        muted_state=[False, False],
+        volume_manager=FakeVolumeManager(),
+        profile_manager=SimpleNamespace(active_profile=SimpleNamespace(name="Default")),
+    )
+    return RemoteControl(app)
+
+
+def test_mute_goes_through_the_volume_manager():
+    remote = make_remote_control()
+    assert remote.handle_command({"command": "mute", "channel": 1}) == {"ok": True}
+    assert remote.handle_command({"command": "mute", "channel": 0, "muted": True}) == {"ok": True}
+    assert remote.app.volume_manager.muted == [(1, None), (0, True)]
+    assert remote.handle_command({"command": "mute", "channel": 5})["ok"] is False
+
+
+def test_read_commands_answer():
+    remote = make_remote_control()
+    assert remote.handle_command({"command": "get_levels"})["ok"] is True
+
+
+def test_idle_stream_sends_keepalives():
+    remote = make_remote_control()
+    remote.KEEPALIVE_SECONDS = 0.01
+    stream = remote.handle_command({"command": "subscribe"})
+    assert next(stream)["profile"] == "Default"
+    assert next(stream) == {"keepalive": True}
+    stream.close()
+    assert remote.app.volume_manager.publisher._subscriptions == set()
+
+
+def test_disconnected_subscriber_is_released(tmp_path):
+    remote = make_remote_control()
+    remote.KEEPALIVE_SECONDS = 0.02
+    publisher = remote.app.volume_manager.publisher
+    channel = InstanceChannel(info_path=str(tmp_path / "instance.json"))
+    assert channel.acquire()
+    channel.serve(remote.handle_command)
+    try:
+        connection = connect(channel.info_path)
+        with connection, connection.makefile("rb") as reader:
+            connection.sendall(json.dumps({"command": "subscribe"}).encode() + b"\n")
+            assert json.loads(reader.readline())["ok"] is True
+            assert len(publisher._subscriptions) == 1
+
+        deadline = time.monotonic() + 5
+        while publisher._subscriptions and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert publisher._subscriptions == set()
+    finally:
+        channel.close()
+
+
+def test_diagnostics_command_reports_profile_switch_latency():
+    Diagnostics.record_timing("profile_switch", 0.004)
+    reply = make_remote_control().handle_command({"command": "diagnostics"})
+    assert reply["ok"] is True
+    assert reply["report"]["timings"]["profile_switch"]["last_ms"] == pytest.approx(4.0)
+    assert "profile_switch: last 4.000 ms" in reply["text"]
+
+
+def test_diagnostics_command_reports_action_executor_metrics():
+    executor = ActionExecutor(max_pending=1)
+    remote = make_remote_control()
+    remote.app.button_actions = SimpleNamespace(executor=executor)
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_action():
+        started.set()
+        release.wait(5)
+
+    assert executor.submit("diag_test", slow_action)
+    assert started.wait(5)
+    assert executor.submit("diag_test", lambda: None)
+    assert not executor.submit("diag_test", lambda: None)
+
+    reply = remote.handle_command({"command": "diagnostics"})
+    assert reply["action_pending"]["diag_test"] == 1
+    assert reply["report"]["counters"]["action_dropped.diag_test"] >= 1
+    assert "action_pending.diag_test: 1" in reply["text"]
+
+    release.set()
+    executor.stop()
+    deadline = time.monotonic() + 5
+    while "action_total.diag_test" not in Diagnostics.get_report()["timings"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    timings = remote.handle_command({"command": "diagnostics"})["report"]["timings"]
+    assert timings["action_queue.diag_test"]["count"] >= 1
+    assert timings["action_run.diag_test"]["count"] >= 1
+    assert timings["action_total.diag_test"]["count"] >= 1
+
+
+class SlowVolumeManager(FakeVolumeManager):
+    """Takes 2 ms per audio write, like a batched COM call."""
+
+    def set_channel_levels(self, levels):
+        time.sleep(0.002)
+        super().set_channel_levels(levels)
+
+
+def test_flood_of_volume_requests_is_batched(tmp_path):
+    clients, requests = 4, 2500
+    remote = make_remote_control()
+    remote.app.volume_manager = SlowVolumeManager()
+    remote.app.current_apps = [f"app{i}.exe" for i in range(clients)]
+    channel = InstanceChannel(info_path=str(tmp_path / "instance.json"))
+    assert channel.acquire()
+    channel.serve(remote.handle_command)
+    replies = [0] * clients
+
+    def client(index):
+        connection = connect(channel.info_path)
+        lines = b"".join(
+            json.dumps({"command": "set_volume", "channel": index, "level": i % 101}).encode() + b"\n"
+            for i in range(requests)
+        )
+        sender = threading.Thread(target=connection.sendall, args=(lines,))
+        with connection, connection.makefile("rb") as reader:
+            sender.start()
+            for _ in range(requests):
+                replies[index] += json.loads(reader.readline())["ok"] is True
+            sender.join()
+
+    try:
+        threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        elapsed = time.perf_counter() - started
+    finally:
+        channel.close()
+
+    deadline = time.monotonic() + 5
+    while (remote._pending_levels or remote._levels_ready.is_set()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    total = clients * requests
+    batches = remote.app.volume_manager.levels
+    print(f"{total} requests in {elapsed:.2f} s ({total / elapsed:.0f}/s), {len(batches)} audio writes")
+    assert replies == [requests] * clients
+    assert total / elapsed > 1000
+    assert len(batches) < total / 10
+    final = {}
+    for batch in batches:
+        final.update(batch)
+    assert final == {index: float((requests - 1) % 101) for index in range(clients)}
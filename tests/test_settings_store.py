@@ -0,0 +1,210 @@
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from utils.settings_store import SettingsStore
+
+
+def wait_for_save(store, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while store.save_count < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def read_settings(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def toggle_mute(store, channel):
+    with store.edit() as settings:
+        muted = settings.setdefault("muted", [False] * 4)
+        muted[channel] = not muted[channel]
+
+
+def test_mute_hammer_is_written_once(tmp_path):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, flush_delay=0.2)
+    store.set_data({"muted": [False] * 4})
+
+    for i in range(1001):
+        toggle_mute(store, i % 4)
+
+    wait_for_save(store, 1)
+    time.sleep(0.3)
+    assert store.save_count == 1
+    assert read_settings(path)["muted"] == [True, False, False, False]
+
+
+def test_mute_hammer_from_several_threads_is_written_once(tmp_path):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, flush_delay=0.2)
+    store.set_data({"muted": [False] * 4})
+
+    threads = [
+        threading.Thread(target=lambda channel=channel: [toggle_mute(store, channel) for _ in range(250)])
+        for channel in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    wait_for_save(store, 1)
+    time.sleep(0.3)
+    assert store.save_count == 1
+    assert read_settings(path)["muted"] == [False] * 4
+
+
+def test_changes_after_a_save_are_written_again(tmp_path):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, flush_delay=0.05)
+    store.set_data({"muted": [False] * 4})
+
+    toggle_mute(store, 0)
+    wait_for_save(store, 1)
+    toggle_mute(store, 1)
+    wait_for_save(store, 2)
+
+    assert store.save_count == 2
+    assert read_settings(path)["muted"] == [True, True, False, False]
+
+
+def block_first_write(store):
+    """Make the store's first write wait until the returned event is set."""
+    entered, release = threading.Event(), threading.Event()
+    real_write = SettingsStore._write_atomic
+
+    def write(path, content):
+        if not entered.is_set():
+            entered.set()
+            release.wait(5)
+        real_write(path, content)
+
+    store._write_atomic = write
+    return entered, release
+
+
+def test_flush_waits_for_an_older_write_in_progress(tmp_path):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, flush_delay=0.01)
+    store.set_data({"volume": 0})
+    entered, release = block_first_write(store)
+
+    with store.edit() as settings:
+        settings["volume"] = 1
+    assert entered.wait(5)
+    with store.edit() as settings:
+        settings["volume"] = 2
+
+    flusher = threading.Thread(target=store.flush)
+    flusher.start()
+    time.sleep(0.1)
+    assert flusher.is_alive()
+
+    release.set()
+    flusher.join(5)
+    store.stop()
+    assert read_settings(path) == {"volume": 2}
+
+
+def test_stop_joins_the_writer_and_keeps_the_last_change(tmp_path):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, flush_delay=0.01)
+    store.set_data({"volume": 0})
+    entered, release = block_first_write(store)
+
+    with store.edit() as settings:
+        settings["volume"] = 1
+    assert entered.wait(5)
+    with store.edit() as settings:
+        settings["volume"] = 2
+
+    threading.Timer(0.1, release.set).start()
+    store.stop()
+
+    assert not store._writer.is_alive()
+    assert read_settings(path) == {"volume": 2}
+
+
+def test_stop_does_not_wait_out_the_flush_delay(tmp_path):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, flush_delay=10)
+    store.set_data({"volume": 0})
+    with store.edit() as settings:
+        settings["volume"] = 1
+
+    started = time.monotonic()
+    store.stop()
+
+    assert time.monotonic() - started < 1
+    assert not store._writer.is_alive()
+    assert read_settings(path) == {"volume": 1}
+    assert store.save_count == 1
+
+
+WRITER_SCRIPT = """
+import json, os, sys, time
+sys.path.insert(0, {src!r})
+from utils.settings_store import SettingsStore
+
+path, mode = sys.argv[1], sys.argv[2]
+if mode == "pause":
+    real_fsync = os.fsync
+    def paused_fsync(fd):
+        real_fsync(fd)
+        print("inside write", flush=True)
+        time.sleep(60)
+    os.fsync = paused_fsync
+    SettingsStore._write_atomic(path, json.dumps({{"volume": 2, "padding": "x" * 100000}}))
+else:
+    print("writing", flush=True)
+    i = 0
+    while True:
+        i += 1
+        SettingsStore._write_atomic(path, json.dumps({{"volume": i, "padding": "x" * 100000}}))
+"""
+
+
+def run_writer(path, mode):
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    return subprocess.Popen(
+        [sys.executable, "-c", WRITER_SCRIPT.format(src=src), path, mode],
+        stdout=subprocess.PIPE, text=True,
+    )
+
+
+def test_writer_killed_inside_write_leaves_previous_settings(tmp_path):
+    path = str(tmp_path / "settings.json")
+    SettingsStore._write_atomic(path, json.dumps({"volume": 1}))
+
+    writer = run_writer(path, "pause")
+    try:
+        assert writer.stdout.readline().strip() == "inside write"
+    finally:
+        writer.kill()
+        writer.wait()
+        writer.stdout.close()
+
+    assert read_settings(path) == {"volume": 1}
+
+
+def test_writer_killed_at_random_points_leaves_parseable_settings(tmp_path):
+    path = str(tmp_path / "settings.json")
+    SettingsStore._write_atomic(path, json.dumps({"volume": 0}))
+    rng = random.Random(26)
+
+    for _ in range(10):
+        writer = run_writer(path, "loop")
+        try:
+            assert writer.stdout.readline().strip() == "writing"
+            time.sleep(rng.uniform(0.0, 0.05))
+        finally:
+            writer.kill()
+            writer.wait()
+            writer.stdout.close()
+        assert "volume" in read_settings(path)
@@ -0,0 +1,92 @@
+import ast
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+DEFERRED = {"requests", "pefile", "pyautogui"}
+
+
+def module_path(name):
+    """The source file for a module under src, or None for third-party modules."""
+    base = os.path.join(SRC, *name.split("."))
+    for path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def top_level_imports(node):
+    """Import statements that run when the module is imported, skipping function bodies."""
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            yield child
+        elif not isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            yield from top_level_imports(child)
+
+
+def imported_names(module, path, node):
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    if node.level:
+        package = module.split(".")
+        if not path.endswith("__init__.py"):
+            package = package[:-1]
+        package = package[:len(package) - node.level + 1]
+        base = ".".join(package + ([node.module] if node.module else []))
+    else:
+        base = node.module
+    return [base] + [f"{base}.{alias.name}" for alias in node.names if module_path(f"{base}.{alias.name}")]
+
+
+def import_closure(module):
+    """Every module imported at module scope when importing the given src module."""
+    seen = set()
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        parts = name.split(".")
+        for i in range(1, len(parts) + 1):
+            parent = ".".join(parts[:i])
+            if parent in seen:
+                continue
+            seen.add(parent)
+            path = module_path(parent)
+            if path is None:
+                continue
+            with open(path, encoding="utf-8") as f:
+                tree = ast.parse(f.read(), path)
+            for node in top_level_imports(tree):
+                pending.extend(imported_names(parent, path, node))
+    return seen
+
+
+def test_app_module_scope_does_not_import_deferred_packages():
+    closure = import_closure("gui.app")
+    assert "controllers.volume_manager" in closure
+    assert "utils.config_manager" in closure
+    assert {name.split(".")[0] for name in closure} & DEFERRED == set()
+
+
+def test_walker_skips_function_bodies_only():
+    tree = ast.parse(
+        "import os\n"
+        "try:\n    import winreg\nexcept ImportError:\n    winreg = None\n"
+        "class Window:\n    import json\n    def show(self):\n        import requests\n"
+        "def check():\n    import pefile\n"
+    )
+    names = [alias.name for node in top_level_imports(tree) for alias in node.names]
+    assert names == ["os", "winreg", "json"]
+
+
+@pytest.mark.skipif(
+    any(importlib.util.find_spec(name) is None for name in ("customtkinter", "pythoncom")),
+    reason="needs customtkinter and pywin32",
+)
+def test_importing_app_leaves_deferred_packages_unloaded():
+    code = "import sys, gui.app; print(' '.join(sorted(set(sys.modules) & %r)))" % DEFERRED
+    result = subprocess.run([sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
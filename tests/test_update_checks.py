@@ -0,0 +1,141 @@
+import http.server
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+from utils import config_manager
+from utils.config_manager import ConfigManager
+from utils.enhanced_version_manager import EnhancedVersionManager
+from utils.settings_manager import SettingsManager
+
+
+class FakeRegistry:
+    """Stands in for utils.registry with a dict of (subkey, name) values."""
+
+    RUN_KEY = config_manager.registry.RUN_KEY
+
+    def __init__(self):
+        self.values = {}
+
+    def read_value(self, subkey, name):
+        try:
+            return self.values[subkey, name]
+        except KeyError:
+            raise FileNotFoundError(name)
+
+    def set_value(self, subkey, name, value):
+        self.values[subkey, name] = value
+
+    def delete_value(self, subkey, name):
+        try:
+            del self.values[subkey, name]
+        except KeyError:
+            raise FileNotFoundError(name)
+
+
+def make_settings_manager():
+    """A SettingsManager holding only the plain (non-Tk) updater settings."""
+    manager = SettingsManager.__new__(SettingsManager)
+    manager.settings_vars = {"update_check_cache": None, "exe_version_cache": None}
+    return manager
+
+
+def test_dict_settings_are_returned_as_stored():
+    manager = make_settings_manager()
+    cache = {"path": "Hushmix.exe", "mtime": 1.0, "size": 2, "version": "v1.0"}
+
+    manager.set_setting("exe_version_cache", cache)
+
+    assert manager.get_setting("exe_version_cache") == cache
+
+
+def test_repeated_update_checks_are_answered_with_304(settings_file):
+    pytest.importorskip("requests")
+    counts = {200: 0, 304: 0}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            if self.headers.get("If-None-Match") == '"r1"':
+                counts[304] += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps({"tag_name": "v9.9", "body": "notes"}).encode()
+            counts[200] += 1
+            self.send_response(200)
+            self.send_header("ETag", '"r1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        manager = EnhancedVersionManager.__new__(EnhancedVersionManager)
+        manager.settings_manager = make_settings_manager()
+        manager.update_sources = {"github": {
+            "api_url": f"http://127.0.0.1:{server.server_port}/latest",
+            "download_base": "https://example.invalid",
+        }}
+
+        results = [manager.get_update_info("github") for _ in range(5)]
+    finally:
+        server.shutdown()
+
+    assert [info["version"] for info in results] == ["v9.9"] * 5
+    assert counts == {200: 1, 304: 4}
+
+    assert ConfigManager.load_settings()["update_check_cache"][manager.update_sources["github"]["api_url"]]["etag"] == '"r1"'
+
+
+def test_exe_version_is_read_once_until_the_exe_changes(settings_file, tmp_path, monkeypatch):
+    exe = tmp_path / "Hushmix.exe"
+    exe.write_bytes(b"MZ v1")
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "executable", str(tmp_path / "python.exe"))
+
+    manager = EnhancedVersionManager.__new__(EnhancedVersionManager)
+    manager.settings_manager = make_settings_manager()
+    reads = []
+
+    def read_exe_version(path):
+        reads.append(path)
+        return f"v1.{len(reads)}"
+
+    manager.read_exe_version = read_exe_version
+
+    assert [manager.get_current_version_from_exe() for _ in range(3)] == ["v1.1"] * 3
+    assert reads == [str(exe)]
+    assert ConfigManager.load_settings()["exe_version_cache"]["version"] == "v1.1"
+
+    exe.write_bytes(b"MZ v2 is larger")
+    assert manager.get_current_version_from_exe() == "v1.2"
+    assert len(reads) == 2
+
+
+def test_auto_startup_goes_through_the_registry_adapter(monkeypatch):
+    registry = FakeRegistry()
+    monkeypatch.setattr(config_manager, "registry", registry)
+
+    assert not ConfigManager.is_auto_startup_enabled()
+    ConfigManager.toggle_auto_startup(True, "Hushmix", "C:\\Hushmix\\Hushmix.exe")
+    assert registry.values == {(registry.RUN_KEY, "Hushmix"): "C:\\Hushmix\\Hushmix.exe"}
+    assert ConfigManager.is_auto_startup_enabled()
+
+    ConfigManager.toggle_auto_startup(False)
+    ConfigManager.toggle_auto_startup(False)
+    assert registry.values == {}
+    assert not ConfigManager.is_auto_startup_enabled()
+
+
+def test_config_file_falls_back_without_appdata():
+    if os.getenv("APPDATA"):
+        assert ConfigManager.CONFIG_FILE.startswith(os.getenv("APPDATA"))
+    else:
+        assert ConfigManager.CONFIG_FILE == os.path.join(os.path.expanduser("~"), "Hushmix", "settings.json")
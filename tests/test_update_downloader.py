@@ -0,0 +1,80 @@
+import json
+import os
+import threading
+import time
+
+from utils.update_downloader import Segment, UpdateDownloader
+
+URL = "https://example.com/Hushmix.exe"
+SIZE = 64 * 1024 * 1024
+
+
+def make_downloader(tmp_path, segments):
+    downloader = UpdateDownloader()
+    downloader._segments = segments
+    downloader._state = (str(tmp_path / "Hushmix.exe.part.json"), URL, SIZE, '"v2"')
+    downloader._last_state_save = time.monotonic()
+    return downloader
+
+
+def test_concurrent_state_saves_are_never_torn(tmp_path):
+    step = SIZE // 4
+    segments = [Segment(start, start + step) for start in range(0, SIZE, step)]
+    downloader = make_downloader(tmp_path, segments)
+    state_path = downloader._state[0]
+    downloader._save_state(force=True)
+
+    stop = threading.Event()
+    errors = []
+
+    def read_state():
+        while not stop.is_set():
+            try:
+                with open(state_path) as f:
+                    json.load(f)
+            except ValueError as e:
+                errors.append(e)
+            except OSError:
+                pass
+
+    def connection(segment):
+        for _ in range(300):
+            with downloader._lock:
+                segment.position += 1024
+            downloader._save_state(force=True)
+
+    reader = threading.Thread(target=read_state)
+    reader.start()
+    writers = [threading.Thread(target=connection, args=(segment,)) for segment in segments]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    stop.set()
+    reader.join()
+
+    assert errors == []
+    with open(state_path) as f:
+        saved = json.load(f)["segments"]
+    assert saved == [[s.start, s.end, s.start + 300 * 1024] for s in segments]
+    assert os.listdir(tmp_path) == ["Hushmix.exe.part.json"]
+
+
+def test_saved_state_loads_back(tmp_path):
+    segments = [Segment(0, 100, 40), Segment(100, 200, 200)]
+    downloader = make_downloader(tmp_path, segments)
+    downloader._save_state(force=True)
+
+    state_path, url, size, etag = downloader._state
+    loaded = downloader._load_state(state_path, url, size, etag)
+    assert [(s.start, s.end, s.position) for s in loaded] == [(0, 100, 40), (100, 200, 200)]
+    assert downloader._load_state(state_path, url, size, '"v3"') is None
+
+
+def test_state_saves_are_throttled(tmp_path):
+    segments = [Segment(0, 100)]
+    downloader = make_downloader(tmp_path, segments)
+    downloader._save_state()
+    assert not os.path.exists(downloader._state[0])
+    downloader._save_state(force=True)
+    assert os.path.exists(downloader._state[0])
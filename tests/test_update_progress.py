@@ -0,0 +1,210 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from utils.enhanced_version_manager import EnhancedVersionManager
+from utils.progress_reporter import ProgressReporter, format_progress
+
+SIZE = 50 * 1024 * 1024
+REFRESH_RATE = EnhancedVersionManager.PROGRESS_REFRESH_RATE
+MB = 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def payload():
+    return os.urandom(MB) * 50
+
+
+class StubWindow:
+    """Records callbacks scheduled with ``after`` and runs them at once, like an idle Tk loop."""
+
+    def __init__(self, run=True):
+        self.run = run
+        self.scheduled = []
+        self._lock = threading.Lock()
+
+    def after(self, delay, func, *args):
+        with self._lock:
+            self.scheduled.append((func, args))
+        if self.run:
+            func(*args)
+
+    def run_pending(self):
+        with self._lock:
+            pending, self.scheduled = self.scheduled, []
+        for func, args in pending:
+            func(*args)
+
+
+class UpdateHandler(BaseHTTPRequestHandler):
+    payload = b""
+    piece_size = 64 * 1024
+    piece_delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def send_file_headers(self, status, start, end):
+        self.send_response(status)
+        self.send_header("Content-Length", str(end - start))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"v2"')
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{SIZE}")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.send_file_headers(200, 0, SIZE)
+
+    def do_GET(self):
+        start, end, status = 0, SIZE, 200
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) + 1 if match.group(2) else SIZE
+            status = 206
+        self.send_file_headers(status, start, end)
+        try:
+            for offset in range(start, end, self.piece_size):
+                self.wfile.write(self.payload[offset:min(offset + self.piece_size, end)])
+                if self.piece_delay:
+                    time.sleep(self.piece_delay)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def serve(payload, piece_delay):
+    handler = type("Handler", (UpdateHandler,), {"payload": payload, "piece_delay": piece_delay})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_version_manager(tmp_path):
+    version_manager = EnhancedVersionManager.__new__(EnhancedVersionManager)
+    version_manager.get_download_path = lambda *args: str(tmp_path / "Hushmix.exe")
+    version_manager.get_current_version_from_exe = lambda: "1.0.0"
+    return version_manager
+
+
+def download(tmp_path, payload, piece_delay):
+    """Download 50 MB through the version manager into a ProgressReporter on a stub window."""
+    server = serve(payload, piece_delay)
+    window = StubWindow()
+    shown = []
+    reporter = ProgressReporter(lambda func, *args: window.after(0, func, *args), lambda *args: shown.append(args))
+    version_manager = make_version_manager(tmp_path)
+
+    try:
+        started = time.monotonic()
+        path = version_manager.download_update(f"http://127.0.0.1:{server.server_port}/Hushmix.exe", reporter.report)
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert path == str(tmp_path / "Hushmix.exe")
+    assert version_manager.download_checksum == hashlib.sha256(payload).hexdigest()
+    assert shown[-1][0] == 1
+    assert shown[-1][1].startswith("100% - 50.0 of 50.0 MB")
+    assert len(shown) == len(window.scheduled)
+    return window, elapsed
+
+
+def test_slow_download_schedules_about_refresh_rate_callbacks(tmp_path, payload):
+    # Four connections each write 200 pieces of 64 KB, about 10 ms apart,
+    # so chunks arrive far more often than the refresh rate.
+    window, elapsed = download(tmp_path, payload, piece_delay=0.01)
+
+    expected = elapsed * REFRESH_RATE
+    print(f"{len(window.scheduled)} callbacks in {elapsed:.2f} s, {expected:.0f} at {REFRESH_RATE} Hz")
+    assert elapsed > 1.0
+    assert len(window.scheduled) <= expected + 2
+    assert len(window.scheduled) >= expected * 0.5
+
+
+def test_fast_download_never_exceeds_refresh_rate(tmp_path, payload):
+    # Progress is reported when a chunk lands. Read sizes grow to 4 MB on a
+    # fast connection, so there can be fewer reports than the refresh rate
+    # allows, but never more. Two callbacks per 8 KB chunk made this 12800.
+    window, elapsed = download(tmp_path, payload, piece_delay=0.0)
+
+    print(f"{len(window.scheduled)} callbacks in {elapsed:.2f} s")
+    assert 1 <= len(window.scheduled) <= elapsed * REFRESH_RATE + 2
+
+
+def test_busy_ui_thread_gets_one_queued_update_with_the_latest_values():
+    window = StubWindow(run=False)
+    shown = []
+    reporter = ProgressReporter(lambda func, *args: window.after(0, func, *args), lambda *args: shown.append(args))
+
+    for downloaded in range(0, 10 * MB + 1, MB):
+        reporter.report(downloaded, 10 * MB)
+    assert len(window.scheduled) == 1
+
+    window.run_pending()
+    assert shown == [(1, "100% - 10.0 of 10.0 MB")]
+
+    reporter.report(5 * MB, None)
+    window.run_pending()
+    assert shown[-1] == (0, "5.0 MB")
+
+
+def test_reports_stop_once_cancelled():
+    window = StubWindow()
+    shown = []
+    cancelled = []
+    reporter = ProgressReporter(
+        lambda func, *args: window.after(0, func, *args), lambda *args: shown.append(args), lambda: bool(cancelled)
+    )
+
+    reporter.report(MB, 4 * MB)
+    cancelled.append(True)
+    reporter.report(2 * MB, 4 * MB)
+
+    assert shown == [(0.25, "25% - 1.0 of 4.0 MB")]
+
+
+def test_format_progress():
+    assert format_progress(18 * MB, 40 * MB, 5.2 * MB, 4.4) == "45% - 18.0 of 40.0 MB - 5.2 MB/s - 4 s left"
+    assert format_progress(3 * MB, None, None, None) == "3.0 MB"
+    assert format_progress(0, 40 * MB, 0, None) == "0% - 0.0 of 40.0 MB"
+
+
+def test_progress_window_schedules_one_callback_per_report(tmp_path, payload):
+    pytest.importorskip("customtkinter")
+    pytest.importorskip("pythoncom")
+    from gui.update_progress_window import UpdateProgressWindow
+
+    server = serve(payload, 0.01)
+    url = f"http://127.0.0.1:{server.server_port}/Hushmix.exe"
+    version_manager = make_version_manager(tmp_path)
+    version_manager.verify_download = lambda *args: False
+
+    window = UpdateProgressWindow.__new__(UpdateProgressWindow)
+    window.window = StubWindow()
+    window.cancelled = False
+    window.version_manager = version_manager
+    window.update_info = {"download_url": url}
+    window.show_error = lambda message: None
+    window.status_label = SimpleNamespace(configure=lambda **kwargs: None)
+    shown = []
+    window.show_progress = lambda fraction, text: shown.append(fraction)
+
+    try:
+        started = time.monotonic()
+        window.download_update()
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert shown[-1] == 1
+    assert len(shown) <= elapsed * REFRESH_RATE + 3
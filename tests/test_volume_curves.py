@@ -0,0 +1,71 @@
+import pytest
+
+from utils.volume_curves import CURVES, LINEAR_TABLE, LOG_RANGE_DB, LUT_SIZE, get_table, lookup, parse_points
+
+CUSTOM_POINTS = "0:0, 50:20, 100:100"
+
+
+def table_for(curve):
+    return get_table(curve, CUSTOM_POINTS if curve == "custom" else "")
+
+
+@pytest.mark.parametrize("curve", CURVES)
+def test_table_size_and_endpoints(curve):
+    table = table_for(curve)
+    assert len(table) == LUT_SIZE
+    assert table[0] == 0
+    assert table[-1] == pytest.approx(100)
+    assert lookup(table, 0) == 0
+    assert lookup(table, 100) == pytest.approx(100)
+
+
+@pytest.mark.parametrize("curve", CURVES)
+def test_tables_rise_monotonically(curve):
+    table = table_for(curve)
+    assert all(a <= b for a, b in zip(table, table[1:]))
+
+
+@pytest.mark.parametrize("curve", CURVES)
+def test_inverted_lookup_runs_the_table_backwards(curve):
+    table = table_for(curve)
+    assert lookup(table, 0, invert=True) == pytest.approx(100)
+    assert lookup(table, 100, invert=True) == 0
+    assert lookup(table, 25, invert=True) == lookup(table, 75)
+
+
+def test_linear_midpoints():
+    assert LINEAR_TABLE is get_table("linear")
+    for level in (10, 25, 50, 90):
+        assert lookup(LINEAR_TABLE, level) == pytest.approx(level, abs=0.1)
+
+
+def test_log_curve_follows_its_decibel_range():
+    table = get_table("log")
+    assert lookup(table, 50) == pytest.approx(100 * 10 ** (-LOG_RANGE_DB / 40), rel=0.01)
+    assert table[1] == pytest.approx(100 * 10 ** (-LOG_RANGE_DB / 20), rel=0.01)
+    assert lookup(table, 50) < lookup(LINEAR_TABLE, 50)
+
+
+def test_custom_curve_interpolates_between_points():
+    table = get_table("custom", CUSTOM_POINTS)
+    assert lookup(table, 50) == pytest.approx(20, abs=0.2)
+    assert lookup(table, 25) == pytest.approx(10, abs=0.2)
+    assert lookup(table, 75) == pytest.approx(60, abs=0.2)
+
+
+def test_custom_points_are_held_flat_past_the_ends():
+    assert parse_points("20:10 80:90") == [(0.0, 10.0), (20.0, 10.0), (80.0, 90.0), (100.0, 90.0)]
+    table = get_table("custom", "20:10 80:90")
+    assert lookup(table, 0) == 10
+    assert lookup(table, 100) == 90
+
+
+def test_malformed_custom_points_fall_back_to_linear():
+    assert parse_points("nonsense 1:2:3") == [(0.0, 0.0), (100.0, 100.0)]
+    assert parse_points("150:-5") == [(0.0, 0.0), (100.0, 0.0)]
+    assert get_table("custom", "nonsense") == pytest.approx(LINEAR_TABLE)
+
+
+def test_unknown_curve_is_linear_and_tables_are_shared():
+    assert get_table("unknown") == LINEAR_TABLE
+    assert get_table("custom", CUSTOM_POINTS) is get_table("custom", CUSTOM_POINTS)
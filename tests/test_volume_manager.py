@@ -0,0 +1,209 @@
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from controllers.profile_manager import ProfileManager
+from controllers.remote_control import RemoteControl
+from controllers.volume_manager import VolumeManager
+from utils.config_manager import ConfigManager
+from utils.volume_curves import get_table, lookup
+
+
+class FakeAudio:
+    def __init__(self):
+        self.writes = []
+
+    def set_application_volume(self, app_name, level):
+        self.writes.append((app_name, level))
+
+    def set_application_volumes(self, levels):
+        self.writes.extend(levels.items())
+
+    def get_application_volume(self, app_name):
+        return None
+
+    def get_microphone_volume(self):
+        return 0
+
+
+class FakeSettings:
+    def __init__(self, **settings):
+        self.settings_vars = dict(settings)
+
+    def get_setting(self, key, default=None):
+        return self.settings_vars.get(key, default)
+
+
+def make_app(**settings):
+    """An app with real profile and volume managers on fake audio and GUI objects."""
+    app = SimpleNamespace(
+        audio_controller=FakeAudio(),
+        settings_manager=FakeSettings(**settings),
+        gui_components=SimpleNamespace(volume_labels=[]),
+        root=SimpleNamespace(after=lambda delay, func, *args: None),
+        current_apps=[],
+        current_mute_state=[],
+        muted_state=[],
+        previous_volumes=[],
+        button_vars=[],
+    )
+    app.volume_manager = VolumeManager(app)
+    app.profile_manager = ProfileManager(app)
+    app.toggle_mute = app.volume_manager.toggle_mute
+    return app
+
+
+def test_mute_on_an_empty_profile_is_saved(settings_file):
+    app = make_app()
+    app.profile_manager.activate_profile("Profile 1")
+    assert app.profile_manager.active_profile.channels == ()
+
+    app.volume_manager.toggle_mute(2)
+
+    channels = ConfigManager.load_settings()["profiles"]["Profile 1"]["channels"]
+    assert [channel["muted"] for channel in channels] == [False, False, True, False, False, False, False]
+
+    ConfigManager.get_store().stop()
+    with open(settings_file) as f:
+        assert json.load(f)["profiles"]["Profile 1"]["channels"][2]["muted"] is True
+
+    ConfigManager._store = None
+    reloaded = make_app()
+    reloaded.profile_manager.activate_profile("Profile 1")
+    assert reloaded.current_mute_state == [False, False, True, False, False, False, False]
+
+
+def make_log_curve_app(settings_file, **settings):
+    os.makedirs(os.path.dirname(settings_file), exist_ok=True)
+    with open(settings_file, "w") as f:
+        json.dump({"current_profile": "Profile 1", "profiles": {"Profile 1": {
+            "schema_version": 2,
+            "channels": [{"application": "game.exe", "curve": "log"}],
+        }}}, f)
+    app = make_app(**settings)
+    app.profile_manager.activate_profile("Profile 1")
+    return app
+
+
+@pytest.mark.parametrize("fade_duration_ms", [0, 50])
+def test_unmute_restores_the_curve_mapped_slider_level(settings_file, fade_duration_ms):
+    app = make_log_curve_app(settings_file, fade_duration_ms=fade_duration_ms)
+    expected = round(lookup(get_table("log"), 60) / 2) * 2
+    app.volume_manager.handle_volume_update([60])
+    assert app.audio_controller.writes[-1] == ("game.exe", expected)
+
+    app.volume_manager.fade_engine.cancel_all()
+    app.previous_volumes[0] = expected
+    app.volume_manager.toggle_mute(0)
+    app.volume_manager.fade_engine.cancel_all()
+    app.previous_volumes[0] = 0
+    app.volume_manager.toggle_mute(0)
+    deadline = time.monotonic() + 2
+    while app.volume_manager.fade_engine.target(0) is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert app.volume_manager.slider_levels[0] == expected
+    assert app.audio_controller.writes[-1][0] == "game.exe"
+    assert app.audio_controller.writes[-1][1] == pytest.approx(expected, abs=0.5)
+
+
+def test_mute_keeps_the_slider_level(settings_file):
+    app = make_log_curve_app(settings_file)
+    app.volume_manager.handle_volume_update([80])
+    level = app.volume_manager.slider_levels[0]
+
+    app.volume_manager.toggle_mute(0)
+    assert app.audio_controller.writes[-1] == ("game.exe", 0)
+    assert app.volume_manager.slider_levels[0] == level
+
+
+def make_linear_app(settings_file, high_resolution):
+    os.makedirs(os.path.dirname(settings_file), exist_ok=True)
+    with open(settings_file, "w") as f:
+        json.dump({"current_profile": "Profile 1", "profiles": {"Profile 1": {
+            "schema_version": 2,
+            "channels": [{"application": "game.exe"}],
+        }}}, f)
+    app = make_app(high_resolution_volume=high_resolution, fade_duration_ms=0)
+    app.profile_manager.activate_profile("Profile 1")
+    app.volume_manager.configure()
+    app.volume_manager.handle_volume_update([0.0])
+    app.audio_controller.writes.clear()
+    return app
+
+
+def test_high_resolution_keeps_fractional_levels(settings_file):
+    app = make_linear_app(settings_file, high_resolution=True)
+    for level in (37.26, 37.6, 81.35):
+        app.volume_manager.handle_volume_update([level])
+    assert app.audio_controller.writes == [("game.exe", 37.2), ("game.exe", 37.6), ("game.exe", 81.3)]
+
+
+def test_integer_path_uses_two_percent_steps(settings_file):
+    app = make_linear_app(settings_file, high_resolution=False)
+    for level in (30, 31, 33, 81):
+        app.volume_manager.handle_volume_update([level])
+    assert app.audio_controller.writes == [("game.exe", 30), ("game.exe", 34), ("game.exe", 82)]
+
+
+def test_high_resolution_suppresses_unchanged_levels(settings_file):
+    app = make_linear_app(settings_file, high_resolution=True)
+    for level in (50.01, 50.02, 50.03, 49.99, 50.04, 50.0):
+        app.volume_manager.handle_volume_update([level])
+    assert app.audio_controller.writes == [("game.exe", 50.0)]
+
+    app.volume_manager.handle_volume_update([50.2])
+    assert app.audio_controller.writes[-1] == ("game.exe", 50.2)
+
+
+def test_high_resolution_applies_the_curve_to_the_float_level(settings_file):
+    app = make_linear_app(settings_file, high_resolution=True)
+    app.profile_manager.set_channel_curve(0, "log")
+    app.volume_manager.handle_volume_update([62.5])
+    assert app.audio_controller.writes == [("game.exe", round(lookup(get_table("log"), 62.5), 1))]
+
+
+def test_serial_frames_keep_floats_in_high_resolution():
+    pytest.importorskip("serial")
+    pytest.importorskip("pythoncom")
+    from controllers.serial_controller import SerialController
+
+    frames = []
+    controller = SerialController.__new__(SerialController)
+    controller.volume_callback = frames.append
+    controller.volume_filters = []
+    controller.high_resolution = True
+    controller.process_volume_data("12.5|99.75|0")
+    controller.high_resolution = False
+    controller.process_volume_data("12.5|99.75|0")
+    assert frames == [[12.5, 99.75, 0.0], [12, 100, 0]]
+
+
+@pytest.mark.parametrize("mutes", [500, 501])
+def test_remote_mutes_and_serial_frames_do_not_race(settings_file, mutes):
+    app = make_linear_app(settings_file, high_resolution=False)
+    remote = RemoteControl(app)
+    stop = threading.Event()
+
+    def serial_thread():
+        while not stop.is_set():
+            app.volume_manager.handle_volume_update([60])
+
+    serial = threading.Thread(target=serial_thread)
+    serial.start()
+    try:
+        for _ in range(mutes):
+            assert remote.handle_command({"command": "mute", "channel": 0}) == {"ok": True}
+    finally:
+        stop.set()
+        serial.join()
+
+    muted = mutes % 2 == 1
+    assert app.muted_state == [muted]
+    assert app.current_mute_state[0] is muted
+    assert app.audio_controller.writes[-1] == ("game.exe", 0 if muted else 60)
+    assert ConfigManager.load_settings()["profiles"]["Profile 1"]["channels"][0]["muted"] is muted